@@ -0,0 +1,134 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .permissions import user_role
+
+
+# ======================================================
+# 🔐 Stateless JWT authentication
+# ======================================================
+# Tokens from /api/login/ carry the claims the API authorizes on (username,
+# role, staff and superuser flags), so a request is authenticated from the
+# verified token alone. Tokens without them (issued before the claims existed,
+# or by AccessToken.for_user) fall back to the user row, cached for
+# AUTH_CLAIMS_CACHE_SECONDS. Revocation is one cache read per request, in
+# this class and in RevocableJWTAuthentication alike: a per-token key written
+# on logout and a per-user millisecond timestamp written when the user's
+# password, flags or groups change. Tokens issued up to that millisecond are
+# rejected. Both live in the default cache, which has to be shared
+# (CACHE_URL); the core.E001 system check refuses a process-local one.
+
+# Issue time in milliseconds; iat has whole seconds only
+ISSUED_AT_MS_CLAIM = "iat_ms"
+
+
+def user_claims(user):
+    return {
+        "username": user.get_username(),
+        "role": user_role(user),
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+    }
+
+
+def add_claims(token, user):
+    for claim, value in user_claims(user).items():
+        token[claim] = value
+    token[ISSUED_AT_MS_CLAIM] = int(token.current_time.timestamp() * 1000)
+    return token
+
+
+def _claims_key(user_id):
+    return f"pims:auth:claims:{user_id}"
+
+
+def _revoked_user_key(user_id):
+    return f"pims:auth:revoked:{user_id}"
+
+
+def _revoked_token_key(jti):
+    return f"pims:auth:jti:{jti}"
+
+
+def cached_claims(user_id):
+    """Claims of an active user, read from the database at most once per AUTH_CLAIMS_CACHE_SECONDS; None if unknown."""
+    key = _claims_key(user_id)
+    claims = cache.get(key)
+    if claims is None:
+        user = get_user_model().objects.filter(pk=user_id, is_active=True).first()
+        claims = user_claims(user) if user else {}
+        cache.set(key, claims, settings.AUTH_CLAIMS_CACHE_SECONDS)
+    return claims or None
+
+
+def revoke_user(user_id):
+    """Reject every token issued to the user so far, until the longest-lived of them has expired."""
+    lifetime = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+    cache.set(_revoked_user_key(user_id), int(time.time() * 1000), int(lifetime.total_seconds()))
+    cache.delete(_claims_key(user_id))
+
+
+def revoke_token(token):
+    """Reject this one token (e.g. on logout) until it expires."""
+    remaining = int(token["exp"] - time.time())
+    if remaining > 0:
+        cache.set(_revoked_token_key(token[api_settings.JTI_CLAIM]), True, remaining)
+
+
+def issued_at_ms(token):
+    """When the token was issued, in milliseconds; the start of its iat second for tokens without ``iat_ms``."""
+    if ISSUED_AT_MS_CLAIM in token:
+        return token[ISSUED_AT_MS_CLAIM]
+    return token.get("iat", 0) * 1000
+
+
+def is_revoked(token):
+    keys = _revoked_user_key(token[api_settings.USER_ID_CLAIM]), _revoked_token_key(token[api_settings.JTI_CLAIM])
+    values = cache.get_many(keys)
+    if values.get(keys[1]):
+        return True
+    revoked_at = values.get(keys[0])
+    return revoked_at is not None and issued_at_ms(token) <= revoked_at
+
+
+class ClaimsUser(TokenUser):
+    """request.user built from the token claims."""
+
+    @cached_property
+    def role(self):
+        return self.token.get("role")
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    """Authenticates from the verified token and its claims without loading the user row."""
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token or api_settings.JTI_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        if is_revoked(validated_token):
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        if "username" not in validated_token:
+            claims = cached_claims(validated_token[api_settings.USER_ID_CLAIM])
+            if claims is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            for claim, value in claims.items():
+                validated_token[claim] = value
+        return ClaimsUser(validated_token)
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """simplejwt's user-row authentication, rejecting tokens revoked by logout or account changes."""
+
+    def get_user(self, validated_token):
+        if api_settings.JTI_CLAIM in validated_token and api_settings.USER_ID_CLAIM in validated_token:
+            if is_revoked(validated_token):
+                raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        return super().get_user(validated_token)
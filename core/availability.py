@@ -0,0 +1,84 @@
+import datetime
+from collections import defaultdict
+
+from django.db.models import Q
+
+from .models import Project, MemberAssigned
+
+ONE_DAY = datetime.timedelta(days=1)
+
+
+# ======================================================
+# 📅 Member availability
+# ======================================================
+# A member is busy on the days covered by their active assignments on
+# active/hot projects (the same rule as the engagement counter). Dates are
+# inclusive, and an empty assigned_from/assigned_to leaves that side open.
+# One query reads every overlapping assignment for a page of members, ordered
+# by member. A sweep line over the +1/-1 events of each member then splits the
+# window into segments of constant load.
+
+def overlapping_assignments(start, end):
+    """Assignments that make their member busy on some day in [start, end]."""
+    return MemberAssigned.objects.filter(
+        Q(assigned_from__lte=end) | Q(assigned_from__isnull=True),
+        Q(assigned_to__gte=start) | Q(assigned_to__isnull=True),
+        is_active=True,
+        project__status__in=Project.ENGAGED_STATUSES,
+    )
+
+
+def sweep(ranges, start, end):
+    """
+    Split [start, end] into (from, to, load) segments, where load is how many
+    of the inclusive ``ranges`` cover those days. Adjacent segments never share a load.
+    """
+    events = defaultdict(int)
+    for begin, finish in ranges:
+        begin = max(begin or start, start)
+        finish = min(finish or end, end)
+        if begin <= finish:
+            events[begin] += 1
+            events[finish + ONE_DAY] -= 1
+
+    segments, load, cursor = [], 0, start
+    for day in sorted(events):
+        if not events[day]:
+            continue
+        if day > cursor:
+            segments.append((cursor, day - ONE_DAY, load))
+        load += events[day]
+        cursor = day
+    if cursor <= end:
+        segments.append((cursor, end, load))
+    return segments
+
+
+def _summary(segments, start, end):
+    window_days = (end - start).days + 1
+    busy_days = sum((to - since).days + 1 for since, to, load in segments if load)
+    return {
+        "busy_days": busy_days,
+        "free_days": window_days - busy_days,
+        "utilisation": round(busy_days / window_days, 3),
+        "max_concurrent": max((load for _, _, load in segments), default=0),
+        "free": [
+            {"from": since, "to": to, "days": (to - since).days + 1}
+            for since, to, load in segments if not load
+        ],
+        "load": [
+            {"from": since, "to": to, "assignments": load}
+            for since, to, load in segments if load
+        ],
+    }
+
+
+def member_availability(member_ids, start, end):
+    """{member id: free/busy summary over [start, end]} for ``member_ids``, from one query."""
+    ranges = defaultdict(list)
+    rows = overlapping_assignments(start, end).filter(member_id__in=member_ids).order_by("member_id").values_list(
+        "member_id", "assigned_from", "assigned_to",
+    )
+    for member_id, assigned_from, assigned_to in rows:
+        ranges[member_id].append((assigned_from, assigned_to))
+    return {member_id: _summary(sweep(ranges[member_id], start, end), start, end) for member_id in member_ids}
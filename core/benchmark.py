@@ -0,0 +1,220 @@
+import datetime
+import math
+import subprocess
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.db.models import Count
+from django.test import Client as HttpClient
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from .caching import api_cache
+from .models import (
+    Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity, SearchToken,
+)
+from .search import words
+from .serializers import CustomTokenSerializer
+from .urls import router
+
+
+# ======================================================
+# ⏱️ End-to-end latency benchmark
+# ======================================================
+# Every target is requested in-process through the full middleware and view
+# stack with django.test.Client. Each one gets ``warmup`` untimed requests and
+# then ``iterations`` timed ones; the report keeps p50/p95 latency and the
+# number of SQL queries per request, on every connection the request used
+# (in whichever thread the view ran its queries).
+
+REPORT_TABLES = (Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity, SearchToken)
+
+
+class QueryCounter:
+    """execute_wrapper counting queries on every connection, in any thread."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+    def install(self, sender=None, connection=None, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def __enter__(self):
+        connection_created.connect(self.install)
+        for conn in connections.all():
+            self.install(connection=conn)
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self.install)
+        for conn in connections.all():
+            if self in conn.execute_wrappers:
+                conn.execute_wrappers.remove(self)
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile of ``values`` (0-100)."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _first_word(value, default):
+    found = words(value)
+    return found[0] if found else default
+
+
+def bench_targets():
+    """
+    (group, name, url, staff_only) for the dashboard, the list pages,
+    ProjectFilter queries and the read endpoints under /api/. Detail URLs use
+    the newest row of each table; the dossier and history use the project with
+    the most assignments, availability the busiest member.
+    """
+    targets = [
+        ("dashboard", "dashboard", reverse("dashboard"), False),
+    ]
+
+    client_word = _first_word(Client.objects.order_by("pk").values_list("Client_name", flat=True).first(), "acme")
+    project = Project.objects.order_by("pk").values("name", "start_date").first() or {}
+    project_word = _first_word(project.get("name"), "portal")
+    member_word = _first_word(Member.objects.order_by("pk").values_list("name", flat=True).first(), "dev")
+    year = (project.get("start_date") or timezone.localdate()).year
+    since = (timezone.now() - datetime.timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    pages = (
+        ("clients_list", ""), ("clients_list", "?status=hot"), ("clients_list", f"?q={client_word}"),
+        ("projects_list", ""), ("projects_list", "?status=active"), ("projects_list", f"?q={project_word}"),
+        ("members_list", ""), ("members_list", "?status=current"), ("members_list", f"?q={member_word}"),
+    )
+    for name, query in pages:
+        targets.append(("pages", f"{name}{query}", reverse(name) + query, False))
+
+    project_filters = (
+        "status=active", "status=hot&type=client", f"start_year={year}", f"client={client_word}",
+        f"q={project_word}", "hosting=aws", "github=true", "deployed=false",
+        f"start_date={year}-01-01&end_date={year + 1}-12-31",
+    )
+    for params in project_filters:
+        targets.append(("filter", f"ProjectFilter ?{params}", f"{reverse('project-list')}?{params}", False))
+
+    for prefix, viewset, basename in router.registry:
+        model = viewset.queryset.model
+        targets.append(("api", f"{prefix} list", reverse(f"{basename}-list"), False))
+        newest = model.objects.order_by("-pk").values_list("pk", flat=True).first()
+        if newest is not None:
+            targets.append(("api", f"{prefix} detail", reverse(f"{basename}-detail", args=[newest]), False))
+
+    busiest = MemberAssigned.objects.values("project_id").annotate(n=Count("id")).order_by("-n").first()
+    if busiest:
+        targets += [
+            ("api", "projects dossier", reverse("project-dossier", args=[busiest["project_id"]]), False),
+            ("api", "projects history", reverse("project-history", args=[busiest["project_id"]]), False),
+        ]
+    member = MemberAssigned.objects.values("member_id").annotate(n=Count("id")).order_by("-n").first()
+    if member:
+        targets.append((
+            "api", "members availability", reverse("member-availability", args=[member["member_id"]]), False,
+        ))
+    targets += [
+        ("api", "projects history page", reverse("project-histories") + "?page_size=100", False),
+        ("api", "members availability page", reverse("member-availabilities") + "?page_size=200", False),
+        ("api", "members available ?available=true", reverse("member-availabilities") + "?available=true", False),
+        ("api", "clients list ?with_projects=1", reverse("client-list") + "?with_projects=1", False),
+        ("api", "projects list ?expand=client", reverse("project-list") + "?expand=client", False),
+        ("api", "projects export csv ?status=hot", reverse("project-export", args=["csv"]) + "?status=hot", False),
+        ("api", "projects export ndjson ?status=hot",
+         reverse("project-export", args=["ndjson"]) + "?status=hot", False),
+        ("api", "search", f"{reverse('search')}?q={project_word}", False),
+        ("api", "changes (first page)", reverse("changes") + "?page_size=100", False),
+        ("api", "changes since 1 hour", reverse("changes") + f"?since={since}", False),
+        ("api", "cache stats", reverse("cache_stats"), True),
+    ]
+    return targets
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _fetch(http, url):
+    response = http.get(url)
+    body = b"".join(response.streaming_content) if response.streaming else response.content
+    return response.status_code, len(body)
+
+
+def run_benchmark(targets, iterations=20, warmup=2, user=None, warm_cache=False, progress=None):
+    """Request every target and return the report as a JSON-ready dict."""
+    http = HttpClient(raise_request_exception=False)
+    if user is not None:
+        http.force_login(user)
+        http.defaults["HTTP_AUTHORIZATION"] = f"Bearer {CustomTokenSerializer.get_token(user).access_token}"
+
+    results = []
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]), QueryCounter() as counter:
+        for group, name, url, staff_only in targets:
+            if staff_only and not (user is not None and user.is_staff):
+                continue
+            for _ in range(warmup):
+                _fetch(http, url)
+            timings, queries = [], []
+            for _ in range(max(iterations, 1)):
+                if not warm_cache:
+                    api_cache().clear()
+                counter.count = 0
+                started = time.perf_counter()
+                status, size = _fetch(http, url)
+                timings.append((time.perf_counter() - started) * 1000)
+                queries.append(counter.count)
+            result = {
+                "group": group,
+                "name": name,
+                "url": url,
+                "status": status,
+                "p50_ms": round(percentile(timings, 50), 3),
+                "p95_ms": round(percentile(timings, 95), 3),
+                "min_ms": round(min(timings), 3),
+                "max_ms": round(max(timings), 3),
+                "queries": max(queries),
+                "bytes": size,
+            }
+            results.append(result)
+            if progress:
+                progress(result)
+
+    return {
+        "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "database": connection.vendor,
+        "debug": settings.DEBUG,
+        "user": user.get_username() if user is not None else None,
+        "iterations": iterations,
+        "warmup": warmup,
+        "response_cache": "warm" if warm_cache else "cleared before each request",
+        "rows": {model._meta.label: model.objects.count() for model in REPORT_TABLES},
+        "results": results,
+    }
+
+
+def compare_reports(baseline, current):
+    """(name, old result, new result) for targets present in both reports."""
+    old = {result["name"]: result for result in baseline["results"]}
+    return [(result["name"], old[result["name"]], result) for result in current["results"] if result["name"] in old]
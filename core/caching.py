@@ -0,0 +1,123 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+
+# ======================================================
+# 🗄️ Versioned API response cache
+# ======================================================
+# Each model has a version number in the cache, bumped by core.signals after
+# every committed write. A cached response's key includes the versions of the
+# models it was built from, so a write to any of them makes old entries
+# unreachable without having to find and delete them.
+
+def api_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def _version_key(model):
+    return f"pims:ver:{model._meta.label_lower}"
+
+
+def model_versions(models):
+    cache = api_cache()
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def _bump(models):
+    cache = api_cache()
+    for model in models:
+        key = _version_key(model)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_model_versions(*models):
+    """Invalidate cached responses built from ``models`` once the current transaction commits."""
+    transaction.on_commit(lambda: _bump(models))
+
+
+def _count(endpoint, outcome):
+    cache = api_cache()
+    key = f"pims:stats:{endpoint}:{outcome}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def cache_stats(endpoints):
+    cache = api_cache()
+    keys = {(e, o): f"pims:stats:{e}:{o}" for e in endpoints for o in ("hits", "misses")}
+    values = cache.get_many(keys.values())
+    return {
+        endpoint: {outcome: values.get(keys[endpoint, outcome], 0) for outcome in ("hits", "misses")}
+        for endpoint in endpoints
+    }
+
+
+class CachedResponseMixin:
+    """
+    Caches list/retrieve responses (data plus ETag/Last-Modified) per URL.
+    ``cache_dependencies`` names other models whose rows show up in the output;
+    ``cache_timeout`` overrides API_CACHE_TIMEOUT for this endpoint.
+    """
+    cache_dependencies = ()
+    cache_timeout = None
+
+    @classmethod
+    def cache_endpoint(cls):
+        return cls.queryset.model._meta.model_name
+
+    def get_cache_dependencies(self):
+        return self.cache_dependencies
+
+    def _cache_key(self, request):
+        models = [self.get_queryset().model, *self.get_cache_dependencies()]
+        versions = model_versions(models)
+        raw = repr((request.build_absolute_uri(), request.META.get("HTTP_ACCEPT"), self.action, versions))
+        return f"pims:resp:{self.cache_endpoint()}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+    def _cached(self, handler, request, *args, **kwargs):
+        key = self._cache_key(request)
+        cache = api_cache()
+        entry = cache.get(key)
+        if entry is not None:
+            _count(self.cache_endpoint(), "hits")
+            headers = entry["headers"]
+            not_modified = get_conditional_response(
+                request._request, etag=headers.get("ETag"),
+                last_modified=parse_http_date_safe(headers.get("Last-Modified", "")),
+            )
+            if not_modified is not None:
+                return Response(status=not_modified.status_code, headers=headers)
+            return Response(entry["data"], headers=entry["headers"])
+
+        _count(self.cache_endpoint(), "misses")
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            headers = {h: response[h] for h in ("ETag", "Last-Modified") if response.has_header(h)}
+            timeout = self.cache_timeout if self.cache_timeout is not None else settings.API_CACHE_TIMEOUT
+            cache.set(key, {"data": response.data, "headers": headers}, timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(super().retrieve, request, *args, **kwargs)
@@ -0,0 +1,179 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.settings import api_settings
+
+from .fastpath import FastListPlan
+from .models import Tombstone
+from .pagination import clamp_page_size
+
+
+# ======================================================
+# 🔁 Changes feeds ("what changed since my cursor")
+# ======================================================
+# A feed position has two parts. "u" is the (updated_at, id) of the last row
+# returned, read in ascending order on the (updated_at, id) index. "d" is the
+# (deleted_at, id) of the last tombstone returned. Each page moves both parts
+# forward. Rows written in the last CHANGES_SETTLE_SECONDS are held back, so a
+# transaction that stamped updated_at before a later one but commits after it
+# still shows up on the next poll. Clients apply "changed" before "deleted".
+
+class CursorExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "This cursor is older than the delete history; download the collection again."
+    default_code = "cursor_expired"
+
+
+def _position(value):
+    return [value[0].isoformat() if value[0] else None, value[1]] if value else None
+
+
+def _parse_position(value):
+    if value is None:
+        return None
+    timestamp, pk = value
+    return (datetime.fromisoformat(timestamp) if timestamp else None), int(pk)
+
+
+def encode_state(state):
+    """Opaque cursor for {model label: {"u": position, "d": position}}."""
+    raw = json.dumps({
+        label: {"u": _position(part["u"]), "d": _position(part["d"])} for label, part in state.items()
+    })
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_state(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            label: {"u": _parse_position(part["u"]), "d": _parse_position(part["d"])}
+            for label, part in raw.items()
+        }
+    except (AttributeError, KeyError, TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise NotFound("Invalid cursor") from exc
+
+
+def _after(field, position):
+    timestamp, pk = position
+    if timestamp is None:
+        return Q(**{f"{field}__isnull": True, "id__gt": pk}) | Q(**{f"{field}__isnull": False})
+    return Q(**{f"{field}__gt": timestamp}) | Q(**{field: timestamp, "id__gt": pk})
+
+
+def _latest_tombstone(model):
+    row = Tombstone.objects.filter(model=model._meta.label_lower).order_by("-deleted_at", "-id").values_list(
+        "deleted_at", "id",
+    ).first()
+    return tuple(row) if row else None
+
+
+def start_state(request, models):
+    """
+    {model label: position} to read ``models`` from: the ?after= cursor,
+    ?since= (an ISO timestamp), or the beginning of each table for a first
+    download. A first download skips the tombstones that already exist.
+    """
+    after, since = request.query_params.get("after"), request.query_params.get("since")
+    labels = {model._meta.label_lower: model for model in models}
+    if after:
+        state = decode_state(after)
+    elif since:
+        try:
+            moment = parse_datetime(since)
+        except ValueError:
+            moment = None
+        if moment is None:
+            raise ValidationError({"since": ["Use an ISO 8601 timestamp."]})
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        state = {label: {"u": (moment, 0), "d": (moment, 0)} for label in labels}
+    else:
+        state = {}
+
+    for label, model in labels.items():
+        if label not in state:
+            state[label] = {"u": None, "d": _latest_tombstone(model)}
+    if settings.CHANGES_TOMBSTONE_RETENTION_DAYS:
+        cutoff = timezone.now() - timedelta(days=settings.CHANGES_TOMBSTONE_RETENTION_DAYS)
+        if any(state[label]["d"] and state[label]["d"][0] < cutoff for label in labels):
+            raise CursorExpired()
+    return {label: state[label] for label in labels}
+
+
+def read_changes(model, position, page_size, horizon, columns):
+    """
+    One page of changed rows (``.values(*columns)`` dicts) and tombstones
+    after ``position``, up to ``horizon``. Returns (rows, tombstones, new
+    position, has_more).
+    """
+    if position["u"] and position["u"][0]:
+        rows = model.objects.filter(_after("updated_at", position["u"]), updated_at__lte=horizon)
+        rows = rows.order_by("updated_at", "id")
+    else:
+        # A first download also reaches the rows that were never stamped, first.
+        rows = model.objects.filter(Q(updated_at__lte=horizon) | Q(updated_at__isnull=True))
+        if position["u"]:
+            rows = rows.filter(_after("updated_at", position["u"]))
+        rows = rows.order_by(F("updated_at").asc(nulls_first=True), "id")
+    rows = list(rows.values(*columns)[:page_size + 1])
+
+    tombstones = Tombstone.objects.filter(model=model._meta.label_lower, deleted_at__lte=horizon)
+    if position["d"]:
+        tombstones = tombstones.filter(_after("deleted_at", position["d"]))
+    tombstones = list(tombstones.order_by("deleted_at", "id").values("id", "object_id", "deleted_at")[:page_size + 1])
+
+    has_more = len(rows) > page_size or len(tombstones) > page_size
+    rows, tombstones = rows[:page_size], tombstones[:page_size]
+    position = {
+        "u": (rows[-1]["updated_at"], rows[-1]["id"]) if rows else position["u"],
+        "d": (tombstones[-1]["deleted_at"], tombstones[-1]["id"]) if tombstones else position["d"],
+    }
+    deleted = [{"id": row["object_id"], "deleted_at": row["deleted_at"]} for row in tombstones]
+    return rows, deleted, position, has_more
+
+
+def settled_horizon():
+    return timezone.now() - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS)
+
+
+def feed_page(request, feeds):
+    """
+    Read one page of every feed in ``feeds`` ({resource: (model, serializer
+    class)}). Returns ({resource: {"changed", "deleted"}}, next cursor, has_more).
+    """
+    page_size = clamp_page_size(
+        request.query_params.get("page_size"), default=api_settings.PAGE_SIZE, maximum=settings.API_MAX_PAGE_SIZE,
+    )
+    state = start_state(request, [model for model, _ in feeds.values()])
+    horizon = settled_horizon()
+    results, has_more = {}, False
+    for resource, (model, serializer_class) in feeds.items():
+        label = model._meta.label_lower
+        plan = FastListPlan.for_serializer(serializer_class(context={"request": request}))
+        columns = plan.columns if plan else ["id", "updated_at"]
+        rows, deleted, state[label], more = read_changes(model, state[label], page_size, horizon, columns)
+        if plan:
+            changed = plan.render_rows(rows)
+        else:
+            objects = model.objects.in_bulk([row["id"] for row in rows])
+            changed = serializer_class(
+                [objects[row["id"]] for row in rows if row["id"] in objects], many=True, context={"request": request},
+            ).data
+        results[resource] = {"changed": changed, "deleted": deleted}
+        has_more = has_more or more
+    return results, encode_state(state), has_more
+
+
+def prune_tombstones(days=None):
+    """Delete tombstones older than ``days`` (CHANGES_TOMBSTONE_RETENTION_DAYS); returns how many."""
+    days = settings.CHANGES_TOMBSTONE_RETENTION_DAYS if days is None else days
+    return Tombstone.objects.filter(deleted_at__lt=timezone.now() - timedelta(days=days)).delete()[0]
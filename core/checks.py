@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+
+# ======================================================
+# ✅ System checks
+# ======================================================
+# Cache backends whose data lives inside one process
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def _revocation_cache_errors():
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [Error(
+        "The default cache is process-local, so a logout or password change in one worker "
+        "does not revoke tokens in the others.",
+        hint="Point CACHE_URL at a shared cache (e.g. rediscache:// or pymemcache://).",
+        id="core.E001",
+    )]
+
+
+@register(Tags.security)
+def check_stateless_auth_cache(app_configs, **kwargs):
+    """Stateless JWT auth keeps token revocations in the default cache, which every worker must share."""
+    if not settings.JWT_STATELESS_AUTH:
+        return []
+    return _revocation_cache_errors()
+
+
+@register(Tags.security, deploy=True)
+def check_revocation_cache(app_configs, **kwargs):
+    """
+    User-row JWT auth checks the same revocations. A single runserver process
+    can use a local cache, so outside stateless mode this runs with --deploy.
+    """
+    if settings.JWT_STATELESS_AUTH:
+        return []
+    return _revocation_cache_errors()
@@ -0,0 +1,91 @@
+import hashlib
+
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .caching import model_versions
+
+
+# ======================================================
+# 🏷️ Conditional GET (ETag / Last-Modified)
+# ======================================================
+# An API or list-page ETag is the URL plus the cache versions (core.caching)
+# of the models the response is built from. core.signals and every bulk write
+# bump those versions on commit, deletes included, so checking costs one cache
+# read and no query. Last-Modified alone cannot see a delete, so it is only
+# sent where no delete can change the body.
+
+def version_etag(*parts, models=()):
+    """ETag for ``parts`` (path, user, ...) and the current versions of ``models``."""
+    digest = hashlib.md5(repr((parts, model_versions(models))).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def latest_update(queryset):
+    return queryset.order_by().aggregate(last=Max("updated_at"))["last"], None
+
+
+def validators(*parts, latest=()):
+    """
+    Return (etag, last_modified) from the max updated_at of the ``latest``
+    querysets plus any extra ``parts``, for pages whose deletes are already
+    reflected in a row that gets updated (the dashboard's stats snapshot).
+    """
+    return validators_from_states(parts, [latest_update(qs) for qs in latest])
+
+
+def validators_from_states(parts, states):
+    """(etag, last_modified) from already-fetched (max updated_at, count) states."""
+    stamps = [last for last, _ in states if last]
+    digest = hashlib.md5(repr((parts, states)).encode()).hexdigest()
+    return quote_etag(digest), (max(stamps) if stamps else None)
+
+
+def user_part(request, user=None):
+    user = user or request.user
+    return (user.pk, user.is_staff, user.is_superuser) if user.is_authenticated else None
+
+
+class ConditionalGetMixin:
+    """
+    Answers list/retrieve with 304 Not Modified when the client's If-None-Match /
+    If-Modified-Since still matches, before any serialization happens.
+    ``conditional_dependencies`` lists other models whose rows appear in the output.
+    """
+    conditional_dependencies = ()
+
+    def get_conditional_dependencies(self):
+        return self.conditional_dependencies
+
+    def sends_last_modified(self):
+        """A single row with no dependencies; deleting it answers 404, not a stale 304."""
+        return self.action == "retrieve" and not self.get_conditional_dependencies()
+
+    def _last_modified(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = self.get_queryset().filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return row.values_list("updated_at", flat=True).first()
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        etag = version_etag(
+            request.get_full_path(), request.META.get("HTTP_ACCEPT"),
+            models=[self.get_queryset().model, *self.get_conditional_dependencies()],
+        )
+        last_modified = self._last_modified() if self.sends_last_modified() else None
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return not_modified
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if timestamp:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
@@ -0,0 +1,56 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import bump_model_versions
+from .models import Member, MemberAssigned
+from .overlaps import lock_members
+from .stats import refresh_engagement
+
+
+# ======================================================
+# ⌛ Expiring stale assignments
+# ======================================================
+# An assignment whose assigned_to has passed stays active until someone edits
+# it. expire_assignments() deactivates them in batches. Each batch is one
+# transaction: read up to ``batch_size`` candidate ids, lock their members the
+# same way the write paths in core.overlaps do, then run one UPDATE that
+# re-checks the predicate. An assignment a user extended or deactivated in the
+# meantime is left alone. Engagement counters and members.current are
+# recomputed for the batch's members, since UPDATE skips the signals that
+# normally adjust them.
+
+def expired_assignments(today):
+    return MemberAssigned.objects.filter(is_active=True, assigned_to__lt=today)
+
+
+def expire_assignments(today=None, batch_size=1000, username="system", dry_run=False):
+    """Deactivate every active assignment that ended before ``today``; returns the counts."""
+    today = today or timezone.localdate()
+    result = {"expired": 0, "members": 0, "batches": 0}
+    if dry_run:
+        queryset = expired_assignments(today)
+        result["expired"] = queryset.count()
+        result["members"] = queryset.values("member_id").distinct().count()
+        return result
+
+    members, last_pk = set(), 0
+    while True:
+        with transaction.atomic():
+            candidates = expired_assignments(today).filter(pk__gt=last_pk).order_by("pk")
+            rows = list(candidates.values_list("pk", "member_id")[:batch_size])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+            member_ids = {member_id for _, member_id in rows}
+            lock_members(member_ids)
+            expired = expired_assignments(today).filter(pk__in=[pk for pk, _ in rows]).update(
+                is_active=False, updated_by=username, updated_at=timezone.now(),
+            )
+            if expired:
+                refresh_engagement(Member.objects.filter(pk__in=member_ids))
+                bump_model_versions(MemberAssigned)
+        result["expired"] += expired
+        result["batches"] += 1
+        members |= member_ids
+    result["members"] = len(members)
+    return result
@@ -0,0 +1,114 @@
+import csv
+import json
+from collections import defaultdict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, OuterRef, Subquery
+from rest_framework.renderers import BaseRenderer
+
+from .models import Project, MemberAssigned, ProjectActivity
+
+
+# ======================================================
+# 📤 Project export (CSV / NDJSON)
+# ======================================================
+# Rows are read in primary-key chunks (WHERE id > last ORDER BY id LIMIT n),
+# and teams, active members and the latest activity are fetched once per
+# chunk, so memory stays flat however many projects are exported and the
+# first bytes go out after the first chunk.
+
+EXPORT_COLUMNS = [
+    "id", "name", "type", "status", "client_id", "client_name",
+    "start_date", "end_date", "hosting_provider", "teams", "active_members",
+    "latest_activity_status", "latest_activity_at", "updated_at",
+]
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+LIST_SEPARATOR = "; "
+
+
+def _latest_activity(field):
+    return Subquery(
+        ProjectActivity.objects.filter(project=OuterRef("pk")).order_by("-created_at", "-id").values(field)[:1]
+    )
+
+
+def _grouped(pairs):
+    groups = defaultdict(list)
+    for project_id, value in pairs:
+        groups[project_id].append(value)
+    return groups
+
+
+def iter_project_rows(queryset=None, chunk_size=1000):
+    """Yield one dict per project (EXPORT_COLUMNS keys), in id order."""
+    queryset = (Project.objects.all() if queryset is None else queryset).order_by("pk").values(
+        "id", "name", "type", "status", "client_id", "start_date", "end_date",
+        "hosting_provider", "updated_at",
+        client_name=F("client__Client_name"),
+        latest_activity_status=_latest_activity("status"),
+        latest_activity_at=_latest_activity("created_at"),
+    )
+    last_pk = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            return
+        ids = [row["id"] for row in chunk]
+        teams = _grouped(
+            Project.teams_assigned.through.objects.filter(project_id__in=ids)
+            .order_by("project_id", "team_id").values_list("project_id", "team__team_type")
+        )
+        members = _grouped(
+            MemberAssigned.objects.filter(project_id__in=ids, is_active=True)
+            .order_by("project_id", "member__name").values_list("project_id", "member__name")
+        )
+        for row in chunk:
+            row["teams"] = teams.get(row["id"], [])
+            row["active_members"] = members.get(row["id"], [])
+            yield {column: row[column] for column in EXPORT_COLUMNS}
+        last_pk = ids[-1]
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the csv writer's caller."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return LIST_SEPARATOR.join(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([_csv_value(row[column]) for column in EXPORT_COLUMNS])
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def export_lines(fmt, rows):
+    return csv_lines(rows) if fmt == "csv" else ndjson_lines(rows)
+
+
+class PassthroughRenderer(BaseRenderer):
+    """Lets export actions accept any Accept header; they return their own streaming response."""
+    media_type = "*/*"
+    format = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
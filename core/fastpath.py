@@ -0,0 +1,167 @@
+import datetime
+
+from django.conf import settings
+from rest_framework import ISO_8601, serializers
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:  # optional; JSON rendering falls back to the stdlib encoder
+    orjson = None
+
+
+# ======================================================
+# ⚡ Fast read path for API list endpoints
+# ======================================================
+# For serializers made only of plain model columns, FK ids and m2m id lists,
+# list pages are built straight from .values() rows: each output field gets
+# its converter (the DRF field's own to_representation, or nothing when that
+# is the identity for what the database returns) worked out once per request
+# instead of running the serializer machinery per row and per field.
+
+# Fields whose to_representation returns database values unchanged
+IDENTITY_FIELDS = (
+    serializers.CharField, serializers.ChoiceField, serializers.IntegerField,
+    serializers.BooleanField, serializers.ReadOnlyField, PrimaryKeyRelatedField,
+)
+
+
+def converter_for(field):
+    """
+    Callable that turns a database value into ``field``'s output, or None for
+    the identity. ISO dates and aware datetimes skip DRF's per-call setting
+    lookups; anything else uses the field's own to_representation.
+    """
+    if isinstance(field, IDENTITY_FIELDS):
+        return None
+    if type(field) is serializers.DateTimeField and settings.USE_TZ:
+        if str(getattr(field, "format", api_settings.DATETIME_FORMAT)).lower() == ISO_8601:
+            tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+
+            def iso_datetime(value):
+                if value.tzinfo is None:
+                    return field.to_representation(value)
+                text = value.astimezone(tz).isoformat()
+                return text[:-6] + "Z" if text.endswith("+00:00") else text
+            return iso_datetime
+    if type(field) is serializers.DateField:
+        if str(getattr(field, "format", api_settings.DATE_FORMAT)).lower() == ISO_8601:
+            return datetime.date.isoformat
+    return field.to_representation
+
+
+class FastListPlan:
+    """
+    Columns to read and how to turn a ``.values()`` row into the serializer's
+    output. ``many`` holds (field name, model field) pairs for m2m id lists.
+    """
+
+    def __init__(self, model, fields, many):
+        self.model = model
+        self.fields = fields
+        self.many = many
+        self.columns = list(dict.fromkeys([source for _, source, _ in fields] + ["id", "updated_at"]))
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        """Return a plan for ``serializer`` (unbound, many=False), or None if it needs the slow path."""
+        model = serializer.Meta.model
+        fields, many = [], []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if "." in field.source or field.source == "*":
+                return None
+            if isinstance(field, ManyRelatedField):
+                if not isinstance(field.child_relation, PrimaryKeyRelatedField) or field.child_relation.pk_field:
+                    return None
+                many.append((name, model._meta.get_field(field.source)))
+                continue
+            if isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField)):
+                return None
+            if isinstance(field, PrimaryKeyRelatedField) and field.pk_field:
+                return None
+            if field.source not in {f.name for f in model._meta.concrete_fields}:
+                return None
+            fields.append((name, field.source, converter_for(field)))
+        return cls(model, fields, many)
+
+    def _related_queries(self, ids):
+        # Related ids come out in pk order, the order SparseFieldsMixin prefetches them in.
+        for name, model_field in self.many:
+            lookup = model_field.related_query_name()
+            related = model_field.related_model.objects.filter(**{f"{lookup}__in": ids})
+            yield name, related.order_by(lookup, "pk").values_list(lookup, "pk")
+
+    def related_ids(self, ids):
+        """{field name: {object id: [related ids]}} for the m2m fields, one query each."""
+        result = {}
+        for name, rows in self._related_queries(ids):
+            grouped = result[name] = {}
+            for owner_id, related_id in rows:
+                grouped.setdefault(owner_id, []).append(related_id)
+        return result
+
+    def render_rows(self, rows):
+        related = self.related_ids([row["id"] for row in rows]) if self.many else {}
+        fields = self.fields
+        output = []
+        for row in rows:
+            item = {}
+            for name, source, converter in fields:
+                value = row[source]
+                item[name] = value if converter is None or value is None else converter(value)
+            for name, _ in self.many:
+                item[name] = related[name].get(row["id"], [])
+            output.append(item)
+        return output
+
+
+class FastListMixin:
+    """
+    Serves ``list`` from FastListPlan when the serializer allows it and no
+    ``?expand=`` is requested; otherwise falls back to the regular list.
+    Set ``fast_list = False`` on a ViewSet to opt out.
+    """
+    fast_list = True
+
+    def get_fast_plan(self):
+        if not self.fast_list or (hasattr(self, "get_expansions") and self.get_expansions()):
+            return None
+        return FastListPlan.for_serializer(self.get_serializer())
+
+    def list(self, request, *args, **kwargs):
+        plan = self.get_fast_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None).values(*plan.columns)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(plan.render_rows(page))
+        return Response(plan.render_rows(list(queryset)))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed. The output
+    bytes are the same as JSONRenderer's compact form; indented output and
+    non-UTF-8 settings go through the stdlib path.
+    """
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson else 0
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None or self.ensure_ascii or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=JSONEncoder().default, option=self.ORJSON_OPTIONS)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -1,9 +1,11 @@
 
+from django.db.models import Q
 from django_filters import rest_framework as filters
 from .models import Project
 
 class ProjectFilter(filters.FilterSet):
     start_year = filters.NumberFilter(field_name='start_date', lookup_expr='year')
+    q = filters.CharFilter(method='filter_q')
     client = filters.CharFilter(field_name='client__Client_name', lookup_expr='icontains')
     type = filters.ChoiceFilter(choices=Project.PROJECT_TYPES)
     status = filters.ChoiceFilter(choices=Project.STATUS_CHOICES)
@@ -17,6 +19,11 @@ class ProjectFilter(filters.FilterSet):
         model = Project
         fields = []
 
+    def filter_q(self, qs, name, val):
+        return qs.filter(
+            Q(name__icontains=val) | Q(client__Client_name__icontains=val) | Q(hosting_provider__icontains=val)
+        )
+
     def filter_github(self, qs, name, val):
         return qs.exclude(github_repo__isnull=True, github_repo__exact='') if val else qs.filter(github_repo__isnull=True) | qs.filter(github_repo__exact='')
 
@@ -0,0 +1,74 @@
+from django.db.models import F, Window
+from django.db.models.functions import Coalesce, Lead, TruncDate
+
+from .models import ProjectActivity
+
+
+# ======================================================
+# 🕒 Project status history
+# ======================================================
+# Every activity with a status opens a period in that status from its
+# activity_from (or creation date). The period ends at its activity_to, cut
+# short by the project's next activity. A period with no end runs until
+# ``as_of``, unless its status is terminal. Lead() over each project's
+# activities returns the next start in the same query. One pass over the
+# rows, ordered by project, then builds every timeline and its totals.
+
+STATUSES = [key for key, _ in ProjectActivity.STATUS_CHOICES]
+TERMINAL_STATUSES = ("completed",)
+
+
+def status_rows(project_ids=None):
+    """Activities with a status, in (project, start, id) order, each with the next activity's start."""
+    start = Coalesce("activity_from", TruncDate("created_at"))
+    queryset = ProjectActivity.objects.filter(status__isnull=False)
+    if project_ids is not None:
+        queryset = queryset.filter(project_id__in=project_ids)
+    return queryset.annotate(
+        start=start,
+        next_start=Window(Lead(start), partition_by=[F("project_id")], order_by=[start.asc(), F("id").asc()]),
+    ).order_by("project_id", "start", "id").values(
+        "id", "project_id", "status", "start", "activity_to", "next_start",
+    )
+
+
+def _period_end(row, as_of):
+    start, next_start = row["start"], row["next_start"]
+    end = row["activity_to"] or next_start or (start if row["status"] in TERMINAL_STATUSES else as_of)
+    if next_start and end > next_start:
+        end = next_start
+    return max(end, start)
+
+
+def empty_history(timeline=True):
+    history = {"current_status": None, "days_in_status": dict.fromkeys(STATUSES, 0)}
+    if timeline:
+        history["timeline"] = []
+    return history
+
+
+def project_histories(project_ids, as_of, timeline=True):
+    """
+    {project id: {"current_status", "days_in_status", "timeline"}} for
+    ``project_ids`` (every project when None), from a single query.
+    """
+    histories = {}
+    for row in status_rows(project_ids).iterator(chunk_size=2000):
+        history = histories.get(row["project_id"])
+        if history is None:
+            history = histories[row["project_id"]] = empty_history(timeline)
+        end = _period_end(row, as_of)
+        days = (end - row["start"]).days
+        status = row["status"]
+        history["days_in_status"][status] = history["days_in_status"].get(status, 0) + days
+        history["current_status"] = status
+        if timeline:
+            history["timeline"].append({
+                "activity": row["id"],
+                "status": status,
+                "from": row["start"],
+                "to": end,
+                "days": days,
+                "open": not (row["activity_to"] or row["next_start"] or status in TERMINAL_STATUSES),
+            })
+    return histories
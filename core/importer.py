@@ -0,0 +1,374 @@
+import csv
+import json
+from collections import Counter
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+
+from .caching import bump_model_versions
+from .models import Client, Project, Member, MemberAssigned
+from .overlaps import AssignmentOverlap, check_assignments, lock_members
+from .search import reindex_objects
+from .stats import rebuild_dashboard_stats
+
+
+# ======================================================
+# 📥 Bulk import (CSV / NDJSON)
+# ======================================================
+# Foreign keys are resolved through in-memory {natural key: pk} maps loaded
+# once per run, and rows are upserted per batch with one bulk_create plus a
+# few set-based updates. Row signals do not fire, so each batch bumps the API
+# cache versions as it commits, and each importer refreshes the search index
+# (for the rows it wrote), engagement counters and dashboard stats once at the
+# end. Assignments go through the same locked overlap check as the API.
+
+AMBIGUOUS = object()
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+FALSE_VALUES = {"0", "false", "f", "no", "n"}
+
+
+class ImportRowError(Exception):
+    pass
+
+
+def name_key(value):
+    return " ".join(str(value or "").split()).casefold()
+
+
+def read_rows(path, fmt):
+    """Yield (line number, row dict or ImportRowError) from a CSV or NDJSON file."""
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        if fmt == "csv":
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_no, ImportRowError(f"invalid JSON: {exc}")
+                continue
+            yield line_no, row if isinstance(row, dict) else ImportRowError("expected a JSON object")
+
+
+def _name_map(queryset, *fields):
+    """{natural key: pk}, with AMBIGUOUS for keys shared by several rows."""
+    mapping = {}
+    for *values, pk in queryset.values_list(*fields, "pk").order_by("pk").iterator(chunk_size=5000):
+        key = tuple(name_key(v) if isinstance(v, str) else v for v in values)
+        key = key[0] if len(key) == 1 else key
+        mapping[key] = AMBIGUOUS if key in mapping else pk
+    return mapping
+
+
+class ModelImporter:
+    """
+    Upserts ``model`` rows keyed on ``key_fields``. ``columns`` maps file
+    columns to model fields; ``required`` columns must be present and non-empty.
+    Subclasses resolve foreign keys in ``resolve``, veto rows in ``check`` and
+    refresh derived state in ``after_import``.
+    """
+    model = None
+    key_fields = ()
+    columns = {}
+    required = ()
+    label = ""
+
+    def __init__(self, username, batch_size=1000):
+        self.username = username
+        self.batch_size = batch_size
+        self.counts = Counter()
+        self.rejected = []
+        self.keys = self.load_keys(self.model.objects.all())
+
+    def load_keys(self, queryset):
+        return _name_map(queryset, *self.key_fields)
+
+    def merge_keys(self, keys):
+        for key, pk in keys.items():
+            self.keys[key] = AMBIGUOUS if key in self.keys else pk
+
+    def key_of(self, obj):
+        return self.key_for({f: getattr(obj, f) for f in self.key_fields})
+
+    def key_for(self, values):
+        key = tuple(name_key(values.get(f)) if isinstance(values.get(f), str) else values.get(f)
+                    for f in self.key_fields)
+        return key[0] if len(key) == 1 else key
+
+    def resolve(self, row, values):
+        """Turn foreign-key columns of ``row`` into ``*_id`` entries of ``values``."""
+
+    def clean(self, field_name, raw):
+        field = self.model._meta.get_field(field_name)
+        if isinstance(raw, str):
+            raw = raw.strip()
+        if raw in (None, ""):
+            if field.null:
+                return None
+            if field.has_default():
+                return field.get_default()
+            if field.blank:
+                return ""
+            raise ImportRowError(f"{field_name}: this field is required")
+        if isinstance(field, models.BooleanField) and isinstance(raw, str):
+            lowered = raw.lower()
+            raw = True if lowered in TRUE_VALUES else False if lowered in FALSE_VALUES else raw
+        try:
+            return field.clean(raw, None)
+        except ValidationError as exc:
+            raise ImportRowError(f"{field_name}: {' '.join(exc.messages)}")
+
+    def build(self, row):
+        for column in self.required:
+            if not str(row.get(column) or "").strip():
+                raise ImportRowError(f"{column}: this column is required")
+        values = {}
+        for column, field_name in self.columns.items():
+            if column in row:
+                values[field_name] = self.clean(field_name, row[column])
+        self.resolve(row, values)
+        return values
+
+    def run(self, rows):
+        """Import ``rows`` from read_rows(); yields running counts after every batch."""
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                break
+            pending, sources = {}, {}
+            for line_no, row in batch:
+                try:
+                    if isinstance(row, ImportRowError):
+                        raise row
+                    values = self.build(row)
+                    key = self.key_for(values)
+                    if self.keys.get(key) is AMBIGUOUS:
+                        raise ImportRowError(f"several existing {self.label} match this row")
+                except ImportRowError as exc:
+                    self.reject(line_no, row, exc)
+                    continue
+                # A key repeated in one batch keeps its last row.
+                pending.setdefault(key, {}).update(values)
+                sources.setdefault(key, []).append((line_no, row))
+                self.counts["rows"] += 1
+            with transaction.atomic():
+                for key, error in self.check(pending).items():
+                    del pending[key]
+                    for line_no, row in sources[key]:
+                        self.counts["rows"] -= 1
+                        self.reject(line_no, row, ImportRowError(error))
+                self.write(pending)
+            yield self.counts
+
+    def check(self, pending):
+        """Return {key: error} for the rows of ``pending`` to reject; runs in the batch's transaction."""
+        return {}
+
+    def reject(self, line_no, row, error):
+        self.counts["rejected"] += 1
+        self.rejected.append((line_no, row if isinstance(row, dict) else {}, str(error)))
+
+    def write(self, pending):
+        now = timezone.now()
+        new, same_values = [], {}
+        for key, values in pending.items():
+            pk = self.keys.get(key)
+            if pk is None:
+                new.append(self.model(**values, created_by=self.username))
+            else:
+                changes = {f: v for f, v in values.items() if f not in self.key_fields}
+                same_values.setdefault(tuple(sorted(changes.items())), []).append(pk)
+
+        if new:
+            self.model.objects.bulk_create(new, batch_size=self.batch_size)
+            self.counts["created"] += len(new)
+            self.map_created(new)
+            created = (self.keys.get(self.key_of(obj)) for obj in new)
+            self.mark_written(pk for pk in created if pk not in (None, AMBIGUOUS))
+
+        # Rows that get identical values share one UPDATE ... WHERE id IN (...);
+        # the rest go through bulk_update, grouped by the columns they set.
+        by_fields = {}
+        for items, pks in same_values.items():
+            if len(pks) > 1:
+                self.model.objects.filter(pk__in=pks).update(
+                    **dict(items), updated_by=self.username, updated_at=now
+                )
+            else:
+                obj = self.model(pk=pks[0], **dict(items), updated_by=self.username, updated_at=now)
+                by_fields.setdefault(tuple(field for field, _ in items), []).append(obj)
+            self.counts["updated"] += len(pks)
+            self.mark_written(pks)
+        for fields, objs in by_fields.items():
+            self.model.objects.bulk_update(objs, [*fields, "updated_by", "updated_at"], batch_size=100)
+        if pending:
+            bump_model_versions(self.model)
+
+    def map_created(self, new):
+        """Add the rows ``new`` just inserted to the key map."""
+        if all(obj.pk for obj in new):
+            self.merge_keys({self.key_of(obj): obj.pk for obj in new})
+            return
+        # MySQL does not return primary keys from bulk inserts, so read the rows
+        # back by their natural key. Rows another writer inserted under the same
+        # key in the meantime are found too and make that key ambiguous.
+        keys = {self.key_of(obj) for obj in new}
+        lookups = {f"{f}__in": {getattr(obj, f) for obj in new} for f in self.key_fields}
+        found = self.load_keys(self.model.objects.filter(**lookups))
+        self.merge_keys({key: pk for key, pk in found.items() if key in keys})
+
+    def mark_written(self, pks):
+        """Hook: the rows ``pks`` were just created or updated."""
+
+    def after_import(self):
+        rebuild_dashboard_stats()
+
+
+class _IndexedImporter(ModelImporter):
+    search_kind = None
+
+    def __init__(self, *args, **kwargs):
+        self.written = set()
+        super().__init__(*args, **kwargs)
+
+    def mark_written(self, pks):
+        self.written.update(pks)
+
+    def after_import(self):
+        reindex_objects(self.search_kind, self.written, batch_size=self.batch_size)
+        super().after_import()
+
+
+class ClientImporter(_IndexedImporter):
+    model = Client
+    key_fields = ("Client_name",)
+    columns = {"name": "Client_name", "status": "status"}
+    required = ("name",)
+    label = "clients"
+    search_kind = "client"
+
+
+class MemberImporter(_IndexedImporter):
+    model = Member
+    key_fields = ("name",)
+    columns = {"name": "name", "role": "role"}
+    required = ("name", "role")
+    label = "members"
+    search_kind = "member"
+
+
+class ProjectImporter(_IndexedImporter):
+    model = Project
+    key_fields = ("client_id", "name")
+    columns = {
+        "name": "name", "type": "type", "status": "status",
+        "start_date": "start_date", "end_date": "end_date",
+        "hosting_provider": "hosting_provider", "github_repo": "github_repo",
+        "live_url": "live_url", "description": "description",
+    }
+    required = ("name", "client", "type")
+    label = "projects"
+    search_kind = "project"
+
+    def __init__(self, *args, **kwargs):
+        self.clients = _name_map(Client.objects.all(), "Client_name")
+        super().__init__(*args, **kwargs)
+
+    def resolve(self, row, values):
+        client_id = self.clients.get(name_key(row["client"]))
+        if client_id is None:
+            raise ImportRowError(f"client: no client named {row['client']!r}")
+        if client_id is AMBIGUOUS:
+            raise ImportRowError(f"client: several clients are named {row['client']!r}")
+        values["client_id"] = client_id
+
+    def after_import(self):
+        # Updated statuses can move members in or out of engagement.
+        if self.counts["updated"]:
+            Member.objects.refresh_engagement()
+        super().after_import()
+
+
+class AssignmentImporter(ModelImporter):
+    model = MemberAssigned
+    key_fields = ("member_id", "project_id")
+    columns = {"assigned_from": "assigned_from", "assigned_to": "assigned_to", "is_active": "is_active"}
+    required = ("member", "project")
+    label = "assignments"
+
+    def __init__(self, *args, **kwargs):
+        self.members = _name_map(Member.objects.all(), "name")
+        self.projects = _name_map(Project.objects.all(), "client__Client_name", "name")
+        self.projects_by_name = _name_map(Project.objects.all(), "name")
+        self.member_ids = set()
+        super().__init__(*args, **kwargs)
+
+    def load_keys(self, queryset):
+        # Duplicate (member, project) pairs are legal; update the oldest one.
+        keys = {}
+        for member_id, project_id, pk in queryset.values_list(
+            "member_id", "project_id", "pk"
+        ).order_by("-pk").iterator(chunk_size=5000):
+            keys[member_id, project_id] = pk
+        return keys
+
+    def merge_keys(self, keys):
+        for key, pk in keys.items():
+            self.keys.setdefault(key, pk)
+
+    def resolve(self, row, values):
+        member_id = self.members.get(name_key(row["member"]))
+        if member_id is None:
+            raise ImportRowError(f"member: no member named {row['member']!r}")
+        if member_id is AMBIGUOUS:
+            raise ImportRowError(f"member: several members are named {row['member']!r}")
+
+        client = str(row.get("client") or "").strip()
+        if client:
+            project_id = self.projects.get((name_key(client), name_key(row["project"])))
+        else:
+            project_id = self.projects_by_name.get(name_key(row["project"]))
+        if project_id is None:
+            raise ImportRowError(f"project: no project named {row['project']!r}")
+        if project_id is AMBIGUOUS:
+            raise ImportRowError(f"project: {row['project']!r} is ambiguous; add a client column")
+
+        values["member_id"], values["project_id"] = member_id, project_id
+        self.member_ids.add(member_id)
+
+    def check(self, pending):
+        # The rows as they will be after this batch: stored ones with the new values applied
+        existing = self.model.objects.in_bulk([self.keys[key] for key in pending if key in self.keys])
+        keys, objs = list(pending), []
+        for key in keys:
+            obj = existing.get(self.keys.get(key)) or self.model()
+            for field, value in pending[key].items():
+                setattr(obj, field, value)
+            objs.append(obj)
+        lock_members(obj.member_id for obj in objs)
+        try:
+            check_assignments(objs)
+        except AssignmentOverlap as exc:
+            return {keys[index]: message for index, message in exc.errors.items()}
+        return {}
+
+    def after_import(self):
+        member_ids = sorted(self.member_ids)
+        for start in range(0, len(member_ids), self.batch_size):
+            Member.objects.filter(pk__in=member_ids[start:start + self.batch_size]).refresh_engagement()
+        super().after_import()
+
+
+IMPORTERS = {
+    "clients": ClientImporter,
+    "members": MemberImporter,
+    "projects": ProjectImporter,
+    "assignments": AssignmentImporter,
+}
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.overlaps import describe, iter_overlaps
+
+
+class Command(BaseCommand):
+    help = (
+        "List pairs of active assignments of the same member to the same project whose "
+        "date ranges overlap (rows written before the write-time check, or by the importer). "
+        "Reads the table in one ordered pass."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--limit", type=int, default=100, help="Print at most N pairs (the count is always exact).")
+        parser.add_argument("--fail", action="store_true", help="Exit with an error when any overlap is found.")
+
+    def handle(self, *args, **options):
+        found = 0
+        for earlier, later in iter_overlaps(chunk_size=options["chunk_size"]):
+            found += 1
+            if found <= options["limit"]:
+                self.stdout.write(
+                    f"member {later[1]} project {later[2]}: "
+                    f"#{earlier[0]} ({describe(*earlier[3:])}) overlaps #{later[0]} ({describe(*later[3:])})"
+                )
+        if not found:
+            self.stdout.write(self.style.SUCCESS("No overlapping assignments."))
+            return
+        self.stdout.write(self.style.WARNING(f"{found} overlapping assignment(s)."))
+        if options["fail"]:
+            raise CommandError(f"{found} overlapping assignment(s) found.")
@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from core.fastpath import FastJSONRenderer, FastListPlan
+from core.models import Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity
+from core.serializers import (
+    ClientSerializer, ProjectSerializer, ProjectCredentialSerializer, TeamSerializer,
+    MemberSerializer, MemberAssignedSerializer, ProjectActivitySerializer,
+)
+
+TARGETS = {
+    "clients": (Client, ClientSerializer),
+    "projects": (Project, ProjectSerializer),
+    "credentials": (ProjectCredential, ProjectCredentialSerializer),
+    "teams": (Team, TeamSerializer),
+    "members": (Member, MemberSerializer),
+    "assignments": (MemberAssigned, MemberAssignedSerializer),
+    "activities": (ProjectActivity, ProjectActivitySerializer),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/sec of ModelSerializer + JSONRenderer against the .values() fast "
+        "path + FastJSONRenderer used by the API list endpoints, and check that both "
+        "produce identical bytes. Uses the newest --rows rows of each table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", action="append", dest="targets", choices=sorted(TARGETS),
+                            help="Table to benchmark (repeatable; default: activities and assignments).")
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per path.")
+
+    def handle(self, *args, **options):
+        for target in options["targets"] or ["activities", "assignments"]:
+            model, serializer_class = TARGETS[target]
+            queryset = model.objects.order_by("-updated_at", "-id")[:options["rows"]]
+            rows = queryset.count()
+            if not rows:
+                raise CommandError(f"No {target} to benchmark; seed some data first.")
+
+            def slow():
+                m2m = [f.name for f in model._meta.many_to_many]
+                data = serializer_class(queryset.prefetch_related(*m2m), many=True).data
+                return JSONRenderer().render(data)
+
+            def fast():
+                plan = FastListPlan.for_serializer(serializer_class(context={}))
+                data = plan.render_rows(list(queryset.values(*plan.columns)))
+                return FastJSONRenderer().render(data)
+
+            slow_time, slow_body = self.best(slow, options["repeat"])
+            fast_time, fast_body = self.best(fast, options["repeat"])
+            same = "identical output" if slow_body == fast_body else self.style.ERROR("OUTPUT DIFFERS")
+            self.stdout.write(
+                f"{target:<12} {rows} rows  serializer: {rows / slow_time:>10,.0f} rows/s  "
+                f"fast path: {rows / fast_time:>10,.0f} rows/s  ({slow_time / fast_time:.1f}x)  {same}"
+            )
+
+    def best(self, func, repeat):
+        timings, body = [], None
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            body = func()
+            timings.append(time.perf_counter() - started)
+        return min(timings), body
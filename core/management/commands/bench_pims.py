@@ -0,0 +1,88 @@
+import json
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import bench_targets, compare_reports, run_benchmark
+
+GROUPS = ("dashboard", "pages", "filter", "api")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure p50/p95 latency and queries per request of the dashboard, list pages, "
+        "ProjectFilter queries and the read endpoints under /api/ against the current "
+        "database (see seed_pims), and write a JSON report that --compare can diff "
+        "against a report from another commit."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20, help="Timed requests per target.")
+        parser.add_argument("--warmup", type=int, default=2, help="Untimed requests per target first.")
+        parser.add_argument("--group", action="append", dest="groups", choices=GROUPS,
+                            help="Only run this group of targets (repeatable).")
+        parser.add_argument("--user", help="Username to make the requests as (staff-only targets need staff).")
+        parser.add_argument("--warm-cache", action="store_true",
+                            help="Keep the API response cache between requests instead of clearing it.")
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument("--compare", help="Baseline JSON report to compare against.")
+        parser.add_argument("--max-regression", type=float, default=None,
+                            help="With --compare: fail if a target's p95 grows by more than this percentage "
+                                 "or it runs more queries than in the baseline.")
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user"]:
+            user = get_user_model().objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"No user named {options['user']!r}.")
+        if settings.DEBUG:
+            self.stderr.write(self.style.WARNING("DEBUG is on; latencies include query logging overhead."))
+
+        baseline = None
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as handle:
+                baseline = json.load(handle)
+
+        targets = [t for t in bench_targets() if not options["groups"] or t[0] in options["groups"]]
+        report = run_benchmark(
+            targets, iterations=options["iterations"], warmup=options["warmup"],
+            user=user, warm_cache=options["warm_cache"], progress=self.show,
+        )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump(report, handle, indent=2)
+                handle.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
+
+        if baseline is not None:
+            self.compare(baseline, report, options["max_regression"])
+
+    def show(self, result):
+        status = result["status"]
+        marker = "" if status == 200 else self.style.ERROR(f" HTTP {status}")
+        self.stderr.write(
+            f"{result['name'][:48]:<48} p50 {result['p50_ms']:>9.1f} ms  p95 {result['p95_ms']:>9.1f} ms  "
+            f"{result['queries']:>3} queries{marker}"
+        )
+
+    def compare(self, baseline, report, max_regression):
+        self.stdout.write(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+        regressions = []
+        for name, old, new in compare_reports(baseline, report):
+            p95_change = (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 if old["p95_ms"] else 0.0
+            query_change = new["queries"] - old["queries"]
+            line = (
+                f"{name[:48]:<48} p95 {old['p95_ms']:>9.1f} -> {new['p95_ms']:>9.1f} ms ({p95_change:+.0f}%)  "
+                f"queries {old['queries']} -> {new['queries']}"
+            )
+            regressed = max_regression is not None and (p95_change > max_regression or query_change > 0)
+            if regressed:
+                regressions.append(name)
+            self.stdout.write(self.style.ERROR(line) if regressed else line)
+        if regressions:
+            raise CommandError(f"Regressions in: {', '.join(regressions)}")
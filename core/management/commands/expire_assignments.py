@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from core.expiry import expire_assignments
+
+
+class Command(BaseCommand):
+    help = (
+        "Deactivate active assignments whose assigned_to is before today, in batches of one "
+        "UPDATE each. Safe to run from cron while users are editing, e.g. "
+        "'15 0 * * * python manage.py expire_assignments'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", help="Expire assignments that ended before this date (default: today).")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--user", default="system", help="Recorded as updated_by.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count what would be expired.")
+
+    def handle(self, *args, **options):
+        today = None
+        if options["date"]:
+            today = parse_date(options["date"])
+            if today is None:
+                raise CommandError("--date must be YYYY-MM-DD.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        result = expire_assignments(
+            today=today, batch_size=options["batch_size"], username=options["user"], dry_run=options["dry_run"],
+        )
+        if options["dry_run"]:
+            self.stdout.write(f"{result['expired']} assignment(s) of {result['members']} member(s) would be expired.")
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Expired {result['expired']} assignment(s) of {result['members']} member(s) "
+            f"in {result['batches']} batch(es)."
+        ))
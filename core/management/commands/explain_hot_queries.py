@@ -0,0 +1,128 @@
+import json
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.filters import ProjectFilter
+from core.models import Client, Project, Member, MemberAssigned, ProjectActivity, DashboardStat
+
+
+def hot_queries():
+    """
+    (name, queryset, bounded) for the queries behind the dashboard, the list
+    pages and ProjectFilter. ``bounded`` marks tables that stay tiny no matter
+    how large the org gets, where a scan is expected and harmless.
+    """
+    page = ("-updated_at", "-id")
+    page_client_ids = list(Client.objects.order_by(*page).values_list("id", flat=True)[:26]) or [0]
+    queries = [
+        ("dashboard: stats snapshot", DashboardStat.objects.values_list("key", "value"), True),
+        ("dashboard: HOT assignments", MemberAssigned.objects.filter(
+            is_active=True, project__status="hot"
+        ).order_by("-updated_at", "-id").values(
+            "id", "member__name", "project__name", "project__status", "project__client__Client_name"
+        )[:26], False),
+        ("dashboard: recent activities", ProjectActivity.objects.select_related(
+            "project", "project__client"
+        ).order_by("-updated_at")[:10], False),
+        ("stats rebuild: clients by status", Client.objects.values("status").order_by(), False),
+        ("stats rebuild: projects by status", Project.objects.values("status").order_by(), False),
+        ("clients list", Client.objects.with_project_summary().order_by(*page)[:26], False),
+        ("clients list ?status=hot", Client.objects.with_project_summary().filter(
+            status="hot"
+        ).order_by(*page)[:26], False),
+        # The project_summaries prefetch that with_project_summary() adds to a clients page
+        ("clients list: page projects", Project.objects.filter(client_id__in=page_client_ids).only(
+            "id", "name", "status", "client_id"
+        ).order_by("name", "id"), False),
+        ("projects list", Project.objects.order_by(*page)[:26], False),
+        ("projects list ?status=active", Project.objects.filter(status="active").order_by(*page)[:26], False),
+        ("members list", Member.objects.order_by(*page)[:26], False),
+        ("members list ?status=current", Member.objects.current().order_by(*page)[:26], False),
+        ("stats: current members", Member.objects.current().values("id"), False),
+    ]
+    filter_params = (
+        {"status": "active"},
+        {"status": "hot", "type": "client"},
+        {"start_year": "2024"},
+        {"client": "acme"},
+    )
+    for params in filter_params:
+        label = "&".join(f"{k}={v}" for k, v in params.items())
+        queries.append((f"ProjectFilter ?{label}", ProjectFilter(params, queryset=Project.objects.all()).qs, False))
+    return queries
+
+
+# ======================================================
+# 🔍 Plan classification per backend
+# ======================================================
+def _mysql_tables(node):
+    if isinstance(node, dict):
+        if "table_name" in node and "access_type" in node:
+            yield node
+        for value in node.values():
+            yield from _mysql_tables(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _mysql_tables(value)
+
+
+def classify_plan(queryset):
+    """Return (plan_text, full_scans, indexes) for ``queryset`` on the default database."""
+    vendor = connection.vendor
+    if vendor == "mysql":
+        plan = queryset.explain(format="json")
+        scans, indexes = [], []
+        for table in _mysql_tables(json.loads(plan)):
+            if table["access_type"] == "ALL":
+                scans.append(table["table_name"])
+            elif table.get("key"):
+                indexes.append(table["key"])
+        return plan, scans, indexes
+    plan = queryset.explain()
+    if vendor == "postgresql":
+        scans = re.findall(r"Seq Scan on (\w+)", plan)
+        indexes = re.findall(r"Index (?:Only )?Scan(?: Backward)? using (\w+)", plan)
+        return plan, scans, indexes
+    if vendor == "sqlite":
+        scans = re.findall(r"SCAN (\w+)(?!.*USING)$", plan, flags=re.MULTILINE)
+        indexes = re.findall(r"USING (?:COVERING )?INDEX (\w+)", plan)
+        return plan, scans, indexes
+    raise CommandError(f"EXPLAIN classification is not implemented for {vendor}.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the dashboard, list-page and ProjectFilter queries and report "
+        "whether each one uses an index or a full table scan. Run it against a "
+        "realistically sized database; on tiny tables the optimizer may prefer scans."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true", help="Print the raw plan for every query.")
+        parser.add_argument("--fail-on-scan", action="store_true",
+                            help="Exit with an error if an unbounded query does a full table scan.")
+
+    def handle(self, *args, **options):
+        unexpected = []
+        for name, queryset, bounded in hot_queries():
+            plan, scans, indexes = classify_plan(queryset)
+            if scans and bounded:
+                verdict = self.style.WARNING("SCAN (bounded table)")
+            elif scans:
+                verdict = self.style.ERROR("FULL SCAN")
+                unexpected.append(name)
+            else:
+                verdict = self.style.SUCCESS("INDEX")
+            detail = []
+            if indexes:
+                detail.append("indexes: " + ", ".join(dict.fromkeys(indexes)))
+            if scans:
+                detail.append("scans: " + ", ".join(dict.fromkeys(scans)))
+            self.stdout.write(f"{name:<40} {verdict}  {'; '.join(detail)}")
+            if options["verbose_plans"]:
+                self.stdout.write(plan + "\n")
+
+        if unexpected and options["fail_on_scan"]:
+            raise CommandError(f"Full table scans in: {', '.join(unexpected)}")
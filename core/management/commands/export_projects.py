@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from core.exports import EXPORT_FORMATS, export_lines, iter_project_rows
+from core.models import Project
+
+
+class Command(BaseCommand):
+    help = "Export projects with client, teams, active members and latest activity as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", dest="fmt", choices=sorted(EXPORT_FORMATS), default="csv")
+        parser.add_argument("--output", "-o", help="File to write to (default: stdout).")
+        parser.add_argument("--status", help="Only export projects with this status.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.all()
+        if options["status"]:
+            queryset = queryset.filter(status=options["status"])
+        lines = export_lines(options["fmt"], iter_project_rows(queryset, chunk_size=options["chunk_size"]))
+
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+        count = -1 if options["fmt"] == "csv" else 0
+        with open(options["output"], "w", newline="", encoding="utf-8") as handle:
+            for line in lines:
+                handle.write(line)
+                count += 1
+        self.stderr.write(self.style.SUCCESS(f"Exported {count} projects to {options['output']}"))
@@ -0,0 +1,69 @@
+import csv
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.importer import IMPORTERS, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Import clients, members, projects or assignments from a CSV or NDJSON file. "
+        "Rows are upserted on their natural key (client name, member name, client + "
+        "project name, member + project); import clients and members before the "
+        "projects and assignments that refer to them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(IMPORTERS))
+        parser.add_argument("path")
+        parser.add_argument("--format", dest="fmt", choices=["csv", "ndjson"],
+                            help="File format (default: from the file extension).")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--rejects", help="Write rejected rows, with the reason, to this file.")
+        parser.add_argument("--user", default="import", help="Value for created_by / updated_by.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"No such file: {path}")
+        fmt = options["fmt"] or ("csv" if path.lower().endswith(".csv") else "ndjson")
+
+        importer = IMPORTERS[options["kind"]](options["user"], batch_size=options["batch_size"])
+        started = time.monotonic()
+        for counts in importer.run(read_rows(path, fmt)):
+            self.stdout.write(
+                f"{options['kind']}: {counts['rows'] + counts['rejected']} rows read, "
+                f"{counts['created']} created, {counts['updated']} updated, {counts['rejected']} rejected",
+                ending="\r",
+            )
+        self.stdout.write("")
+        self.stdout.write("Refreshing search index, engagement counters and dashboard stats...")
+        importer.after_import()
+
+        counts = importer.counts
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['kind']}: {counts['created']} created, {counts['updated']} updated, "
+            f"{counts['rejected']} rejected in {time.monotonic() - started:.1f}s"
+        ))
+        for line_no, _, error in importer.rejected[:20]:
+            self.stdout.write(self.style.WARNING(f"  line {line_no}: {error}"))
+        if len(importer.rejected) > 20:
+            self.stdout.write(self.style.WARNING(f"  ... and {len(importer.rejected) - 20} more"))
+        if options["rejects"] and importer.rejected:
+            self.write_rejects(options["rejects"], fmt, importer.rejected)
+
+    def write_rejects(self, path, fmt, rejected):
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            if fmt == "csv":
+                columns = list(dict.fromkeys(column for _, row, _ in rejected for column in row))
+                writer = csv.DictWriter(handle, fieldnames=["line", "error", *columns])
+                writer.writeheader()
+                for line_no, row, error in rejected:
+                    writer.writerow({**row, "line": line_no, "error": error})
+            else:
+                for line_no, row, error in rejected:
+                    handle.write(json.dumps({"line": line_no, "error": error, "row": row}) + "\n")
+        self.stdout.write(f"Rejected rows written to {path}")
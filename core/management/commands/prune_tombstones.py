@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.changes import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete delete-tombstones older than CHANGES_TOMBSTONE_RETENTION_DAYS. Changes-feed "
+        "cursors older than that get 410 Gone and must download the collection again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.CHANGES_TOMBSTONE_RETENTION_DAYS)
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones(options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} tombstone(s) older than {options['days']} days."))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from core.stats import rebuild_dashboard_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the dashboard statistics snapshot from the source tables."
+
+    def handle(self, *args, **options):
+        stats = rebuild_dashboard_stats()
+        for key in sorted(stats):
+            self.stdout.write(f"{key}: {stats[key]}")
+        self.stdout.write(self.style.SUCCESS("Dashboard stats rebuilt."))
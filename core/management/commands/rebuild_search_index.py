@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core.search import INDEXED, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the word-prefix search index for clients, projects and members."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind", action="append", dest="kinds", choices=sorted(INDEXED),
+                            help="Only rebuild this kind (repeatable).")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        counts = {}
+        for kind, done in rebuild_index(options["kinds"] or None, batch_size=options["batch_size"]):
+            counts[kind] = done
+            self.stdout.write(f"{kind}: {done} indexed", ending="\r")
+        self.stdout.write("")
+        for kind, done in counts.items():
+            self.stdout.write(self.style.SUCCESS(f"{kind}: {done} objects indexed"))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:25
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_updated_at(apps, schema_editor):
+    for model_name in ('ProjectCredential', 'Team', 'MemberAssigned', 'ProjectActivity'):
+        model = apps.get_model('core', model_name)
+        model.objects.filter(updated_at__isnull=True).update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_list_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='memberassigned',
+            index=models.Index(fields=['updated_at', 'id'], name='assignment_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectactivity',
+            index=models.Index(fields=['updated_at', 'id'], name='activity_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectcredential',
+            index=models.Index(fields=['updated_at', 'id'], name='credential_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['updated_at', 'id'], name='team_updated_id_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_api_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['status', 'updated_at', 'id'], name='client_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='memberassigned',
+            index=models.Index(fields=['is_active', 'project'], name='assignment_active_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'updated_at', 'id'], name='project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['start_date'], name='project_start_date_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:28
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_assignment_count(apps, schema_editor):
+    Member = apps.get_model('core', 'Member')
+    MemberAssigned = apps.get_model('core', 'MemberAssigned')
+    engaged = MemberAssigned.objects.filter(
+        member=OuterRef('pk'), is_active=True, project__status__in=('active', 'hot'),
+    ).order_by().values('member').annotate(n=Count('id')).values('n')
+    Member.objects.update(active_assignment_count=Coalesce(Subquery(engaged), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='member',
+            name='active_assignment_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_active_assignment_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_member_active_assignment_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=15)),
+                ('kind', models.CharField(choices=[('client', 'Client'), ('project', 'Project'), ('member', 'Member')], max_length=10)),
+                ('object_id', models.BigIntegerField()),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['token', 'kind', 'object_id', 'weight'], name='search_token_idx'), models.Index(fields=['kind', 'object_id'], name='search_object_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_searchtoken'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='memberassigned',
+            index=models.Index(fields=['member', 'assigned_from', 'assigned_to'], name='assignment_member_range_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+from django.db.models.functions import Length
+
+
+def drop_short_tokens(apps, schema_editor):
+    # core.search.MIN_PREFIX went from 2 to 3; nothing queries these rows any more
+    SearchToken = apps.get_model('core', 'SearchToken')
+    SearchToken.objects.annotate(size=Length('token')).filter(size__lt=3).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_short_tokens, migrations.RunPython.noop),
+    ]
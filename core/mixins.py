@@ -0,0 +1,254 @@
+import copy
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .caching import bump_model_versions
+
+
+# ======================================================
+# 📦 Bulk writes for API ViewSets
+# ======================================================
+class BulkWriteMixin:
+    """
+    Adds ``/bulk/`` to a BaseAutoUserViewSet:
+
+    - POST   a list of objects      -> bulk_create
+    - PATCH  a list of {"id", ...}  -> partial bulk_update
+    - DELETE {"ids": [...]}         -> one filtered delete
+
+    Creates and updates are all-or-nothing: when any item fails validation
+    nothing is written and ``errors`` holds one entry per item (null when
+    that item was valid). Meant for models without many-to-many fields.
+    """
+    bulk_batch_size = 500
+
+    def _bulk_items(self, data):
+        if not isinstance(data, list) or not data:
+            raise ValidationError({"detail": "Expected a non-empty list of objects."})
+        if len(data) > settings.API_BULK_MAX_ITEMS:
+            raise ValidationError({"detail": f"At most {settings.API_BULK_MAX_ITEMS} items per request."})
+        return data
+
+    def _bulk_ids(self, values):
+        try:
+            return [None if pk is None else int(pk) for pk in values]
+        except (TypeError, ValueError):
+            raise ValidationError({"ids": ["Ids must be integers."]})
+
+    def before_bulk_write(self, objs):
+        """
+        Hook run inside the write transaction, before the rows are written.
+        Return one error (or None) per item to reject the whole request.
+        """
+        return None
+
+    def after_bulk_write(self, objs, previous=()):
+        """
+        Hook for work that row signals would normally do, since bulk_create and
+        bulk_update skip them. ``previous`` holds pre-update copies on PATCH.
+        Runs once per request, after every object has its id.
+        """
+
+    def _bulk_insert(self, model, objs, username):
+        """
+        ``bulk_create`` on every backend. MySQL does not report the ids of a
+        multi-row INSERT, so there the rows go in under a one-off
+        ``created_by`` marker, are re-selected by it in id order (the order
+        they were inserted) and then get the real username back.
+        """
+        if connections[model.objects.db].features.can_return_rows_from_bulk_insert:
+            model.objects.bulk_create(objs, batch_size=self.bulk_batch_size)
+            return
+        marker = f"bulk:{uuid.uuid4().hex}"
+        for obj in objs:
+            obj.created_by = marker
+        model.objects.bulk_create(objs, batch_size=self.bulk_batch_size)
+        inserted = model.objects.filter(created_by=marker)
+        for obj, pk in zip(objs, inserted.order_by("pk").values_list("pk", flat=True)):
+            obj.pk = pk
+            obj.created_by = username
+        inserted.update(created_by=username)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        items = self._bulk_items(request.data)
+        serializers = [self.get_serializer(data=item) for item in items]
+        errors = [None if s.is_valid() else s.errors for s in serializers]
+        if any(errors):
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self.get_queryset().model
+        username = request.user.username
+        objs = [model(**s.validated_data, created_by=username) for s in serializers]
+        with transaction.atomic():
+            errors = self.before_bulk_write(objs)
+            if errors:
+                return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+            self._bulk_insert(model, objs, username)
+            self.after_bulk_write(objs)
+            bump_model_versions(model)
+        data = self.get_serializer(objs, many=True).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    @bulk_create.mapping.patch
+    def bulk_update(self, request):
+        items = self._bulk_items(request.data)
+        ids = self._bulk_ids([item.get("id") if isinstance(item, dict) else None for item in items])
+        instances = self.get_queryset().in_bulk([pk for pk in ids if pk is not None])
+
+        errors, serializers, seen = [], [], set()
+        for pk, item in zip(ids, items):
+            instance = instances.get(pk)
+            if instance is None:
+                errors.append({"id": ["Unknown or missing id."]})
+            elif pk in seen:
+                errors.append({"id": ["Duplicate id in request."]})
+            else:
+                serializer = self.get_serializer(instance, data=item, partial=True)
+                errors.append(None if serializer.is_valid() else serializer.errors)
+                serializers.append(serializer)
+            seen.add(pk)
+        if any(errors):
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        now = timezone.now()
+        username = request.user.username
+        fields = {"updated_by", "updated_at"}
+        objs, previous = [], []
+        for serializer in serializers:
+            obj = serializer.instance
+            previous.append(copy.copy(obj))
+            for field, value in serializer.validated_data.items():
+                setattr(obj, field, value)
+                fields.add(field)
+            obj.updated_by = username
+            obj.updated_at = now
+            objs.append(obj)
+
+        model = self.get_queryset().model
+        with transaction.atomic():
+            errors = self.before_bulk_write(objs)
+            if errors:
+                return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+            model.objects.bulk_update(objs, sorted(fields), batch_size=self.bulk_batch_size)
+            self.after_bulk_write(objs, previous)
+            bump_model_versions(model)
+        return Response(self.get_serializer(objs, many=True).data)
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else request.data
+        if not isinstance(ids, list) or not ids:
+            raise ValidationError({"ids": ["Expected a non-empty list of ids."]})
+        if len(ids) > settings.API_BULK_MAX_ITEMS:
+            raise ValidationError({"ids": [f"At most {settings.API_BULK_MAX_ITEMS} ids per request."]})
+        ids = self._bulk_ids(ids)
+
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(pk__in=ids)
+            found = set(queryset.values_list("pk", flat=True))
+            deleted = queryset.delete()[1].get(queryset.model._meta.label, 0) if found else 0
+        missing = [pk for pk in ids if pk not in found]
+        return Response({"deleted": deleted, "not_found": missing})
+
+
+# ======================================================
+# ✂️ Sparse fieldsets and relation expansion
+# ======================================================
+class SparseFieldsMixin:
+    """
+    ``?fields=a,b`` limits list/retrieve output to those fields and loads only
+    their columns with ``.only()``; ``?expand=x,y`` inlines the related objects
+    the serializer lists in ``expandable_fields`` and joins or prefetches them.
+    Many-to-many fields left in the output are prefetched too, in pk order
+    like FastListPlan reads them.
+    """
+    SPARSE_ACTIONS = ("list", "retrieve")
+
+    @staticmethod
+    def _prefetch_in_pk_order(lookup, model):
+        return Prefetch(lookup, queryset=model.objects.order_by("pk"))
+
+    def _query_list(self, param):
+        raw = self.request.query_params.get(param, "") if self.request else ""
+        return list(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+
+    def get_sparse_fields(self):
+        if self.action not in self.SPARSE_ACTIONS:
+            return []
+        if not hasattr(self, "_sparse_fields"):
+            fields = self._query_list("fields")
+            if fields:
+                known = self.get_serializer_class()(context={}).get_fields()
+                unknown = [name for name in fields if name not in known]
+                if unknown:
+                    raise ValidationError({"fields": [f"Unknown field(s): {', '.join(unknown)}."]})
+            self._sparse_fields = fields
+        return self._sparse_fields
+
+    def get_expansions(self):
+        if self.action not in self.SPARSE_ACTIONS:
+            return []
+        expand = self._query_list("expand")
+        allowed = self.get_serializer_class().expandable_fields
+        unknown = [name for name in expand if name not in allowed]
+        if unknown:
+            raise ValidationError({"expand": [f"Cannot expand: {', '.join(unknown)}."]})
+        fields = self.get_sparse_fields()
+        return [name for name in expand if not fields or name in fields]
+
+    def get_expanded_models(self):
+        model = self.queryset.model
+        return tuple(model._meta.get_field(name).related_model for name in self.get_expansions())
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in self.SPARSE_ACTIONS:
+            context["fields"] = self.get_sparse_fields()
+            context["expand"] = self.get_expansions()
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in self.SPARSE_ACTIONS:
+            return queryset
+        model = queryset.model
+        fields, expand = self.get_sparse_fields(), self.get_expansions()
+
+        for name in expand:
+            field = model._meta.get_field(name)
+            if field.many_to_one or field.one_to_one:
+                queryset = queryset.select_related(name)
+            else:
+                queryset = queryset.prefetch_related(self._prefetch_in_pk_order(name, field.related_model))
+            # The nested serializer renders the related model's own m2m ids.
+            for m2m in field.related_model._meta.many_to_many:
+                queryset = queryset.prefetch_related(
+                    self._prefetch_in_pk_order(f"{name}__{m2m.name}", m2m.related_model)
+                )
+
+        for m2m in model._meta.many_to_many:
+            if m2m.name not in expand and (not fields or m2m.name in fields):
+                queryset = queryset.prefetch_related(self._prefetch_in_pk_order(m2m.name, m2m.related_model))
+
+        if fields:
+            # id and updated_at drive keyset pagination and the validators.
+            columns = {"id", "updated_at"}
+            for name in fields:
+                try:
+                    field = model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    continue
+                if field.concrete and not field.many_to_many:
+                    columns.add(name)
+            queryset = queryset.only(*columns)
+        return queryset
@@ -1,7 +1,27 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .caching import bump_model_versions
 
 
 # ------------------ CLIENT ------------------
+class ClientQuerySet(models.QuerySet):
+    def with_project_summary(self):
+        """
+        Prefetch the projects of the clients actually loaded into
+        ``project_summaries``; the counts are taken from them, so a page costs
+        one extra query however many clients and projects exist.
+        """
+        return self.prefetch_related(models.Prefetch(
+            'project_set',
+            queryset=Project.objects.only('id', 'name', 'status', 'client_id').order_by('name', 'id'),
+            to_attr='project_summaries',
+        ))
+
+
 class Client(models.Model):
     STATUS_CHOICES = [
         ('active', 'Active'),
@@ -16,11 +36,48 @@ class Client(models.Model):
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    objects = ClientQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='client_updated_id_idx'),
+            models.Index(fields=['status', 'updated_at', 'id'], name='client_status_idx'),
+        ]
+
     def __str__(self):
         return self.Client_name
 
+    @property
+    def project_count(self):
+        """Number of projects; requires Client.objects.with_project_summary()."""
+        return len(self.project_summaries)
+
+    def project_status_counts(self):
+        """Per-status project counts; requires Client.objects.with_project_summary()."""
+        counts = Counter(project.status for project in self.project_summaries)
+        return {key: counts[key] for key, _ in Project.STATUS_CHOICES}
+
 
 # ------------------ PROJECT ------------------
+class ProjectQuerySet(models.QuerySet):
+    def for_dossier(self):
+        """
+        Client, credentials, assignments with their members, teams with their
+        members and activity logs: one query for the projects plus five
+        prefetches, however much each project has.
+        """
+        return self.select_related('client').prefetch_related(
+            models.Prefetch('credentials', queryset=ProjectCredential.objects.order_by('key', 'id')),
+            models.Prefetch(
+                'memberassigned_set',
+                queryset=MemberAssigned.objects.select_related('member').order_by('-is_active', 'member__name', 'id'),
+            ),
+            models.Prefetch('teams_assigned', queryset=Team.objects.order_by('team_type', 'id')),
+            models.Prefetch('teams_assigned__members', queryset=Member.objects.order_by('name', 'id')),
+            models.Prefetch('activity_logs', queryset=ProjectActivity.objects.order_by('-created_at', '-id')),
+        )
+
+
 class Project(models.Model):
     PROJECT_TYPES = [
         ('internal', 'Internal'),
@@ -33,6 +90,8 @@ class Project(models.Model):
         ('hot', 'Hot'),
         ('dead', 'Dead'),
     ]
+    # Statuses whose active assignments count a member as "currently working"
+    ENGAGED_STATUSES = ('active', 'hot')
 
     name = models.CharField(max_length=100)
     client = models.ForeignKey(Client, on_delete=models.CASCADE)
@@ -50,11 +109,67 @@ class Project(models.Model):
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    objects = ProjectQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='project_updated_id_idx'),
+            models.Index(fields=['status', 'updated_at', 'id'], name='project_status_idx'),
+            models.Index(fields=['start_date'], name='project_start_date_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
 
 # ------------------ PROJECT CREDENTIAL ------------------
+class ProjectCredentialQuerySet(models.QuerySet):
+    @transaction.atomic
+    def sync(self, project, pairs, username):
+        """
+        Make ``project``'s credentials match the submitted (key, value) pairs.
+        Only rows that actually change are touched, with at most one delete,
+        one bulk update and one bulk insert; unchanged rows keep their audit
+        columns. Blank pairs are ignored and a repeated key keeps its last value.
+        """
+        wanted = {}
+        for key, value in pairs:
+            key, value = key.strip(), value.strip()
+            if key and value:
+                wanted[key] = value
+
+        existing, stale = {}, []
+        for credential in self.filter(project=project).order_by('id'):
+            if credential.key in wanted and credential.key not in existing:
+                existing[credential.key] = credential
+            else:
+                stale.append(credential.pk)
+
+        now = timezone.now()
+        changed = []
+        for key, credential in existing.items():
+            if credential.value != wanted[key]:
+                credential.value = wanted[key]
+                credential.updated_by = username
+                credential.updated_at = now
+                changed.append(credential)
+
+        new = [
+            self.model(project=project, key=key, value=value, created_by=username)
+            for key, value in wanted.items() if key not in existing
+        ]
+
+        if stale:
+            self.filter(pk__in=stale).delete()
+        if changed:
+            self.bulk_update(changed, ['value', 'updated_by', 'updated_at'])
+        if new:
+            self.bulk_create(new)
+        if changed or new:
+            # bulk_update/bulk_create send no post_save, so cached responses are invalidated here.
+            bump_model_versions(self.model)
+
+
 class ProjectCredential(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='credentials')
     key = models.CharField(max_length=100)
@@ -64,6 +179,13 @@ class ProjectCredential(models.Model):
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    objects = ProjectCredentialQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='credential_updated_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.project.name} - {self.key}"
 
@@ -77,11 +199,48 @@ class Team(models.Model):
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='team_updated_id_idx'),
+        ]
+
     def __str__(self):
         return self.team_type
 
 
 # ------------------ MEMBER ------------------
+def engaged_assignments_subquery():
+    """Per-member count of active assignments on active/hot projects, for use in UPDATE/annotate."""
+    return Coalesce(models.Subquery(
+        MemberAssigned.objects.filter(
+            member=models.OuterRef('pk'),
+            is_active=True,
+            project__status__in=Project.ENGAGED_STATUSES,
+        ).order_by().values('member').annotate(n=models.Count('id')).values('n')
+    ), 0)
+
+
+class MemberQuerySet(models.QuerySet):
+    def current(self):
+        return self.filter(active_assignment_count__gt=0)
+
+    def past(self):
+        return self.filter(active_assignment_count=0)
+
+    def refresh_engagement(self):
+        """
+        Recompute active_assignment_count for these members in one UPDATE.
+        Only members whose count changes get a new updated_at.
+        """
+        fresh = engaged_assignments_subquery()
+        updated = self.annotate(fresh_count=fresh).exclude(active_assignment_count=models.F('fresh_count')).update(
+            active_assignment_count=fresh, updated_at=timezone.now()
+        )
+        if updated:
+            bump_model_versions(self.model)
+        return updated
+
+
 class Member(models.Model):
     # STATUS_CHOICES = [
     #     ('current', 'Currently Working'),
@@ -95,10 +254,39 @@ class Member(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+    # Active assignments on active/hot projects; maintained by core.signals
+    active_assignment_count = models.PositiveIntegerField(default=0, db_index=True, editable=False)
+
+    objects = MemberQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='member_updated_id_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # The counter is changed with F() updates; a plain save of an existing
+        # row never writes back a stale copy of it. A save that finds no row
+        # still inserts every column.
+        if (
+            not args and not self._state.adding and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+            and Member._base_manager.db_manager(kwargs.get('using')).filter(pk=self.pk).exists()
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != 'active_assignment_count' and f.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def is_engaged(self):
+        return self.active_assignment_count > 0
+
 
 # ------------------ MEMBER ASSIGNED ------------------
 class MemberAssigned(models.Model):
@@ -112,6 +300,16 @@ class MemberAssigned(models.Model):
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='assignment_updated_id_idx'),
+            models.Index(fields=['is_active', 'project'], name='assignment_active_project_idx'),
+            # Availability: a member's assignments overlapping a date window
+            models.Index(fields=['member', 'assigned_from', 'assigned_to'], name='assignment_member_range_idx'),
+            # Overlap checks: a member's assignments to one project by date range
+            models.Index(fields=['member', 'project', 'assigned_from', 'assigned_to'], name='assignment_overlap_idx'),
+        ]
+
     def __str__(self):
         return f"{self.member.name}  {self.project.name} ({'Active' if self.is_active else 'Inactive'})"
 
@@ -136,5 +334,62 @@ class ProjectActivity(models.Model):
     updated_by = models.CharField(max_length=100, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='activity_updated_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.project.name}  {self.status} ({self.activity_from} to {self.activity_to})"
+
+
+# ------------------ DASHBOARD STAT ------------------
+class DashboardStat(models.Model):
+    """One precomputed dashboard counter, kept current by core.signals."""
+    key = models.CharField(max_length=50, unique=True)
+    value = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
+
+
+# ------------------ SEARCH TOKEN ------------------
+class SearchToken(models.Model):
+    """Word-prefix index row used by core.search; one row per (token, object)."""
+    KIND_CHOICES = [
+        ('client', 'Client'),
+        ('project', 'Project'),
+        ('member', 'Member'),
+    ]
+
+    token = models.CharField(max_length=15)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['token', 'kind', 'object_id', 'weight'], name='search_token_idx'),
+            models.Index(fields=['kind', 'object_id'], name='search_object_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.token} -> {self.kind}:{self.object_id}"
+
+
+# ------------------ TOMBSTONE ------------------
+class Tombstone(models.Model):
+    """A deleted API row, kept for the changes feeds (core.changes); written by core.signals."""
+    model = models.CharField(max_length=50)  # label_lower, e.g. "core.project"
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['model', 'deleted_at', 'id'], name='tombstone_model_deleted_idx'),
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model}:{self.object_id} deleted {self.deleted_at}"
@@ -0,0 +1,135 @@
+import datetime
+
+from django.db.models import F, Q
+
+from .models import Member, MemberAssigned
+
+
+# ======================================================
+# ⛔ Overlapping assignments
+# ======================================================
+# Two active assignments of the same member to the same project overlap when
+# their date ranges share a day. Dates are inclusive, and an empty
+# assigned_from or assigned_to leaves that side open. Writers lock the
+# member's row (SELECT ... FOR UPDATE) before checking, so two concurrent
+# requests cannot both pass the check and then both insert.
+
+class AssignmentOverlap(Exception):
+    def __init__(self, errors):
+        # {index of the offending item (0 for a single write): message}
+        self.errors = errors
+        super().__init__("; ".join(errors.values()))
+
+
+def describe(assigned_from, assigned_to):
+    return f"{assigned_from or 'open start'} to {assigned_to or 'open end'}"
+
+
+def overlap_message(pk, assigned_from, assigned_to):
+    return (
+        f"Overlaps assignment #{pk} ({describe(assigned_from, assigned_to)}) "
+        "of this member to this project."
+    )
+
+
+def lock_members(member_ids):
+    """Lock the members' rows until the end of the transaction, in pk order to avoid deadlocks."""
+    list(Member.objects.select_for_update().filter(pk__in=set(member_ids)).order_by("pk").values_list("pk"))
+
+
+def overlapping(member_id, project_id, assigned_from, assigned_to):
+    """Active assignments of the pair sharing a day with [assigned_from, assigned_to]."""
+    queryset = MemberAssigned.objects.filter(member_id=member_id, project_id=project_id, is_active=True)
+    if assigned_to is not None:
+        queryset = queryset.filter(Q(assigned_from__lte=assigned_to) | Q(assigned_from__isnull=True))
+    if assigned_from is not None:
+        queryset = queryset.filter(Q(assigned_to__gte=assigned_from) | Q(assigned_to__isnull=True))
+    return queryset
+
+
+def check_assignment(assignment):
+    """
+    Raise AssignmentOverlap if ``assignment`` (saved or not) would overlap
+    another active assignment. Call inside a transaction after lock_members().
+    """
+    if not assignment.is_active:
+        return
+    conflict = overlapping(
+        assignment.member_id, assignment.project_id, _date(assignment.assigned_from), _date(assignment.assigned_to),
+    ).exclude(pk=assignment.pk).values("pk", "assigned_from", "assigned_to").order_by("assigned_from", "pk").first()
+    if conflict:
+        message = overlap_message(conflict["pk"], conflict["assigned_from"], conflict["assigned_to"])
+        raise AssignmentOverlap({0: message})
+
+
+def _date(value):
+    # The HTML views assign the raw "YYYY-MM-DD" strings from the form.
+    return datetime.date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def find_overlaps(rows):
+    """
+    One sorted pass over ``rows`` of (key, member_id, project_id, assigned_from,
+    assigned_to), ordered by member, project and assigned_from (empty first).
+    Yields (earlier row, row) whenever a row starts before the furthest end
+    reached so far by its pair, so every overlapping row is reported once.
+    """
+    pair, reach, reach_end = None, None, None
+    for row in rows:
+        _, member_id, project_id, assigned_from, assigned_to = row
+        end = assigned_to or datetime.date.max
+        if (member_id, project_id) != pair:
+            pair, reach, reach_end = (member_id, project_id), row, end
+            continue
+        if (assigned_from or datetime.date.min) <= reach_end:
+            yield reach, row
+        if end > reach_end:
+            reach, reach_end = row, end
+
+
+def check_assignments(objs):
+    """
+    Bulk form of check_assignment: one query for the stored active
+    assignments of every (member, project) pair in ``objs``, then
+    find_overlaps() over those rows and ``objs``. Rows being updated count
+    with their new values.
+    """
+    items = [
+        (("item", index), obj.member_id, obj.project_id, _date(obj.assigned_from), _date(obj.assigned_to))
+        for index, obj in enumerate(objs) if obj.is_active
+    ]
+    if not items:
+        return
+    pairs = {(member_id, project_id) for _, member_id, project_id, _, _ in items}
+    stored = MemberAssigned.objects.filter(
+        member_id__in={member_id for member_id, _ in pairs},
+        project_id__in={project_id for _, project_id in pairs},
+        is_active=True,
+    ).exclude(pk__in=[obj.pk for obj in objs if obj.pk]).values_list(
+        "pk", "member_id", "project_id", "assigned_from", "assigned_to",
+    )
+    rows = items + [(("stored", pk), *rest) for pk, *rest in stored if tuple(rest[:2]) in pairs]
+    rows.sort(key=lambda row: (row[1], row[2], row[3] or datetime.date.min))
+
+    errors = {}
+    for earlier, later in find_overlaps(rows):
+        if earlier[0][0] == later[0][0] == "stored":
+            continue  # an existing overlap; audit_assignment_overlaps reports those
+        # Report on the request item, pointing at the other row.
+        item, other = (later, earlier) if later[0][0] == "item" else (earlier, later)
+        (kind, key), _, _, assigned_from, assigned_to = other
+        errors.setdefault(item[0][1], (
+            overlap_message(key, assigned_from, assigned_to) if kind == "stored"
+            else f"Overlaps item {key} of this request ({describe(assigned_from, assigned_to)})."
+        ))
+    if errors:
+        raise AssignmentOverlap(errors)
+
+
+def iter_overlaps(queryset=None, chunk_size=5000):
+    """Stream (earlier, later) overlapping active assignment rows for an audit, in one ordered scan."""
+    queryset = (MemberAssigned.objects.all() if queryset is None else queryset).filter(is_active=True)
+    rows = queryset.order_by(
+        "member_id", "project_id", F("assigned_from").asc(nulls_first=True), "pk",
+    ).values_list("pk", "member_id", "project_id", "assigned_from", "assigned_to")
+    return find_overlaps(rows.iterator(chunk_size=chunk_size))
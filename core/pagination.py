@@ -0,0 +1,186 @@
+import base64
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+# ======================================================
+# 🔑 Keyset (seek) pagination on (updated_at, id)
+# ======================================================
+# Pages are addressed by an opaque cursor holding the (updated_at, id) of the
+# row at the page boundary, so every page is an index range scan instead of an
+# OFFSET over all previous rows.
+
+def encode_cursor(updated_at, pk):
+    raw = json.dumps([updated_at.isoformat() if updated_at else None, pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Return (updated_at, id) from a cursor token, raising ValueError if malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        updated_at, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(updated_at) if updated_at else None), int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def clamp_page_size(value, default=None, maximum=None):
+    default = default or settings.LIST_PAGE_SIZE
+    maximum = maximum or settings.LIST_MAX_PAGE_SIZE
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def _older_than(updated_at, pk):
+    return Q(updated_at__lt=updated_at) | Q(updated_at=updated_at, id__lt=pk)
+
+
+def _newer_than(updated_at, pk):
+    return Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk)
+
+
+def _position(item):
+    # Pages hold model instances, or .values() dicts on the API fast path.
+    if isinstance(item, dict):
+        return item["updated_at"], item["id"]
+    return item.updated_at, item.pk
+
+
+class KeysetPage:
+    def __init__(self, items, has_next, has_previous):
+        self.items = items
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def next_cursor(self):
+        if self.has_next and self.items:
+            return encode_cursor(*_position(self.items[-1]))
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous and self.items:
+            return encode_cursor(*_position(self.items[0]))
+        return None
+
+
+def _keyset_query(queryset, page_size, after=None, before=None):
+    if before:
+        updated_at, pk = decode_cursor(before)
+        return queryset.filter(_newer_than(updated_at, pk)).order_by("updated_at", "id")[:page_size + 1]
+    if after:
+        updated_at, pk = decode_cursor(after)
+        queryset = queryset.filter(_older_than(updated_at, pk))
+    return queryset.order_by("-updated_at", "-id")[:page_size + 1]
+
+
+def _keyset_page(rows, page_size, after=None, before=None):
+    if before:
+        return KeysetPage(rows[:page_size][::-1], has_next=True, has_previous=len(rows) > page_size)
+    return KeysetPage(rows[:page_size], has_next=len(rows) > page_size, has_previous=bool(after))
+
+
+def keyset_paginate(queryset, page_size, after=None, before=None):
+    """
+    Return one page of ``queryset`` ordered newest first by (updated_at, id).
+    ``after`` fetches the page following a cursor, ``before`` the page preceding it.
+    """
+    rows = list(_keyset_query(queryset, page_size, after, before))
+    return _keyset_page(rows, page_size, after, before)
+
+
+def approximate_count(queryset):
+    """
+    Cheap row estimate from the database's table statistics.
+    Only unfiltered querysets can be estimated; anything else returns None.
+    """
+    if queryset.query.where:
+        return None
+    table = queryset.model._meta.db_table
+    connection = connections[queryset.db]
+    if connection.vendor == "mysql":
+        sql = (
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s"
+        )
+    elif connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+    else:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    return max(int(row[0]), 0) if row and row[0] is not None else None
+
+
+# ======================================================
+# 🚀 API pagination
+# ======================================================
+class KeysetCursorPagination(BasePagination):
+    """
+    Cursor pagination for the API viewsets on the indexed (updated_at, id) order.
+    ``?page_size=`` is capped by API_MAX_PAGE_SIZE and ``?count=approx`` adds a
+    table-statistics row estimate instead of a COUNT(*).
+    """
+    page_size_query_param = "page_size"
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = clamp_page_size(
+            request.query_params.get(self.page_size_query_param),
+            default=api_settings.PAGE_SIZE,
+            maximum=settings.API_MAX_PAGE_SIZE,
+        )
+        try:
+            self.page = keyset_paginate(
+                queryset, page_size,
+                after=request.query_params.get("after"),
+                before=request.query_params.get("before"),
+            )
+        except ValueError:
+            raise NotFound("Invalid cursor")
+
+        self.count = None
+        self.count_requested = request.query_params.get(self.count_query_param) == "approx"
+        if self.count_requested:
+            self.count = approximate_count(queryset)
+        return list(self.page)
+
+    def _link(self, key, cursor):
+        if not cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "after")
+        url = remove_query_param(url, "before")
+        return replace_query_param(url, key, cursor)
+
+    def get_paginated_response(self, data):
+        payload = {
+            "next": self._link("after", self.page.next_cursor),
+            "previous": self._link("before", self.page.previous_cursor),
+        }
+        if self.count_requested:
+            payload["count"] = self.count
+        payload["results"] = data
+        return Response(payload)
@@ -1,5 +1,26 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+# Users in this group (or staff) get the "manager" role claim
+MANAGER_GROUP = "manager"
+MANAGER_ROLES = ("manager", "admin")
+
+
+def user_role(user):
+    """
+    The role put in a user's tokens: the user model's own ``role`` when it
+    has one, otherwise "admin" for superusers, "manager" for staff and the
+    manager group, and "member" for everyone else.
+    """
+    role = getattr(user, "role", None)
+    if role:
+        return role
+    if user.is_superuser:
+        return "admin"
+    if user.is_staff or user.groups.filter(name=MANAGER_GROUP).exists():
+        return "manager"
+    return "member"
+
+
 class ReadOnlyOrAuthenticated(BasePermission):
     """
     Custom permission:
@@ -12,3 +33,19 @@ class ReadOnlyOrAuthenticated(BasePermission):
         if request.method in SAFE_METHODS:
             return True
         return request.user and request.user.is_authenticated
+
+
+class IsManagerOrReadOnly(BasePermission):
+    """
+    Read-only access for everyone; writes need the manager or admin role.
+    With core.authentication the role comes from the verified token, so no
+    query is made.
+    """
+
+    def has_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        user = request.user
+        if not (user and user.is_authenticated):
+            return False
+        return (getattr(user, "role", None) or user_role(user)) in MANAGER_ROLES
@@ -0,0 +1,190 @@
+import json
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template
+
+logger = logging.getLogger("core.profiling")
+
+
+# ======================================================
+# ⏱️ Per-request profiling (SQL, render, Server-Timing)
+# ======================================================
+# While a request is profiled, the RequestProfile sits in a context variable.
+# A database execute_wrapper, installed on each connection as it opens,
+# appends (sql, seconds) to it. Context variables follow sync_to_async into
+# worker threads, so queries run there are counted too. With
+# REQUEST_PROFILING off, the middleware removes itself and no wrapper is
+# installed.
+
+_current_profile = ContextVar("pims_request_profile", default=None)
+
+
+class RequestProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = []
+        self.render_time = 0.0
+        self._render_depth = 0
+
+    def start_render(self):
+        self._render_depth += 1
+        return time.perf_counter(), len(self.queries)
+
+    def stop_render(self, token):
+        # Only the outermost render counts; queries run while rendering
+        # (lazy querysets in templates) stay in the db figure.
+        self._render_depth -= 1
+        if self._render_depth == 0:
+            started, first_query = token
+            db_time = sum(seconds for _, seconds in self.queries[first_query:])
+            self.render_time += time.perf_counter() - started - db_time
+
+    def summary(self):
+        total = time.perf_counter() - self.started
+        db = sum(seconds for _, seconds in self.queries)
+        return {
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(db * 1000, 2),
+            "render_ms": round(self.render_time * 1000, 2),
+            "app_ms": round(max(total - db - self.render_time, 0) * 1000, 2),
+            "queries": len(self.queries),
+        }
+
+    def slowest(self, limit):
+        ranked = sorted(self.queries, key=lambda query: query[1], reverse=True)[:limit]
+        return [{"sql": sql[:1000], "ms": round(seconds * 1000, 2)} for sql, seconds in ranked]
+
+    def repeated(self, threshold):
+        """Statements run ``threshold`` or more times with different parameters (likely N+1)."""
+        shapes = defaultdict(list)
+        for sql, seconds in self.queries:
+            shapes[sql].append(seconds)
+        return sorted((
+            {"sql": sql[:1000], "count": len(times), "ms": round(sum(times) * 1000, 2)}
+            for sql, times in shapes.items() if len(times) >= threshold
+        ), key=lambda shape: shape["count"], reverse=True)
+
+
+def record_query(execute, sql, params, many, context):
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.queries.append((sql, time.perf_counter() - started))
+
+
+def _install_wrapper(sender=None, connection=None, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+# ======================================================
+# 🎨 Template render timing
+# ======================================================
+class ProfiledTemplate(Template):
+    def render(self, context=None, request=None):
+        profile = _current_profile.get()
+        if profile is None:
+            return super().render(context, request)
+        token = profile.start_render()
+        try:
+            return super().render(context, request)
+        finally:
+            profile.stop_render(token)
+
+
+class ProfiledDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates whose templates report their render time to the current RequestProfile."""
+
+    def from_string(self, template_code):
+        return ProfiledTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return ProfiledTemplate(super().get_template(template_name).template, self)
+
+
+# ======================================================
+# 🧭 Middleware
+# ======================================================
+class RequestProfilingMiddleware:
+    """
+    Adds a Server-Timing header (db, render, app, total) to every response.
+    Requests slower than SLOW_REQUEST_MS are logged as one JSON line on the
+    ``core.profiling`` logger. The line has the slowest statements and any
+    statement repeated REPEATED_QUERY_THRESHOLD times or more. Put it first
+    in MIDDLEWARE so the other middleware is timed too.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        connection_created.connect(_install_wrapper, dispatch_uid="core.profiling_wrapper")
+        for connection in connections.all(initialized_only=True):
+            _install_wrapper(connection=connection)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        return self.finish(request, response, profile)
+
+    async def __acall__(self, request):
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        return self.finish(request, response, profile)
+
+    def process_template_response(self, request, response):
+        # DRF responses and TemplateResponses render after the view returns.
+        profile = _current_profile.get()
+        if profile is not None:
+            token = profile.start_render()
+            response.add_post_render_callback(lambda rendered: profile.stop_render(token))
+        return response
+
+    def finish(self, request, response, profile):
+        summary = profile.summary()
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={summary["db_ms"]};desc="{summary["queries"]} queries"',
+            f'render;dur={summary["render_ms"]}',
+            f'app;dur={summary["app_ms"]}',
+            f'total;dur={summary["total_ms"]}',
+        ])
+        if summary["total_ms"] >= settings.SLOW_REQUEST_MS:
+            match = getattr(request, "resolver_match", None)
+            logger.warning(json.dumps({
+                "event": "slow_request",
+                "method": request.method,
+                "path": request.get_full_path(),
+                "view": match.view_name if match else None,
+                "status": response.status_code,
+                **summary,
+                "slowest": profile.slowest(settings.SLOW_REQUEST_LOGGED_QUERIES),
+                "repeated": profile.repeated(settings.REPEATED_QUERY_THRESHOLD),
+            }))
+        return response
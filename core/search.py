@@ -0,0 +1,171 @@
+import re
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from .models import Client, Project, Member, SearchToken
+
+
+# ======================================================
+# 🔎 Word-prefix search index
+# ======================================================
+# Every indexed word is stored as all of its prefixes (3..15 chars) in the
+# SearchToken table, so a prefix query is an exact match on an indexed column
+# instead of a LIKE '%...%' scan. Rows are rewritten from core.signals whenever
+# a client, project or member is saved.
+
+# Two-letter prefixes match a large share of every word and multiply the rows
+# a query has to aggregate; shorter terms are ignored.
+MIN_PREFIX = 3
+MAX_PREFIX = 15
+MAX_WORDS_PER_OBJECT = 64
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# kind -> (model, [(field, weight), ...])
+INDEXED = {
+    "client": (Client, [("Client_name", 10)]),
+    "project": (Project, [("name", 10), ("hosting_provider", 3), ("description", 2)]),
+    "member": (Member, [("name", 10), ("role", 5)]),
+}
+KIND_FOR_MODEL = {model: kind for kind, (model, _) in INDEXED.items()}
+
+
+def words(text):
+    return [w.lower() for w in WORD_RE.findall(text or "")]
+
+
+def query_terms(query):
+    """Distinct search terms of ``query``, each cut to the longest stored prefix."""
+    return list(dict.fromkeys(w[:MAX_PREFIX] for w in words(query) if len(w) >= MIN_PREFIX))
+
+
+def tokens_for(instance):
+    """{prefix: weight} for one object; a complete word counts double."""
+    _, fields = INDEXED[KIND_FOR_MODEL[type(instance)]]
+    tokens, seen_words = {}, set()
+    for field, weight in fields:
+        for word in words(getattr(instance, field)):
+            if word in seen_words:
+                continue
+            if len(seen_words) >= MAX_WORDS_PER_OBJECT:
+                break
+            seen_words.add(word)
+            for size in range(MIN_PREFIX, min(len(word), MAX_PREFIX) + 1):
+                prefix = word[:size]
+                score = weight * 2 if size == len(word) else weight
+                tokens[prefix] = max(tokens.get(prefix, 0), score)
+    return tokens
+
+
+def _token_rows(instance, kind):
+    return [
+        SearchToken(token=token, kind=kind, object_id=instance.pk, weight=weight)
+        for token, weight in tokens_for(instance).items()
+    ]
+
+
+@transaction.atomic
+def index_object(instance):
+    kind = KIND_FOR_MODEL[type(instance)]
+    SearchToken.objects.filter(kind=kind, object_id=instance.pk).delete()
+    SearchToken.objects.bulk_create(_token_rows(instance, kind))
+
+
+def unindex_object(instance):
+    SearchToken.objects.filter(kind=KIND_FOR_MODEL[type(instance)], object_id=instance.pk).delete()
+
+
+def _index_batch(kind, objs):
+    rows = [row for obj in objs for row in _token_rows(obj, kind)]
+    SearchToken.objects.bulk_create(rows, batch_size=5000)
+
+
+def _index_columns(kind):
+    model, fields = INDEXED[kind]
+    return model, ["pk"] + [field for field, _ in fields]
+
+
+def rebuild_index(kinds=None, batch_size=1000):
+    """Rebuild the index for ``kinds`` (all by default); yields (kind, objects indexed)."""
+    for kind in kinds or INDEXED:
+        model, columns = _index_columns(kind)
+        SearchToken.objects.filter(kind=kind).delete()
+        done, last_pk = 0, 0
+        while True:
+            batch = list(model.objects.filter(pk__gt=last_pk).order_by("pk").only(*columns)[:batch_size])
+            if not batch:
+                break
+            _index_batch(kind, batch)
+            done += len(batch)
+            last_pk = batch[-1].pk
+            yield kind, done
+
+
+def reindex_objects(kind, pks, batch_size=1000):
+    """Rewrite the index rows of the ``kind`` objects in ``pks`` only; returns how many were indexed."""
+    model, columns = _index_columns(kind)
+    pks, done = sorted(pks), 0
+    for start in range(0, len(pks), batch_size):
+        chunk = pks[start:start + batch_size]
+        with transaction.atomic():
+            SearchToken.objects.filter(kind=kind, object_id__in=chunk).delete()
+            batch = list(model.objects.filter(pk__in=chunk).only(*columns))
+            _index_batch(kind, batch)
+        done += len(batch)
+    return done
+
+
+# ======================================================
+# 🏁 Querying
+# ======================================================
+def matching_ids(kind, query):
+    """
+    Subquery of ``kind`` object ids whose words start with every term of
+    ``query``. Callers skip the filter when query_terms() is empty.
+    """
+    terms = query_terms(query)
+    return SearchToken.objects.filter(kind=kind, token__in=terms).values("object_id").annotate(
+        matched=Count("token")
+    ).filter(matched=len(terms)).values("object_id")
+
+
+def search(query, kinds=None, limit=20):
+    """Ranked hits across clients, projects and members as plain dicts."""
+    terms = query_terms(query)
+    if not terms:
+        return []
+    kinds = [k for k in (kinds or INDEXED) if k in INDEXED]
+    hits = list(
+        SearchToken.objects.filter(token__in=terms, kind__in=kinds)
+        .values("kind", "object_id")
+        .annotate(score=Sum("weight"), matched=Count("token"))
+        .filter(matched=len(terms))
+        .order_by("-score", "kind", "-object_id")[:limit]
+    )
+
+    by_kind = {}
+    for hit in hits:
+        by_kind.setdefault(hit["kind"], []).append(hit["object_id"])
+    objects = {kind: INDEXED[kind][0].objects.in_bulk(ids) for kind, ids in by_kind.items()}
+
+    results = []
+    for hit in hits:
+        obj = objects[hit["kind"]].get(hit["object_id"])
+        if obj is None:
+            continue
+        results.append({
+            "type": hit["kind"],
+            "id": obj.pk,
+            "title": str(obj),
+            "subtitle": _subtitle(hit["kind"], obj),
+            "score": hit["score"],
+        })
+    return results
+
+
+def _subtitle(kind, obj):
+    if kind == "client":
+        return obj.get_status_display()
+    if kind == "project":
+        return obj.get_status_display() if obj.status else obj.get_type_display()
+    return obj.role
@@ -0,0 +1,270 @@
+import datetime
+import random
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import bump_model_versions
+from .models import Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity
+from .search import rebuild_index
+from .stats import rebuild_dashboard_stats
+
+
+# ======================================================
+# 🌱 Synthetic data for load testing
+# ======================================================
+# Rows are generated from a seeded RNG (same scale + seed, same data) and
+# written with bulk_create in batches, so no row signals fire; engagement
+# counters, dashboard stats, the search index and API cache versions are
+# refreshed once at the end, as the importer does. Seeded names end in their
+# row number, so on MySQL the new ids are read back by natural key.
+
+# Rows per table for every 10,000 seeded rows (m2m links come on top)
+SCALE_MIX = {
+    "clients": 200,
+    "projects": 1000,
+    "credentials": 1000,
+    "teams": 100,
+    "members": 500,
+    "assignments": 3000,
+    "activities": 4200,
+}
+SCALE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+COMPANY_WORDS = [
+    "Blue", "Harbor", "Summit", "Cedar", "Northwind", "Apex", "Silver", "Lumen", "Orbit", "Granite",
+    "Maple", "Vertex", "Pioneer", "Coral", "Falcon", "Beacon", "Atlas", "Quartz", "Evergreen", "Nimbus",
+]
+COMPANY_SUFFIXES = ["Labs", "Logistics", "Health", "Retail", "Systems", "Media", "Foods", "Capital", "Studio"]
+PROJECT_WORDS = [
+    "Portal", "Checkout", "Analytics", "Mobile App", "CRM", "Booking", "Dashboard", "Inventory",
+    "Payments", "Website", "Chatbot", "Migration", "Marketplace", "Reporting", "Onboarding",
+]
+FIRST_NAMES = [
+    "Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Sneha", "Arjun", "Meera", "Kabir", "Isha",
+    "Liam", "Emma", "Noah", "Olivia", "Lucas", "Sofia", "Mateo", "Chloe", "Ethan", "Zara",
+]
+LAST_NAMES = [
+    "Sharma", "Patel", "Gupta", "Iyer", "Reddy", "Khan", "Singh", "Das", "Mehta", "Nair",
+    "Smith", "Garcia", "Brown", "Lee", "Martin", "Lopez", "Wilson", "Clark", "Young", "Walker",
+]
+ROLES = ["Developer", "Designer", "QA", "Project Manager", "DevOps", "Data Engineer"]
+TEAM_TYPES = ["Frontend", "Backend", "Mobile", "QA", "DevOps", "Design", "Data"]
+HOSTING_PROVIDERS = ["AWS", "GCP", "Azure", "DigitalOcean", "Vercel", "Heroku", None]
+CREDENTIAL_KEYS = ["DB_PASSWORD", "API_KEY", "SSH_KEY", "ADMIN_LOGIN", "SMTP_PASSWORD", "S3_SECRET"]
+REMARKS = ["Kickoff with client", "Waiting on feedback", "Sprint demo", "Scope change agreed", None]
+
+CLIENT_STATUS_WEIGHTS = {"active": 60, "inactive": 30, "hot": 10}
+PROJECT_STATUS_WEIGHTS = {"active": 45, "inactive": 25, "hot": 10, "dead": 15, None: 5}
+PROJECT_TYPE_WEIGHTS = {"client": 70, "internal": 20, "freelance": 10}
+
+
+def parse_scale(value):
+    """Total rows for a scale like "10k", "100k", "1m" or "25000"."""
+    text = str(value).strip().lower().replace("_", "")
+    multiplier = SCALE_SUFFIXES.get(text[-1:], 1)
+    number = text[:-1] if text[-1:] in SCALE_SUFFIXES else text
+    try:
+        total = int(float(number) * multiplier)
+    except ValueError:
+        raise ValueError(f"invalid scale {value!r}; use e.g. 10k, 100k, 1m or a row count")
+    if total <= 0:
+        raise ValueError("scale must be positive")
+    return total
+
+
+def table_counts(total):
+    """{table: rows} for ``total`` seeded rows, with at least one row per table."""
+    return {table: max(1, round(total * share / 10_000)) for table, share in SCALE_MIX.items()}
+
+
+class Seeder:
+    """
+    Generates ``counts`` rows per table (see table_counts). run() yields
+    (table, rows written) as it goes; refresh_derived_state() must be called
+    once afterwards.
+    """
+
+    def __init__(self, counts, seed=0, batch_size=2000, username="seed"):
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.username = username
+        self.today = timezone.localdate()
+        self.client_ids, self.project_ids, self.member_ids, self.team_ids = [], [], [], []
+        self.project_info = {}
+
+    # ------------------ helpers ------------------
+    def weighted(self, weights):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def skewed(self, ids):
+        # Squaring the draw favours the start of the list: a few busy members
+        # or projects and a long tail, as in a real org.
+        return ids[int(len(ids) * self.rng.random() ** 2)]
+
+    def past_date(self, years=6):
+        return self.today - datetime.timedelta(days=self.rng.randrange(years * 365))
+
+    def write(self, model, objs):
+        """bulk_create ``objs`` in batches; return how many rows were written."""
+        written, objs = 0, iter(objs)
+        while True:
+            batch = list(islice(objs, self.batch_size))
+            if not batch:
+                return written
+            with transaction.atomic():
+                model.objects.bulk_create(batch)
+            written += len(batch)
+
+    def write_keyed(self, model, objs, key_fields, *columns):
+        """
+        Like write(), but return ``columns`` of the new rows (pk first), in
+        insert order. ``key_fields`` must tell the new rows apart.
+        """
+        rows, objs = [], iter(objs)
+        while True:
+            batch = list(islice(objs, self.batch_size))
+            if not batch:
+                return rows
+            with transaction.atomic():
+                model.objects.bulk_create(batch)
+                if not all(obj.pk for obj in batch):
+                    # MySQL does not return primary keys from bulk inserts; read them
+                    # back by natural key. A key seeded before keeps the newest row.
+                    lookups = {f"{f}__in": {getattr(obj, f) for obj in batch} for f in key_fields}
+                    found = {}
+                    for *key, pk in model.objects.filter(**lookups).order_by("pk").values_list(*key_fields, "pk"):
+                        found[tuple(key)] = pk
+                    for obj in batch:
+                        obj.pk = found[tuple(getattr(obj, f) for f in key_fields)]
+            rows.extend((obj.pk, *(getattr(obj, column) for column in columns)) for obj in batch)
+
+    # ------------------ tables ------------------
+    def clients(self):
+        for n in range(self.counts["clients"]):
+            words = [*self.rng.sample(COMPANY_WORDS, 2), self.rng.choice(COMPANY_SUFFIXES)]
+            yield Client(
+                Client_name=f"{' '.join(words)} {n}",
+                status=self.weighted(CLIENT_STATUS_WEIGHTS),
+                created_by=self.username,
+            )
+
+    def projects(self):
+        for n in range(self.counts["projects"]):
+            status = self.weighted(PROJECT_STATUS_WEIGHTS)
+            start = self.past_date()
+            ended = status in ("inactive", "dead") or self.rng.random() < 0.2
+            slug = f"project-{n}"
+            yield Project(
+                name=f"{self.rng.choice(COMPANY_WORDS)} {self.rng.choice(PROJECT_WORDS)} {n}",
+                client_id=self.skewed(self.client_ids),
+                type=self.weighted(PROJECT_TYPE_WEIGHTS),
+                status=status,
+                start_date=start,
+                end_date=start + datetime.timedelta(days=self.rng.randint(30, 720)) if ended else None,
+                hosting_provider=self.rng.choice(HOSTING_PROVIDERS),
+                github_repo=f"https://github.com/pims-seed/{slug}" if self.rng.random() < 0.7 else None,
+                live_url=f"https://{slug}.example.com" if self.rng.random() < 0.5 else None,
+                description=f"{self.rng.choice(PROJECT_WORDS)} work for {self.rng.choice(COMPANY_WORDS)}",
+                created_by=self.username,
+            )
+
+    def credentials(self):
+        for _ in range(self.counts["credentials"]):
+            yield ProjectCredential(
+                project_id=self.skewed(self.project_ids),
+                key=self.rng.choice(CREDENTIAL_KEYS),
+                value=f"{self.rng.getrandbits(64):016x}",
+                created_by=self.username,
+            )
+
+    def members(self):
+        for n in range(self.counts["members"]):
+            yield Member(
+                name=f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)} {n}",
+                role=self.rng.choice(ROLES),
+                created_by=self.username,
+            )
+
+    def teams(self):
+        for n in range(self.counts["teams"]):
+            yield Team(team_type=f"{self.rng.choice(TEAM_TYPES)} {n}", created_by=self.username)
+
+    def team_links(self):
+        """3-8 members per team, as m2m through rows."""
+        team_members = Team.members.through
+        for team_id in self.team_ids:
+            size = min(len(self.member_ids), self.rng.randint(3, 8))
+            for member_id in self.rng.sample(self.member_ids, size):
+                yield team_members(team_id=team_id, member_id=member_id)
+
+    def project_team_links(self):
+        """0-2 teams per project."""
+        project_teams = Project.teams_assigned.through
+        for project_id in self.project_ids:
+            for team_id in set(self.rng.choices(self.team_ids, k=self.rng.randint(0, 2))):
+                yield project_teams(project_id=project_id, team_id=team_id)
+
+    def assignments(self):
+        for _ in range(self.counts["assignments"]):
+            project_id = self.skewed(self.project_ids)
+            status, start = self.project_info[project_id]
+            assigned_from = (start or self.past_date()) + datetime.timedelta(days=self.rng.randint(0, 60))
+            done = status not in Project.ENGAGED_STATUSES or self.rng.random() < 0.25
+            if done:
+                assigned_to = assigned_from + datetime.timedelta(days=self.rng.randint(14, 400))
+            elif self.rng.random() < 0.5:
+                assigned_to = self.today + datetime.timedelta(days=self.rng.randint(1, 180))
+            else:
+                assigned_to = None
+            yield MemberAssigned(
+                member_id=self.skewed(self.member_ids),
+                project_id=project_id,
+                assigned_from=assigned_from,
+                assigned_to=assigned_to,
+                is_active=not done,
+                created_by=self.username,
+            )
+
+    def activities(self):
+        statuses = [key for key, _ in ProjectActivity.STATUS_CHOICES]
+        for _ in range(self.counts["activities"]):
+            project_id = self.skewed(self.project_ids)
+            start = self.project_info[project_id][1] or self.past_date()
+            activity_from = start + datetime.timedelta(days=self.rng.randint(0, 365))
+            yield ProjectActivity(
+                project_id=project_id,
+                activity_from=activity_from,
+                activity_to=activity_from + datetime.timedelta(days=self.rng.randint(1, 60)),
+                status=self.rng.choice(statuses),
+                remarks=self.rng.choice(REMARKS),
+                created_by=self.username,
+            )
+
+    # ------------------ run ------------------
+    def run(self):
+        self.client_ids = [pk for pk, in self.write_keyed(Client, self.clients(), ("Client_name",))]
+        yield "clients", len(self.client_ids)
+        projects = self.write_keyed(Project, self.projects(), ("client_id", "name"), "status", "start_date")
+        self.project_ids = [pk for pk, _, _ in projects]
+        self.project_info = {pk: (status, start) for pk, status, start in projects}
+        yield "projects", len(projects)
+        yield "credentials", self.write(ProjectCredential, self.credentials())
+        self.member_ids = [pk for pk, in self.write_keyed(Member, self.members(), ("name",))]
+        yield "members", len(self.member_ids)
+        self.team_ids = [pk for pk, in self.write_keyed(Team, self.teams(), ("team_type",))]
+        yield "teams", len(self.team_ids)
+        yield "team members", self.write(Team.members.through, self.team_links())
+        yield "project teams", self.write(Project.teams_assigned.through, self.project_team_links())
+        yield "assignments", self.write(MemberAssigned, self.assignments())
+        yield "activities", self.write(ProjectActivity, self.activities())
+
+    def refresh_derived_state(self):
+        """What row signals would have done: engagement, stats, search index, cache versions."""
+        Member.objects.refresh_engagement()
+        for _ in rebuild_index():
+            pass
+        rebuild_dashboard_stats()
+        bump_model_versions(Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity)
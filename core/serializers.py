@@ -1,8 +1,17 @@
 from rest_framework import serializers
 from .models import Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+from .authentication import add_claims, is_revoked
+from .permissions import user_role
 
 class CustomTokenSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        # Claims for core.authentication; refreshed access tokens copy them
+        return add_claims(super().get_token(user), user)
+
     def validate(self, attrs):
         data = super().validate(attrs)
         user = self.user
@@ -14,7 +23,7 @@ class CustomTokenSerializer(TokenObtainPairSerializer):
             "first_name": user.first_name,
             "last_name": user.last_name,
             "employee_id": getattr(user, "employee_id", None),
-            "role": getattr(user, "role", None),
+            "role": user_role(user),
         }
 
         # Organize tokens separately
@@ -26,44 +35,141 @@ class CustomTokenSerializer(TokenObtainPairSerializer):
         return data
 
 
-class ClientSerializer(serializers.ModelSerializer):
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        if is_revoked(RefreshToken(attrs["refresh"])):
+            raise InvalidToken("Token has been revoked.")
+        return super().validate(attrs)
+
+
+class DynamicFieldsMixin:
+    """
+    Trims the output to ``context["fields"]`` (id is always kept) and swaps the
+    related fields named in ``context["expand"]`` for nested serializers listed
+    in ``expandable_fields`` ({field: (serializer class name, kwargs)}).
+    Only the top-level serializer reacts; expanded objects are rendered in full.
+    """
+    expandable_fields = {}
+
+    def _is_top_level(self):
+        return self.root is self or (self.root is self.parent and isinstance(self.parent, serializers.ListSerializer))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_top_level():
+            return fields
+        for name in self.context.get("expand") or ():
+            class_name, kwargs = self.expandable_fields[name]
+            fields[name] = globals()[class_name](read_only=True, **kwargs)
+        wanted = self.context.get("fields")
+        if wanted:
+            fields = {name: field for name, field in fields.items() if name in wanted or name == "id"}
+        return fields
+
+
+class ClientSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Client
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ClientSummarySerializer(ClientSerializer):
+    """Client with project totals; expects Client.objects.with_project_summary()."""
+    project_count = serializers.IntegerField(read_only=True)
+    project_status_counts = serializers.SerializerMethodField()
+    project_names = serializers.SerializerMethodField()
+
+    def get_project_status_counts(self, obj):
+        return obj.project_status_counts()
+
+    def get_project_names(self, obj):
+        return [project.name for project in obj.project_summaries]
+
+class ProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"client": ("ClientSerializer", {}), "teams_assigned": ("TeamSerializer", {"many": True})}
+
     class Meta:
         model = Project
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
 
-class ProjectCredentialSerializer(serializers.ModelSerializer):
+class ProjectCredentialSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"project": ("ProjectSerializer", {})}
+
     class Meta:
         model = ProjectCredential
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"members": ("MemberSerializer", {"many": True})}
+
     class Meta:
         model = Team
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
 
-class MemberSerializer(serializers.ModelSerializer):
+class MemberSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Member
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
 
-class MemberAssignedSerializer(serializers.ModelSerializer):
+class MemberAssignedSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"member": ("MemberSerializer", {}), "project": ("ProjectSerializer", {})}
+
     class Meta:
         model = MemberAssigned
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
 
-class ProjectActivitySerializer(serializers.ModelSerializer):
+class ProjectActivitySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"project": ("ProjectSerializer", {})}
+
     class Meta:
         model = ProjectActivity
         fields = '__all__'
         read_only_fields = ['created_by', 'updated_by', 'created_at', 'updated_at']
+
+
+# ------------------ Project dossier ------------------
+class DossierMemberSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Member
+        fields = ['id', 'name', 'role', 'active_assignment_count']
+
+class DossierAssignmentSerializer(serializers.ModelSerializer):
+    member = DossierMemberSerializer(read_only=True)
+
+    class Meta:
+        model = MemberAssigned
+        fields = ['id', 'member', 'assigned_from', 'assigned_to', 'is_active', 'updated_at']
+
+class DossierTeamSerializer(serializers.ModelSerializer):
+    members = DossierMemberSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Team
+        fields = ['id', 'team_type', 'members']
+
+class DossierCredentialSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProjectCredential
+        fields = ['id', 'key', 'value', 'updated_by', 'updated_at']
+
+class DossierActivitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProjectActivity
+        exclude = ['project']
+
+class ProjectDossierSerializer(serializers.ModelSerializer):
+    """Everything about one project; expects Project.objects.for_dossier()."""
+    client = ClientSerializer(read_only=True)
+    credentials = DossierCredentialSerializer(many=True, read_only=True)
+    assignments = DossierAssignmentSerializer(many=True, read_only=True, source='memberassigned_set')
+    teams_assigned = DossierTeamSerializer(many=True, read_only=True)
+    activity_logs = DossierActivitySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Project
+        fields = '__all__'
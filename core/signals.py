@@ -0,0 +1,288 @@
+from collections import Counter, defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Case, When
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import search, stats
+from .authentication import revoke_user
+from .caching import bump_model_versions
+from .models import Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity, Tombstone
+
+
+# ======================================================
+# 📌 Previous-state capture
+# ======================================================
+@receiver(pre_save, sender=Client, dispatch_uid="core.client_previous_status")
+@receiver(pre_save, sender=Project, dispatch_uid="core.project_previous_status")
+def remember_previous_status(sender, instance, **kwargs):
+    instance._previous_status = None
+    if instance.pk:
+        instance._previous_status = (
+            sender.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+        )
+
+
+def _status_deltas(key, instance, created):
+    deltas = Counter()
+    if created:
+        deltas[f"{key}.total"] += 1
+    else:
+        previous = getattr(instance, "_previous_status", None)
+        if previous == instance.status:
+            return deltas
+        if previous:
+            deltas[f"{key}.{previous}"] -= 1
+    if instance.status:
+        deltas[f"{key}.{instance.status}"] += 1
+    return deltas
+
+
+@receiver(pre_save, sender=MemberAssigned, dispatch_uid="core.assignment_previous_engagement")
+def remember_previous_engagement(sender, instance, **kwargs):
+    instance._previous_engagement = None
+    if instance.pk:
+        row = sender.objects.filter(pk=instance.pk).values_list(
+            "member_id", "is_active", "project__status"
+        ).first()
+        if row:
+            instance._previous_engagement = (row[0], row[1] and _is_engaged(row[2]))
+
+
+def _is_engaged(status):
+    return status in Project.ENGAGED_STATUSES
+
+
+def _assignment_is_engaged(assignment):
+    if not assignment.is_active:
+        return False
+    status = Project.objects.filter(pk=assignment.project_id).values_list("status", flat=True).first()
+    return _is_engaged(status)
+
+
+# ======================================================
+# 👥 Member engagement counter
+# ======================================================
+def adjust_engagement(deltas):
+    """Apply {member_id: delta} to Member.active_assignment_count with one UPDATE per distinct delta."""
+    by_delta = defaultdict(list)
+    for member_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(member_id)
+    if not by_delta:
+        return
+    # Counts before the change, locked until commit, tell how many members
+    # start or stop being current without recounting the whole table.
+    counts = Member.objects.select_for_update().filter(pk__in=[pk for pks in by_delta.values() for pk in pks])
+    current = sum(
+        (max(count + deltas[pk], 0) > 0) - (count > 0)
+        for pk, count in counts.values_list("pk", "active_assignment_count")
+    )
+    for delta, member_ids in by_delta.items():
+        count = F("active_assignment_count")
+        if delta > 0:
+            value = count + delta
+        else:
+            value = Case(When(active_assignment_count__gte=-delta, then=count + delta), default=0)
+        Member.objects.filter(pk__in=member_ids).update(active_assignment_count=value, updated_at=timezone.now())
+    bump_model_versions(Member)
+    stats.bump({"members.current": current})
+
+
+@receiver(post_save, sender=MemberAssigned, dispatch_uid="core.assignment_saved_engagement")
+def assignment_saved(sender, instance, **kwargs):
+    deltas = Counter()
+    previous = getattr(instance, "_previous_engagement", None)
+    if previous and previous[1]:
+        deltas[previous[0]] -= 1
+    if _assignment_is_engaged(instance):
+        deltas[instance.member_id] += 1
+    adjust_engagement(deltas)
+
+
+@receiver(post_delete, sender=MemberAssigned, dispatch_uid="core.assignment_deleted_engagement")
+def assignment_deleted(sender, instance, **kwargs):
+    if _assignment_is_engaged(instance):
+        adjust_engagement({instance.member_id: -1})
+
+
+def _project_engagement_changed(project, engaged):
+    rows = MemberAssigned.objects.filter(project=project, is_active=True).order_by().values(
+        "member_id"
+    ).annotate(n=Count("id"))
+    sign = 1 if engaged else -1
+    adjust_engagement({row["member_id"]: sign * row["n"] for row in rows})
+
+
+# ======================================================
+# 📊 Dashboard stats
+# ======================================================
+@receiver(post_save, sender=Client, dispatch_uid="core.client_saved_stats")
+def client_saved(sender, instance, created, **kwargs):
+    stats.bump(_status_deltas("clients", instance, created))
+
+
+@receiver(post_delete, sender=Client, dispatch_uid="core.client_deleted_stats")
+def client_deleted(sender, instance, **kwargs):
+    deltas = {"clients.total": -1}
+    if instance.status:
+        deltas[stats.client_key(instance.status)] = -1
+    stats.bump(deltas)
+
+
+@receiver(post_save, sender=Project, dispatch_uid="core.project_saved_stats")
+def project_saved(sender, instance, created, **kwargs):
+    stats.bump(_status_deltas("projects", instance, created))
+    previous = getattr(instance, "_previous_status", None)
+    if not created and _is_engaged(previous) != _is_engaged(instance.status):
+        _project_engagement_changed(instance, _is_engaged(instance.status))
+
+
+@receiver(post_delete, sender=Project, dispatch_uid="core.project_deleted_stats")
+def project_deleted(sender, instance, **kwargs):
+    deltas = {"projects.total": -1}
+    if instance.status:
+        deltas[stats.project_key(instance.status)] = -1
+    stats.bump(deltas)
+
+
+@receiver(post_save, sender=Member, dispatch_uid="core.member_saved_stats")
+def member_saved(sender, instance, created, **kwargs):
+    if created:
+        stats.bump({"members.total": 1})
+
+
+@receiver(post_delete, sender=Member, dispatch_uid="core.member_deleted_stats")
+def member_deleted(sender, instance, **kwargs):
+    # The member's assignments are deleted first (CASCADE) and their signals
+    # already took the member out of members.current.
+    stats.bump({"members.total": -1})
+
+
+@receiver(post_save, sender=ProjectActivity, dispatch_uid="core.activity_saved_stats")
+def activity_saved(sender, instance, created, **kwargs):
+    if created:
+        stats.bump({"activities.total": 1})
+
+
+@receiver(post_delete, sender=ProjectActivity, dispatch_uid="core.activity_deleted_stats")
+def activity_deleted(sender, instance, **kwargs):
+    stats.bump({"activities.total": -1})
+
+
+# ======================================================
+# 🔎 Search index
+# ======================================================
+@receiver(post_save, sender=Client, dispatch_uid="core.client_saved_search")
+@receiver(post_save, sender=Project, dispatch_uid="core.project_saved_search")
+@receiver(post_save, sender=Member, dispatch_uid="core.member_saved_search")
+def reindex_saved(sender, instance, **kwargs):
+    search.index_object(instance)
+
+
+@receiver(post_delete, sender=Client, dispatch_uid="core.client_deleted_search")
+@receiver(post_delete, sender=Project, dispatch_uid="core.project_deleted_search")
+@receiver(post_delete, sender=Member, dispatch_uid="core.member_deleted_search")
+def unindex_deleted(sender, instance, **kwargs):
+    search.unindex_object(instance)
+
+
+# ======================================================
+# 🕒 updated_at on many-to-many changes
+# ======================================================
+# Adding a team to a project (or a member to a team) does not save either row,
+# so touch updated_at on the owning side to keep ETags and sync cursors honest.
+def _touch_owners(owner_model, reverse_accessor, instance, action, reverse, pk_set):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        owner_ids = [instance.pk]
+    elif action == "pre_clear":
+        owner_ids = list(getattr(instance, reverse_accessor).values_list("pk", flat=True))
+    else:
+        owner_ids = list(pk_set or ())
+    if owner_ids:
+        owner_model.objects.filter(pk__in=owner_ids).update(updated_at=timezone.now())
+        bump_model_versions(owner_model)
+
+
+@receiver(m2m_changed, sender=Project.teams_assigned.through, dispatch_uid="core.project_teams_touch")
+def project_teams_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    _touch_owners(Project, "project_set", instance, action, reverse, pk_set)
+
+
+@receiver(m2m_changed, sender=Team.members.through, dispatch_uid="core.team_members_touch")
+def team_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    _touch_owners(Team, "team_set", instance, action, reverse, pk_set)
+
+
+# ======================================================
+# 🗄️ API response cache
+# ======================================================
+CACHED_MODELS = (Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity)
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    bump_model_versions(sender)
+
+
+for _model in CACHED_MODELS:
+    _name = _model._meta.model_name
+    post_save.connect(invalidate_cached_responses, sender=_model, dispatch_uid=f"core.{_name}_saved_cache")
+    post_delete.connect(invalidate_cached_responses, sender=_model, dispatch_uid=f"core.{_name}_deleted_cache")
+
+
+# ======================================================
+# 🪦 Delete tombstones for the changes feeds
+# ======================================================
+# Rows removed through CASCADE from a Client or Project send post_delete too,
+# one signal per row, so they get their tombstone like direct deletes.
+def record_tombstone(sender, instance, **kwargs):
+    Tombstone.objects.create(model=sender._meta.label_lower, object_id=instance.pk)
+
+
+for _model in CACHED_MODELS:
+    post_delete.connect(
+        record_tombstone, sender=_model, dispatch_uid=f"core.{_model._meta.model_name}_deleted_tombstone",
+    )
+
+
+# ======================================================
+# 🔐 Token revocation on account changes
+# ======================================================
+# Tokens carry the role and staff flags, so a change to what they were issued
+# from revokes them (last_login updates on every login are ignored).
+User = get_user_model()
+AUTH_FIELDS = ("password", "is_active", "is_staff", "is_superuser")
+
+
+@receiver(pre_save, sender=User, dispatch_uid="core.user_revoke_tokens")
+def revoke_changed_user(sender, instance, update_fields=None, **kwargs):
+    if not instance.pk or (update_fields is not None and not set(update_fields) & set(AUTH_FIELDS)):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values(*AUTH_FIELDS).first()
+    if stored and any(stored[field] != getattr(instance, field) for field in AUTH_FIELDS):
+        user_id = instance.pk
+        transaction.on_commit(lambda: revoke_user(user_id))
+
+
+@receiver(post_delete, sender=User, dispatch_uid="core.user_deleted_revoke_tokens")
+def revoke_deleted_user(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: revoke_user(user_id))
+
+
+@receiver(m2m_changed, sender=User.groups.through, dispatch_uid="core.user_groups_revoke_tokens")
+def revoke_regrouped_user(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        user_ids = [instance.pk]
+    elif action == "pre_clear":
+        user_ids = list(instance.user_set.values_list("pk", flat=True))
+    else:
+        user_ids = list(pk_set or ())
+    transaction.on_commit(lambda: [revoke_user(user_id) for user_id in user_ids])
@@ -0,0 +1,102 @@
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .models import Client, Project, Member, ProjectActivity, DashboardStat
+
+
+# ======================================================
+# 📊 Dashboard statistics snapshot
+# ======================================================
+# Counters live in the DashboardStat table under keys like "clients.total",
+# "clients.hot" or "members.current". Signals in core.signals apply deltas on
+# every write, so the dashboard reads them back with a single query.
+
+def client_key(status):
+    return f"clients.{status}"
+
+
+def project_key(status):
+    return f"projects.{status}"
+
+
+def current_members_count():
+    return Member.objects.current().count()
+
+
+def compute_dashboard_stats():
+    """Recompute every counter from scratch with grouped queries."""
+    stats = {client_key(key): 0 for key, _ in Client.STATUS_CHOICES}
+    stats.update({project_key(key): 0 for key, _ in Project.STATUS_CHOICES})
+
+    client_rows = Client.objects.values("status").annotate(n=Count("id")).order_by()
+    stats["clients.total"] = 0
+    for row in client_rows:
+        stats["clients.total"] += row["n"]
+        if row["status"]:
+            stats[client_key(row["status"])] = row["n"]
+
+    project_rows = Project.objects.values("status").annotate(n=Count("id")).order_by()
+    stats["projects.total"] = 0
+    for row in project_rows:
+        stats["projects.total"] += row["n"]
+        if row["status"]:
+            stats[project_key(row["status"])] = row["n"]
+
+    stats["members.total"] = Member.objects.count()
+    stats["members.current"] = current_members_count()
+    stats["activities.total"] = ProjectActivity.objects.count()
+    return stats
+
+
+def rebuild_dashboard_stats():
+    # One upsert, so two first-time rebuilds racing on an empty table both succeed.
+    stats = compute_dashboard_stats()
+    now = timezone.now()
+    DashboardStat.objects.bulk_create(
+        [DashboardStat(key=key, value=value, updated_at=now) for key, value in stats.items()],
+        update_conflicts=True, unique_fields=["key"], update_fields=["value", "updated_at"],
+    )
+    return stats
+
+
+def get_dashboard_stats():
+    stats = dict(DashboardStat.objects.values_list("key", "value"))
+    if not stats:
+        stats = rebuild_dashboard_stats()
+    return stats
+
+
+def bump(deltas):
+    """
+    Apply counter deltas, e.g. bump({"clients.total": 1, "clients.hot": 1}).
+    Falls back to a full rebuild when the snapshot has not been seeded yet.
+    """
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        updated = DashboardStat.objects.filter(key=key).update(
+            value=F("value") + delta, updated_at=timezone.now()
+        )
+        if not updated:
+            rebuild_dashboard_stats()
+            return
+
+
+def set_stat(key, value):
+    if not DashboardStat.objects.filter(key=key).update(value=value, updated_at=timezone.now()):
+        rebuild_dashboard_stats()
+
+
+def refresh_member_stats():
+    """Full recount of members.current; writes that know which members changed use refresh_engagement()."""
+    set_stat("members.current", current_members_count())
+
+
+def refresh_engagement(members):
+    """
+    Recompute active_assignment_count for the ``members`` queryset and move
+    members.current by how many of them started or stopped being current.
+    """
+    before = members.current().count()
+    members.refresh_engagement()
+    bump({"members.current": members.current().count() - before})
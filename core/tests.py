@@ -1,3 +1,1139 @@
-from django.test import TestCase
+import base64
+import datetime
+import io
+import json
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import Group, User
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.conf import settings
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import ClaimsJWTAuthentication
+from .benchmark import bench_targets, run_benchmark
+from .pagination import decode_cursor, encode_cursor
+from .permissions import IsManagerOrReadOnly
+from .models import Client, Project, ProjectCredential, Team, Member, MemberAssigned, ProjectActivity, DashboardStat
+from .search import rebuild_index, search
+from .seeding import Seeder, parse_scale, table_counts
+from .stats import compute_dashboard_stats, get_dashboard_stats, rebuild_dashboard_stats
+
+
+class ProjectDossierTests(TestCase):
+    # project + client, then credentials, assignments + members, teams,
+    # team members and activity logs
+    QUERY_BUDGET = 6
+
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        client = Client.objects.create(Client_name="Acme", status="hot", created_by="test")
+        self.project = Project.objects.create(
+            name="Portal", client=client, type="client", status="active", created_by="test"
+        )
+        self.url = reverse("project-dossier", args=[self.project.pk])
+        self.grow(1)
+
+    def grow(self, n):
+        start = Member.objects.count()
+        members = [Member.objects.create(name=f"Member {start + i}", role="dev", created_by="test") for i in range(n)]
+        team = Team.objects.create(team_type=f"Team {start}", created_by="test")
+        team.members.add(*members)
+        self.project.teams_assigned.add(team)
+        for member in members:
+            MemberAssigned.objects.create(member=member, project=self.project, created_by="test")
+            ProjectActivity.objects.create(project=self.project, status="started", created_by="test")
+            ProjectCredential.objects.create(project=self.project, key=f"key-{member.pk}", value="v", created_by="test")
+
+    def test_query_count_does_not_grow_with_the_project(self):
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            small = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.grow(20)
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            large = self.client.get(self.url)
+
+        self.assertEqual(small.status_code, 200)
+        self.assertEqual(large.status_code, 200)
+        data = large.json()
+        self.assertEqual(data["client"]["Client_name"], "Acme")
+        self.assertEqual(len(data["assignments"]), 21)
+        self.assertEqual(len(data["teams_assigned"]), 2)
+        self.assertEqual(sum(len(team["members"]) for team in data["teams_assigned"]), 21)
+        self.assertEqual(len(data["activity_logs"]), 21)
+        self.assertEqual(len(data["credentials"]), 21)
+
+    def test_repeated_read_is_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_unknown_project(self):
+        self.assertEqual(self.client.get(reverse("project-dossier", args=[0])).status_code, 404)
+
+
+class SeedAndBenchmarkTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            seeder = Seeder(table_counts(parse_scale("500")), seed=1, batch_size=100)
+            self.written = dict(seeder.run())
+            seeder.refresh_derived_state()
+
+    def test_seeding_keeps_derived_state_consistent(self):
+        self.assertEqual(self.written["projects"], 50)
+        self.assertEqual(Project.objects.count(), 50)
+        self.assertEqual(get_dashboard_stats(), compute_dashboard_stats())
+        engaged = MemberAssigned.objects.filter(is_active=True, project__status__in=Project.ENGAGED_STATUSES)
+        self.assertEqual(Member.objects.current().count(), engaged.values("member_id").distinct().count())
+        client = Client.objects.order_by("pk").first()
+        self.assertIn(("client", client.pk), [(hit["type"], hit["id"]) for hit in search(client.Client_name)])
+
+    def test_ids_are_read_back_by_name_where_bulk_insert_returns_none(self):
+        features = type(connection.features)
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", new_callable=mock.PropertyMock) as can:
+            can.return_value = False
+            seeder = Seeder(table_counts(parse_scale("200")), seed=2, batch_size=7)
+            written = dict(seeder.run())
+        self.assertEqual(written["members"], len(set(seeder.member_ids)))
+        names = dict(Member.objects.filter(pk__in=seeder.member_ids).values_list("pk", "name"))
+        self.assertEqual([names[pk].rsplit(" ", 1)[1] for pk in seeder.member_ids],
+                         [str(n) for n in range(written["members"])])
+        statuses = dict(Project.objects.values_list("pk", "status"))
+        self.assertTrue(all(statuses[pk] == status for pk, (status, _) in seeder.project_info.items()))
+
+    def test_every_benchmark_target_answers(self):
+        report = run_benchmark(bench_targets(), iterations=1, warmup=0)
+        failed = [(result["name"], result["status"]) for result in report["results"] if result["status"] != 200]
+        self.assertEqual(failed, [])
+        self.assertEqual(report["rows"]["core.Project"], 50)
+
+
+class RequestProfilingTests(TestCase):
+    def setUp(self):
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        for n in range(3):
+            Project.objects.create(name=f"Project {n}", client=client, type="client", created_by="test")
+
+    def test_disabled_by_default(self):
+        from django.template import engines
+        from .profiling import ProfiledDjangoTemplates
+
+        response = self.client.get(reverse("dashboard"))
+        self.assertNotIn("Server-Timing", response.headers)
+        self.assertFalse(any(isinstance(engine, ProfiledDjangoTemplates) for engine in engines.all()))
+
+    @override_settings(
+        REQUEST_PROFILING=True, SLOW_REQUEST_MS=0,
+        TEMPLATES=[{**settings.TEMPLATES[0], "BACKEND": "core.profiling.ProfiledDjangoTemplates"}],
+    )
+    def test_server_timing_and_slow_request_log(self):
+        with self.assertLogs("core.profiling", "WARNING") as logs:
+            response = self.client.get(reverse("projects_list"))
+
+        self.assertEqual(response.status_code, 200)
+        metrics = [part.strip().split(";")[0] for part in response["Server-Timing"].split(",")]
+        self.assertEqual(metrics, ["db", "render", "app", "total"])
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry["view"], "projects_list")
+        self.assertIn(f'desc="{entry["queries"]} queries"', response["Server-Timing"])
+        self.assertGreater(entry["queries"], 0)
+        self.assertGreater(entry["render_ms"], 0)
+        self.assertLessEqual(len(entry["slowest"]), settings.SLOW_REQUEST_LOGGED_QUERIES)
+
+
+class ProjectHistoryTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        self.project = Project.objects.create(name="Portal", client=client, type="client", created_by="test")
+        for status, start, end in (
+            ("started", (2024, 1, 1), (2024, 1, 11)),
+            ("paused", (2024, 1, 11), None),     # runs until the next activity
+            ("resumed", (2024, 2, 1), (2024, 3, 1)),
+            ("on-hold", (2024, 2, 20), None),    # cuts "resumed" short
+            ("completed", (2024, 4, 1), None),   # terminal: no time accrues
+            (None, (2024, 5, 1), None),          # no status: not part of the history
+        ):
+            ProjectActivity.objects.create(
+                project=self.project, status=status, activity_from=datetime.date(*start),
+                activity_to=datetime.date(*end) if end else None, created_by="test",
+            )
+
+    def test_timeline_and_days_in_status(self):
+        url = reverse("project-history", args=[self.project.pk])
+        with self.assertNumQueries(2):
+            data = self.client.get(url, {"as_of": "2024-06-01"}).json()
+
+        self.assertEqual(data["current_status"], "completed")
+        self.assertEqual(data["days_in_status"], {
+            "started": 10, "paused": 21, "resumed": 19, "completed": 0, "on-hold": 41,
+        })
+        self.assertEqual(
+            [(period["status"], period["from"], period["to"]) for period in data["timeline"]],
+            [
+                ("started", "2024-01-01", "2024-01-11"),
+                ("paused", "2024-01-11", "2024-02-01"),
+                ("resumed", "2024-02-01", "2024-02-20"),
+                ("on-hold", "2024-02-20", "2024-04-01"),
+                ("completed", "2024-04-01", "2024-04-01"),
+            ],
+        )
+
+    def test_list_covers_the_page_in_one_history_query(self):
+        Project.objects.create(name="Empty", client=self.project.client, type="internal", created_by="test")
+        with self.assertNumQueries(2):
+            data = self.client.get(reverse("project-histories"), {"timeline": "false"}).json()
+
+        by_name = {item["name"]: item for item in data["results"]}
+        self.assertEqual(by_name["Portal"]["days_in_status"]["on-hold"], 41)
+        self.assertIsNone(by_name["Empty"]["current_status"])
+        self.assertNotIn("timeline", by_name["Empty"])
+
+
+class MemberAvailabilityTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        active = Project.objects.create(name="Live", client=client, type="client", status="active", created_by="test")
+        dead = Project.objects.create(name="Gone", client=client, type="client", status="dead", created_by="test")
+        self.busy = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+        self.free = Member.objects.create(name="Liam Smith", role="Developer", created_by="test")
+        for project, member, start, end, is_active in (
+            (active, self.busy, (2025, 3, 5), (2025, 3, 10), True),
+            (active, self.busy, (2025, 3, 8), None, True),          # open-ended
+            (active, self.busy, None, (2025, 3, 2), True),          # open start
+            (active, self.busy, (2025, 3, 1), (2025, 3, 31), False),  # inactive: ignored
+            (dead, self.free, (2025, 3, 1), (2025, 3, 31), True),     # dead project: ignored
+        ):
+            MemberAssigned.objects.create(
+                project=project, member=member, is_active=is_active, created_by="test",
+                assigned_from=datetime.date(*start) if start else None,
+                assigned_to=datetime.date(*end) if end else None,
+            )
+        self.window = {"from": "2025-03-01", "to": "2025-03-15"}
+
+    def test_free_busy_segments(self):
+        data = self.client.get(reverse("member-availability", args=[self.busy.pk]), self.window).json()
+
+        self.assertEqual(data["busy_days"], 13)
+        self.assertEqual(data["free"], [{"from": "2025-03-03", "to": "2025-03-04", "days": 2}])
+        self.assertEqual(data["max_concurrent"], 2)
+        self.assertEqual(
+            [(period["from"], period["to"], period["assignments"]) for period in data["load"]],
+            [
+                ("2025-03-01", "2025-03-02", 1),
+                ("2025-03-05", "2025-03-07", 1),
+                ("2025-03-08", "2025-03-10", 2),
+                ("2025-03-11", "2025-03-15", 1),
+            ],
+        )
+
+    def test_who_is_free_for_a_page_of_members(self):
+        url = reverse("member-availabilities")
+        with self.assertNumQueries(2):
+            data = self.client.get(url, {**self.window, "available": "true"}).json()
+        self.assertEqual([item["member"] for item in data["results"]], [self.free.pk])
+        self.assertEqual(data["results"][0]["free_days"], 15)
+
+        data = self.client.get(url, {"from": "2025-03-03", "to": "2025-03-04", "available": "true"}).json()
+        self.assertEqual(len(data["results"]), 2)
+
+    def test_name_filter_ignores_terms_too_short_to_search(self):
+        url = reverse("member-availabilities")
+        data = self.client.get(url, {**self.window, "q": "pri"}).json()
+        self.assertEqual([item["member"] for item in data["results"]], [self.busy.pk])
+        data = self.client.get(url, {**self.window, "q": "p"}).json()
+        self.assertEqual(len(data["results"]), 2)
+
+
+class AssignmentOverlapTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        self.user = User.objects.create_user("lead", password="pw", is_staff=True)
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(self.user)}"
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        self.project = Project.objects.create(
+            name="Live", client=client, type="client", status="active", created_by="test",
+        )
+        self.member = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+        self.existing = MemberAssigned.objects.create(
+            project=self.project, member=self.member, is_active=True, created_by="test",
+            assigned_from=datetime.date(2025, 3, 1), assigned_to=datetime.date(2025, 3, 31),
+        )
+
+    def item(self, start, end, **extra):
+        return {
+            "project": self.project.pk, "member": self.member.pk, "is_active": True,
+            "assigned_from": start, "assigned_to": end, **extra,
+        }
+
+    def test_create_rejects_overlap(self):
+        url = reverse("memberassigned-list")
+        response = self.client.post(url, self.item("2025-03-31", None), content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(f"#{self.existing.pk}", response.json()["non_field_errors"][0])
+
+        for start, end, is_active in (("2025-04-01", None, True), ("2025-03-10", "2025-03-20", False)):
+            response = self.client.post(url, self.item(start, end, is_active=is_active), content_type="application/json")
+            self.assertEqual(response.status_code, 201)
+
+    def test_bulk_reports_conflicts_per_item(self):
+        response = self.client.post(reverse("memberassigned-bulk-create"), [
+            self.item("2025-04-01", "2025-04-10"),
+            self.item("2025-04-10", "2025-04-20"),  # overlaps the item above
+            self.item("2025-05-01", "2025-05-02"),
+        ], content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertIsNone(errors[0])
+        self.assertIn("item 0", errors[1]["non_field_errors"][0])
+        self.assertIsNone(errors[2])
+        self.assertEqual(MemberAssigned.objects.count(), 1)
+
+    def test_audit_finds_stored_overlaps(self):
+        MemberAssigned.objects.create(
+            project=self.project, member=self.member, is_active=True, created_by="test",
+            assigned_from=None, assigned_to=datetime.date(2025, 3, 1),
+        )
+        out = io.StringIO()
+        with self.assertRaises(CommandError):
+            call_command("audit_assignment_overlaps", "--fail", stdout=out)
+        self.assertIn("1 overlapping assignment(s).", out.getvalue())
+
+
+class ExpireAssignmentsTests(TestCase):
+    def test_expires_ended_assignments_and_refreshes_counters(self):
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        project = Project.objects.create(name="Live", client=client, type="client", status="hot", created_by="test")
+        member = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+        today = datetime.date(2025, 3, 15)
+        ended, _, _ = [
+            MemberAssigned.objects.create(
+                project=project, member=member, is_active=True, created_by="test", assigned_to=end,
+            )
+            for end in (datetime.date(2025, 3, 14), datetime.date(2025, 3, 15), None)
+        ]
+        member.refresh_from_db()
+        self.assertEqual(member.active_assignment_count, 3)
+
+        out = io.StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("expire_assignments", "--date", "2025-03-15", "--batch-size", "1", stdout=out)
+        self.assertIn("Expired 1 assignment(s) of 1 member(s)", out.getvalue())
+
+        ended.refresh_from_db()
+        self.assertFalse(ended.is_active)
+        self.assertEqual(ended.updated_by, "system")
+        self.assertEqual(MemberAssigned.objects.filter(is_active=True).count(), 2)
+        member.refresh_from_db()
+        self.assertEqual(member.active_assignment_count, 2)
+        self.assertEqual(get_dashboard_stats()["members.current"], 1)
+
+
+@override_settings(CHANGES_SETTLE_SECONDS=0)
+class ChangesFeedTests(TestCase):
+    def setUp(self):
+        self.acme = Client.objects.create(Client_name="Acme", created_by="test")
+        self.globex = Client.objects.create(Client_name="Globex", created_by="test")
+        self.project = Project.objects.create(name="Portal", client=self.acme, type="client", created_by="test")
+        self.activity = ProjectActivity.objects.create(project=self.project, status="started", created_by="test")
+
+    def test_resource_feed_returns_only_rows_changed_since_the_cursor(self):
+        url = reverse("client-changes")
+        first = self.client.get(url).json()
+        self.assertEqual([row["id"] for row in first["changed"]], [self.acme.pk, self.globex.pk])
+        self.assertEqual(first["deleted"], [])
+        self.assertFalse(first["has_more"])
+
+        self.assertEqual(self.client.get(url, {"after": first["next"]}).json()["changed"], [])
+        self.globex.status = "hot"
+        self.globex.save()
+        data = self.client.get(url, {"after": first["next"]}).json()
+        self.assertEqual([(row["id"], row["status"]) for row in data["changed"]], [(self.globex.pk, "hot")])
+
+    def test_combined_feed_reports_cascaded_deletes(self):
+        url = reverse("changes")
+        cursor = self.client.get(url, {"resources": "projects,activities"}).json()["next"]
+        self.acme.delete()
+
+        data = self.client.get(url, {"resources": "projects,activities", "after": cursor}).json()
+        self.assertEqual([row["id"] for row in data["resources"]["projects"]["deleted"]], [self.project.pk])
+        self.assertEqual([row["id"] for row in data["resources"]["activities"]["deleted"]], [self.activity.pk])
+        self.assertEqual(set(data["resources"]), {"projects", "activities"})
+
+    def test_cursor_older_than_tombstone_retention_is_gone(self):
+        response = self.client.get(reverse("client-changes"), {"since": "2000-01-01T00:00:00Z"})
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(self.client.get(reverse("changes"), {"resources": "nope"}).status_code, 400)
+
+
+class StatelessJWTTests(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.user = User.objects.create_user("lead", password="pw")
+        self.factory = RequestFactory()
+
+    def authenticate(self, token):
+        request = self.factory.get("/api/clients/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return ClaimsJWTAuthentication().authenticate(request)
+
+    def login(self, username="lead"):
+        response = self.client.post(reverse("custom_token_obtain"), {"username": username, "password": "pw"})
+        return response.json()["tokens"]
+
+    def test_login_token_authenticates_without_queries(self):
+        tokens = self.login()
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate(tokens["access"])
+        self.assertEqual((user.id, user.username, user.role, user.is_staff), (str(self.user.pk), "lead", "member", False))
+
+    def test_tokens_without_claims_use_the_cached_lookup(self):
+        token = AccessToken.for_user(self.user)
+        with self.assertNumQueries(2):  # the user row and its groups, once
+            self.assertEqual(self.authenticate(token)[0].role, "member")
+        with self.assertNumQueries(0):
+            self.authenticate(token)
+
+    def test_role_claim_drives_manager_permission(self):
+        Group.objects.create(name="manager").user_set.add(User.objects.create_user("boss", password="pw"))
+        permission = IsManagerOrReadOnly()
+        for username, allowed in (("lead", False), ("boss", True)):
+            request = self.factory.post("/api/projects/")
+            request.user, _ = self.authenticate(self.login(username)["access"])
+            with self.assertNumQueries(0):
+                self.assertEqual(permission.has_permission(request, None), allowed)
+
+    def test_logout_and_account_changes_revoke_tokens(self):
+        tokens = self.login()
+        response = self.client.post(
+            reverse("logout"), {"refresh": tokens["refresh"]}, HTTP_AUTHORIZATION=f"Bearer {tokens['access']}",
+        )
+        self.assertEqual(response.status_code, 204)
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(tokens["access"])
+        self.assertEqual(self.client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]}).status_code, 401)
+
+        # Issued moments before the account change, most likely in the same second
+        access = self.login()["access"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+    def test_token_issued_after_the_revocation_is_valid(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password("new")
+            self.user.save()
+        response = self.client.post(reverse("custom_token_obtain"), {"username": "lead", "password": "new"})
+        self.assertEqual(response.status_code, 200)
+        user, _ = self.authenticate(response.json()["tokens"]["access"])
+        self.assertEqual(user.id, str(self.user.pk))
+
+    def test_default_authentication_honours_logout(self):
+        access = self.login()["access"]
+        url = reverse("client-list")
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {access}").status_code, 200)
+        self.client.post(reverse("logout"), HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {access}").status_code, 401)
+
+    def test_api_writes_need_the_manager_role(self):
+        url = reverse("client-list")
+        data = {"Client_name": "Initech"}
+        self.assertEqual(
+            self.client.post(url, data, HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}").status_code, 403,
+        )
+        Group.objects.create(name="manager").user_set.add(self.user)
+        self.assertEqual(
+            self.client.post(url, data, HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}").status_code, 201,
+        )
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self):
+        self.client_row = Client.objects.create(Client_name="Acme", status="hot", created_by="test")
+        self.project = Project.objects.create(
+            name="Portal", client=self.client_row, type="client", status="active", created_by="test",
+        )
+        self.member = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+
+    def assertSnapshotMatches(self):
+        self.assertEqual(get_dashboard_stats(), compute_dashboard_stats())
+
+    def test_signals_keep_the_snapshot_in_step(self):
+        assignment = MemberAssigned.objects.create(project=self.project, member=self.member, created_by="test")
+        self.assertEqual(get_dashboard_stats()["members.current"], 1)
+        self.client_row.status = "inactive"
+        self.client_row.save()
+        self.project.status = "dead"
+        self.project.save()
+        self.assertEqual(get_dashboard_stats()["members.current"], 0)
+        self.assertSnapshotMatches()
+
+        self.project.status = "hot"
+        self.project.save()
+        assignment.delete()
+        self.assertSnapshotMatches()
+        self.client_row.delete()
+        self.assertSnapshotMatches()
+
+    def test_member_delete_cascades_out_of_current(self):
+        MemberAssigned.objects.create(project=self.project, member=self.member, created_by="test")
+        self.member.delete()
+        self.assertEqual(get_dashboard_stats()["members.current"], 0)
+        self.assertSnapshotMatches()
+
+    def test_rebuild_upserts_existing_keys(self):
+        DashboardStat.objects.filter(key="clients.total").update(value=99)
+        DashboardStat.objects.filter(key="projects.total").delete()
+        rebuild_dashboard_stats()
+        rebuild_dashboard_stats()
+        self.assertSnapshotMatches()
+        self.assertEqual(DashboardStat.objects.filter(key="projects.total").count(), 1)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        for n in range(5):
+            Client.objects.create(Client_name=f"Client {n}", created_by="test")
+        # Ties on updated_at are broken by id
+        Client.objects.update(updated_at=timezone.now())
+        self.newest_first = list(Client.objects.order_by("-id").values_list("id", flat=True))
+
+    def test_cursor_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor(timezone.now().replace(microsecond=0), 7))[1], 7)
+
+        seen, pages, url = [], [], reverse("client-list") + "?page_size=2"
+        while url:
+            data = self.client.get(url).json()
+            pages.append(data)
+            seen += [row["id"] for row in data["results"]]
+            url = data["next"]
+        self.assertEqual(seen, self.newest_first)
+        self.assertEqual(len(pages), 3)
+
+        back = self.client.get(pages[2]["previous"]).json()
+        self.assertEqual(back["results"], pages[1]["results"])
+
+    def test_tampered_cursor_is_rejected(self):
+        forged = base64.urlsafe_b64encode(json.dumps(["yesterday", "x"]).encode()).decode()
+        for cursor in ("not-a-cursor", forged):
+            response = self.client.get(reverse("client-list"), {"after": cursor})
+            self.assertEqual(response.status_code, 404)
+
+
+class ListPagePaginationTests(TestCase):
+    def setUp(self):
+        for n in range(5):
+            Client.objects.create(Client_name=f"Client {n}", status="hot" if n % 2 else "active", created_by="test")
+        self.newest_first = list(Client.objects.order_by("-updated_at", "-id").values_list("id", flat=True))
+
+    def pks(self, **params):
+        return [client.pk for client in self.client.get(reverse("clients_list"), params).context["page"]]
+
+    def test_pages_follow_the_cursor(self):
+        response = self.client.get(reverse("clients_list"), {"page_size": 2})
+        self.assertEqual([c.pk for c in response.context["page"]], self.newest_first[:2])
+        after = response.context["next_url"].split("after=")[1]
+        self.assertEqual(self.pks(page_size=2, after=after), self.newest_first[2:4])
+        # A broken cursor starts over instead of failing
+        self.assertEqual(self.pks(page_size=2, after="not-a-cursor"), self.newest_first[:2])
+
+    def test_status_filter_runs_in_the_database(self):
+        hot = list(Client.objects.filter(status="hot").order_by("-updated_at", "-id").values_list("id", flat=True))
+        self.assertEqual(self.pks(status="hot"), hot)
+
+
+class ClientSummaryQueryTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+
+    def add_clients(self, count):
+        for n in range(count):
+            client = Client.objects.create(Client_name=f"Client {n}", created_by="test")
+            for status in ("active", "hot", "dead"):
+                Project.objects.create(name=f"{status} {n}", client=client, type="client", status=status,
+                                       created_by="test")
+
+    def test_query_count_does_not_grow_with_clients(self):
+        # the annotated clients and one prefetch of project names; ETags need no query
+        for count in (2, 8):
+            self.add_clients(count)
+            caches[settings.API_CACHE_ALIAS].clear()
+            with self.assertNumQueries(2):
+                response = self.client.get(reverse("clients_list"))
+            with self.assertNumQueries(2):
+                data = self.client.get(reverse("client-list"), {"with_projects": 1}).json()
+        self.assertEqual(len(response.context["clients"]), 10)
+        first = data["results"][0]
+        self.assertEqual(first["project_count"], 3)
+        self.assertEqual(first["project_status_counts"], {"active": 1, "inactive": 0, "hot": 1, "dead": 1})
+
+    def test_counts_come_from_the_page_rows_only(self):
+
+        self.add_clients(5)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("clients_list"), {"page_size": 2})
+        clients_sql, projects_sql = (query["sql"] for query in queries.captured_queries)
+        self.assertNotIn("GROUP BY", clients_sql)
+        self.assertNotIn("core_project", clients_sql)
+        self.assertIn("LIMIT 3", clients_sql)
+        # Projects are read for the page's clients (plus the look-ahead row) only
+        self.assertRegex(projects_sql, r'"client_id" IN \(\d+, \d+, \d+\)')
+
+
+class BulkWriteTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        user = User.objects.create_user("lead", password="pw", is_staff=True)
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        self.project = Project.objects.create(name="Live", client=client, type="client", status="hot", created_by="test")
+        self.members = [
+            Member.objects.create(name=name, role="Developer", created_by="test") for name in ("Priya", "Liam")
+        ]
+        self.url = reverse("memberassigned-bulk-create")
+
+    def items(self):
+        return [{"project": self.project.pk, "member": member.pk, "is_active": True} for member in self.members]
+
+    def assertCreated(self, response):
+        self.assertEqual(response.status_code, 201)
+        ids = [row["id"] for row in response.json()]
+        self.assertEqual(sorted(ids), sorted(MemberAssigned.objects.values_list("pk", flat=True)))
+        self.assertEqual(list(Member.objects.values_list("active_assignment_count", flat=True)), [1, 1])
+        self.assertEqual(get_dashboard_stats()["members.current"], 2)
+
+    def test_create_returns_ids_and_runs_hooks(self):
+        self.assertCreated(self.client.post(self.url, self.items(), content_type="application/json"))
+
+    def test_create_reselects_ids_where_bulk_insert_returns_none(self):
+        features = type(connection.features)
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", new_callable=mock.PropertyMock) as can:
+            can.return_value = False
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, self.items(), content_type="application/json")
+        self.assertCreated(response)
+        inserts = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("INSERT INTO \"core_memberassigned\"")]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual([row["member"] for row in response.json()], [m.pk for m in self.members])
+        self.assertEqual(set(MemberAssigned.objects.values_list("created_by", flat=True)), {"lead"})
+
+    def test_per_item_errors_write_nothing(self):
+        items = self.items()
+        items[1]["member"] = 0
+        response = self.client.post(self.url, items, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertIsNone(errors[0])
+        self.assertIn("member", errors[1])
+        self.assertFalse(MemberAssigned.objects.exists())
+
+    def test_failure_inside_the_write_rolls_back(self):
+        from .views import MemberAssignedViewSet
+        with mock.patch.object(MemberAssignedViewSet, "after_bulk_write", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.post(self.url, self.items(), content_type="application/json")
+        self.assertFalse(MemberAssigned.objects.exists())
+
+    def test_update_and_delete(self):
+        ids = [row["id"] for row in self.client.post(self.url, self.items(), content_type="application/json").json()]
+        response = self.client.patch(self.url, [{"id": ids[0], "is_active": False}, {"id": 0}],
+                                     content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"][1], {"id": ["Unknown or missing id."]})
+        self.assertEqual(MemberAssigned.objects.filter(is_active=True).count(), 2)
+
+        response = self.client.patch(self.url, [{"id": ids[0], "is_active": False}], content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Member.objects.get(pk=self.members[0].pk).active_assignment_count, 0)
+
+        response = self.client.delete(self.url, {"ids": [ids[1], 0]}, content_type="application/json")
+        self.assertEqual(response.json(), {"deleted": 1, "not_found": [0]})
+        self.assertEqual(get_dashboard_stats()["members.current"], 0)
+
+
+class CredentialSyncTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        client = Client.objects.create(Client_name="Acme", created_by="test")
+        self.project = Project.objects.create(name="Portal", client=client, type="client", created_by="test")
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectCredential.objects.sync(self.project, [("db", "old"), ("ssh", "keep")], "test")
+
+    def test_sync_touches_only_changed_rows_and_invalidates_the_cache(self):
+        kept = ProjectCredential.objects.get(key="ssh")
+        url = reverse("projectcredential-list")
+        self.assertIn("old", [row["value"] for row in self.client.get(url).json()["results"]])
+        dossier = reverse("project-dossier", args=[self.project.pk])
+        self.client.get(dossier)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectCredential.objects.sync(self.project, [("db", "new"), ("ssh", "keep"), ("", "")], "editor")
+
+        values = {row["key"]: row["value"] for row in self.client.get(url).json()["results"]}
+        self.assertEqual(values, {"db": "new", "ssh": "keep"})
+        self.assertEqual(ProjectCredential.objects.get(key="ssh").updated_at, kept.updated_at)
+        self.assertIn("new", json.dumps(self.client.get(dossier).json()))
+
+
+class ExplainHotQueriesTests(TestCase):
+    command = "core.management.commands.explain_hot_queries"
+
+    def test_reports_a_verdict_for_every_hot_query(self):
+        from .management.commands.explain_hot_queries import hot_queries
+
+        out = io.StringIO()
+        call_command("explain_hot_queries", stdout=out, no_color=True)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), len(hot_queries()))
+        clients = next(line for line in lines if line.startswith("clients list "))
+        self.assertIn("INDEX", clients)
+        self.assertIn("client_updated_id_idx", clients)
+
+    def test_classifies_index_reads_and_scans(self):
+        from .management.commands.explain_hot_queries import classify_plan
+
+        _, scans, indexes = classify_plan(Client.objects.order_by("-updated_at", "-id")[:26])
+        self.assertEqual(scans, [])
+        self.assertIn("client_updated_id_idx", indexes)
+        _, scans, _ = classify_plan(Client.objects.filter(Client_name__icontains="acme"))
+        self.assertEqual(scans, ["core_client"])
+
+    def test_fail_on_scan_only_counts_unbounded_queries(self):
+        scan = Client.objects.filter(Client_name__icontains="acme")
+        with mock.patch(f"{self.command}.hot_queries", return_value=[("tiny table", scan, True)]):
+            out = io.StringIO()
+            call_command("explain_hot_queries", "--fail-on-scan", stdout=out, no_color=True)
+            self.assertIn("SCAN (bounded table)", out.getvalue())
+        with mock.patch(f"{self.command}.hot_queries", return_value=[("big table", scan, False)]):
+            with self.assertRaisesMessage(CommandError, "big table"):
+                call_command("explain_hot_queries", "--fail-on-scan", stdout=io.StringIO())
+
+
+class ActiveAssignmentCountTests(TestCase):
+    def setUp(self):
+        self.client_row = Client.objects.create(Client_name="Acme", created_by="test")
+        self.active, self.hot, self.dead = (
+            Project.objects.create(name=status, client=self.client_row, type="client", status=status, created_by="test")
+            for status in ("active", "hot", "dead")
+        )
+        self.member = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+
+    def assertCount(self, expected, member=None):
+        member = member or self.member
+        member.refresh_from_db()
+        self.assertEqual(member.active_assignment_count, expected)
+        # The maintained counter agrees with a full recount.
+        self.assertEqual(Member.objects.filter(pk=member.pk).refresh_engagement(), 0)
+
+    def test_assignment_and_project_status_transitions(self):
+        first = MemberAssigned.objects.create(project=self.active, member=self.member, created_by="test")
+        self.assertCount(1)
+        MemberAssigned.objects.create(project=self.hot, member=self.member, created_by="test")
+        moved = MemberAssigned.objects.create(project=self.dead, member=self.member, created_by="test")
+        self.assertCount(2)
+
+        first.is_active = False
+        first.save()
+        self.assertCount(1)
+        self.dead.status = "active"
+        self.dead.save()
+        self.assertCount(2)
+        self.hot.status = "dead"
+        self.hot.save()
+        self.assertCount(1)
+        moved.project = self.hot
+        moved.save()
+        self.assertCount(0)
+        self.assertFalse(Member.objects.current().exists())
+
+    def test_cascading_deletes(self):
+        MemberAssigned.objects.create(project=self.active, member=self.member, created_by="test")
+        MemberAssigned.objects.create(project=self.hot, member=self.member, created_by="test")
+        self.assertCount(2)
+        self.active.delete()
+        self.assertCount(1)
+        self.client_row.delete()
+        self.assertCount(0)
+
+    def test_saving_a_stale_copy_keeps_the_counter(self):
+        stale = Member.objects.get(pk=self.member.pk)
+        MemberAssigned.objects.create(project=self.active, member=self.member, created_by="test")
+        stale.role = "Lead"
+        stale.save()
+        self.assertCount(1)
+        self.assertEqual(self.member.role, "Lead")
+
+    def test_saving_a_missing_row_inserts_it(self):
+        pk = self.member.pk
+        Member.objects.filter(pk=pk).delete()
+        self.member.save()
+        self.assertTrue(Member.objects.filter(pk=pk, name="Priya Sharma").exists())
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.acme = Client.objects.create(Client_name="Acme Corp", created_by="test")
+        other = Client.objects.create(Client_name="Globex", created_by="test")
+        self.portal = Project.objects.create(
+            name="Billing portal", client=other, type="client", description="Acme integration", created_by="test",
+        )
+        self.member = Member.objects.create(name="Acmeson", role="Developer", created_by="test")
+
+    def hits(self, query, **kwargs):
+        return [(hit["type"], hit["id"]) for hit in search(query, **kwargs)]
+
+    def test_ranks_whole_word_name_matches_first(self):
+        self.assertEqual(self.hits("acme"), [
+            ("client", self.acme.pk), ("member", self.member.pk), ("project", self.portal.pk),
+        ])
+        self.assertEqual(self.hits("acme", kinds=["project"]), [("project", self.portal.pk)])
+        # Every term must match, and terms under three characters are ignored
+        self.assertEqual(self.hits("acme bill"), [("project", self.portal.pk)])
+        self.assertEqual(self.hits("acme po"), self.hits("acme"))
+        self.assertEqual(self.hits("ac"), [])
+
+    def test_saves_and_deletes_reindex_one_row(self):
+        self.acme.Client_name = "Initech"
+        self.acme.save()
+        self.assertNotIn(("client", self.acme.pk), self.hits("acme"))
+        self.assertEqual(self.hits("initech"), [("client", self.acme.pk)])
+        self.member.delete()
+        self.assertNotIn(("member", self.member.pk), self.hits("acmeson"))
+        # A full rebuild gives the same answers as the incremental updates
+        list(rebuild_index())
+        self.assertEqual(self.hits("initech"), [("client", self.acme.pk)])
+
+    def test_list_filters_match_substrings(self):
+        projects = self.client.get(reverse("project-list"), {"client": "lobe"}).json()["results"]
+        self.assertEqual([row["id"] for row in projects], [self.portal.pk])
+        projects = self.client.get(reverse("project-list"), {"q": "a"}).json()["results"]
+        self.assertEqual([row["id"] for row in projects], [self.portal.pk])
+        page = self.client.get(reverse("clients_list"), {"q": "cme"}).context["page"]
+        self.assertEqual([client.pk for client in page], [self.acme.pk])
+        page = self.client.get(reverse("members_list"), {"q": "velop"}).context["page"]
+        self.assertEqual([member.pk for member in page], [self.member.pk])
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        self.acme = Client.objects.create(Client_name="Acme", created_by="test")
+        self.globex = Client.objects.create(Client_name="Globex", created_by="test")
+
+    def test_list_revalidates_by_etag_after_a_delete(self):
+        url = reverse("client-list")
+        response = self.client.get(url)
+        etag = response["ETag"]
+        # MAX(updated_at) does not move on a delete, so lists only send an ETag
+        self.assertFalse(response.has_header("Last-Modified"))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.globex.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["id"] for row in response.json()["results"]], [self.acme.pk])
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT").status_code, 200)
+
+    def test_list_page_revalidation_runs_no_query(self):
+        url = reverse("clients_list")
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.globex.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_page_etag_follows_staff_and_superuser_flags(self):
+        user = User.objects.create_user("lead", password="pw")
+        self.client.force_login(user)
+        url = reverse("clients_list")
+        etag = self.client.get(url)["ETag"]
+        User.objects.filter(pk=user.pk).update(is_superuser=True)
+        self.assertNotEqual(self.client.get(url)["ETag"], etag)
+
+    def test_retrieve_honours_if_modified_since(self):
+        url = reverse("client-detail", args=[self.acme.pk])
+        last_modified = self.client.get(url)["Last-Modified"]
+        # Both the cached copy and a fresh render answer 304
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        caches[settings.API_CACHE_ALIAS].clear()
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.acme.Client_name = "Acme Corp"
+            self.acme.save()
+            Client.objects.filter(pk=self.acme.pk).update(updated_at=self.acme.updated_at + datetime.timedelta(seconds=2))
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["Client_name"], "Acme Corp")
+
+
+class CacheInvalidationTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        self.acme = Client.objects.create(Client_name="Acme", created_by="test")
+        self.project = Project.objects.create(
+            name="Portal", client=self.acme, type="client", status="active", created_by="test",
+        )
+        self.member = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+
+    def ids(self, url, params=None):
+        return [row["id"] for row in self.client.get(url, params).json()["results"]]
+
+    def test_client_rename_reaches_project_listings(self):
+        url = reverse("project-list")
+        self.assertEqual(self.ids(url, {"client": "acme"}), [self.project.pk])
+        expanded = self.client.get(url, {"expand": "client"}).json()["results"]
+        self.assertEqual(expanded[0]["client"]["Client_name"], "Acme")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.acme.Client_name = "Initech"
+            self.acme.save()
+        self.assertEqual(self.ids(url, {"client": "acme"}), [])
+        expanded = self.client.get(url, {"expand": "client"}).json()["results"]
+        self.assertEqual(expanded[0]["client"]["Client_name"], "Initech")
+
+    def test_refresh_engagement_invalidates_members(self):
+        url = reverse("member-detail", args=[self.member.pk])
+        self.assertEqual(self.client.get(url).json()["active_assignment_count"], 0)
+        # bulk_create sends no signals; the recount is what moves the counter
+        MemberAssigned.objects.bulk_create([MemberAssigned(project=self.project, member=self.member, created_by="test")])
+        with self.captureOnCommitCallbacks(execute=True):
+            Member.objects.refresh_engagement()
+        self.assertEqual(self.client.get(url).json()["active_assignment_count"], 1)
+
+    def test_each_import_batch_invalidates_on_commit(self):
+        from .importer import ClientImporter
+
+        url = reverse("client-list")
+        self.assertEqual(self.ids(url), [self.acme.pk])
+        importer = ClientImporter("importer", batch_size=1)
+        rows = iter([(2, {"name": "Globex", "status": "active"}), (3, {"name": "Acme", "status": "hot"})])
+        with self.captureOnCommitCallbacks(execute=True):
+            next(importer.run(rows))
+        self.assertEqual(len(self.ids(url)), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            next(importer.run(rows))
+        self.assertEqual(self.client.get(reverse("client-detail", args=[self.acme.pk])).json()["status"], "hot")
+
+
+class ImporterTests(TestCase):
+    def setUp(self):
+        self.globex = Client.objects.create(Client_name="Globex", status="active", created_by="test")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def run_import(self, kind, name, content, *args):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        out = io.StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("import_pims", kind, path, *args, stdout=out, no_color=True)
+        return out.getvalue()
+
+    def test_clients_csv(self):
+        out = self.run_import("clients", "clients.csv", (
+            "name,status\n"
+            "Acme Corp,hot\n"
+            " globex ,inactive\n"
+            "Initech,frozen\n"
+            ",active\n"
+        ))
+        self.assertIn("clients: 1 created, 1 updated, 2 rejected", out)
+        self.assertIn("line 4: status:", out)
+        self.globex.refresh_from_db()
+        self.assertEqual(self.globex.status, "inactive")
+        self.assertEqual(Client.objects.get(Client_name="Acme Corp").created_by, "import")
+        self.assertEqual(search("acme")[0]["title"], "Acme Corp")
+
+    def test_members_ndjson(self):
+        Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+        out = self.run_import("members", "members.ndjson", "\n".join([
+            '{"name": "Priya Sharma", "role": "Lead"}',
+            '{"name": "Arjun Rao", "role": "QA"}',
+            '{"name": "No Role"}',
+            'not json',
+            '["a list"]',
+        ]))
+        self.assertIn("members: 1 created, 1 updated, 3 rejected", out)
+        self.assertEqual(Member.objects.get(name="Priya Sharma").role, "Lead")
+
+    def test_projects_and_assignments(self):
+        out = self.run_import("projects", "projects.csv", (
+            "name,client,type,status\n"
+            "Portal,Globex,client,active\n"
+            "Portal,Nobody,client,active\n"
+            "Wiki,globex,internal,dead\n"
+        ))
+        self.assertIn("projects: 2 created, 0 updated, 1 rejected", out)
+        out = self.run_import("projects", "update.csv", "name,client,type,status\nWiki,Globex,internal,hot\n")
+        self.assertIn("projects: 0 created, 1 updated, 0 rejected", out)
+
+        Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+        out = self.run_import("assignments", "assignments.csv", (
+            "member,project,client,is_active\n"
+            "Priya Sharma,Portal,,yes\n"
+            "Priya Sharma,Wiki,Globex,yes\n"
+            "Priya Sharma,Wiki,Globex,no\n"
+            "Nobody,Portal,,yes\n"
+        ))
+        self.assertIn("assignments: 2 created, 0 updated, 1 rejected", out)
+        member = Member.objects.get()
+        # The later Wiki row wins inside a batch, leaving one engaged assignment
+        self.assertEqual(member.active_assignment_count, 1)
+        self.assertEqual(get_dashboard_stats(), compute_dashboard_stats())
+
+    def test_keys_created_in_one_batch_update_in_the_next(self):
+        content = "name,status\nAcme,active\nInitech,active\nAcme,hot\n"
+        self.assertIn("1 created, 0 updated", self.run_import("clients", "a.csv", "name,status\nZeta,active\n"))
+        self.assertIn("2 created, 1 updated", self.run_import("clients", "b.csv", content, "--batch-size", "2"))
+        features = type(connection.features)
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", new_callable=mock.PropertyMock) as can:
+            can.return_value = False
+            content = "name,status\nUmbrella,active\nHooli,active\nUmbrella,hot\n"
+            self.assertIn("2 created, 1 updated", self.run_import("clients", "c.csv", content, "--batch-size", "2"))
+        self.assertEqual(Client.objects.get(Client_name="Umbrella").status, "hot")
+        self.assertEqual(Client.objects.get(Client_name="Acme").status, "hot")
+        self.assertEqual(Client.objects.count(), 6)
+
+    def test_only_imported_rows_are_reindexed(self):
+        # Written without signals, so never indexed; a full rebuild would pick it up
+        Client.objects.bulk_create([Client(Client_name="Hidden Co", created_by="test")])
+        self.run_import("clients", "clients.csv", "name,status\nGlobex,hot\nAcme,active\n")
+        self.assertEqual([hit["title"] for hit in search("globex")], ["Globex"])
+        self.assertEqual([hit["title"] for hit in search("acme")], ["Acme"])
+        self.assertEqual(search("hidden"), [])
+
+    def test_overlapping_assignments_are_rejected(self):
+        project = Project.objects.create(name="Portal", client=self.globex, type="client", created_by="test")
+        member = Member.objects.create(name="Priya Sharma", role="Developer", created_by="test")
+        existing = MemberAssigned.objects.create(
+            project=project, member=member, created_by="test",
+            assigned_from=datetime.date(2025, 3, 1), assigned_to=datetime.date(2025, 3, 31),
+        )
+        out = self.run_import("assignments", "assignments.csv", (
+            "member,project,assigned_from,assigned_to\n"
+            "Priya Sharma,Portal,2025-03-15,2025-04-15\n"
+        ))
+        self.assertIn("0 created, 1 updated, 0 rejected", out)
+        MemberAssigned.objects.create(
+            project=project, member=member, created_by="test",
+            assigned_from=datetime.date(2025, 6, 1), assigned_to=datetime.date(2025, 6, 30),
+        )
+        # The oldest assignment of the pair is updated; moving it onto June overlaps the other
+        out = self.run_import("assignments", "again.csv", (
+            "member,project,assigned_from,assigned_to\n"
+            "Priya Sharma,Portal,2025-06-10,2025-07-10\n"
+        ))
+        self.assertIn("0 created, 0 updated, 1 rejected", out)
+        self.assertIn("Overlaps assignment", out)
+        existing.refresh_from_db()
+        self.assertEqual(existing.assigned_from, datetime.date(2025, 3, 15))
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        caches[settings.API_CACHE_ALIAS].clear()
+        self.acme = Client.objects.create(Client_name="Acme", created_by="test")
+        self.project = Project.objects.create(name="Portal", client=self.acme, type="client", created_by="test")
+        self.team = Team.objects.create(team_type="Platform", created_by="test")
+        self.project.teams_assigned.add(self.team)
+        self.list_url = reverse("project-list")
+
+    def test_fields_trims_list_and_detail_output(self):
+        rows = self.client.get(self.list_url, {"fields": "name,status"}).json()["results"]
+        self.assertEqual(rows, [{"id": self.project.pk, "name": "Portal", "status": self.project.status}])
+        detail = self.client.get(reverse("project-detail", args=[self.project.pk]), {"fields": "client"}).json()
+        self.assertEqual(detail, {"id": self.project.pk, "client": self.acme.pk})
+
+    def test_expand_inlines_related_objects(self):
+        row = self.client.get(self.list_url, {"expand": "client,teams_assigned"}).json()["results"][0]
+        self.assertEqual(row["client"]["Client_name"], "Acme")
+        self.assertEqual([team["team_type"] for team in row["teams_assigned"]], ["Platform"])
+        # Expansions outside ?fields= are dropped with the field
+        row = self.client.get(self.list_url, {"fields": "name", "expand": "client"}).json()["results"][0]
+        self.assertEqual(row, {"id": self.project.pk, "name": "Portal"})
+        row = self.client.get(self.list_url, {"fields": "client", "expand": "client"}).json()["results"][0]
+        self.assertEqual(row["client"]["id"], self.acme.pk)
+
+    def test_unknown_names_are_a_400(self):
+        response = self.client.get(self.list_url, {"fields": "name,secret"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"fields": ["Unknown field(s): secret."]})
+        response = self.client.get(self.list_url, {"expand": "status"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"expand": ["Cannot expand: status."]})
+
+
+class FastListParityTests(TestCase):
+    def setUp(self):
+        acme = Client.objects.create(Client_name="Acme", status="hot", created_by="test")
+        members = [Member.objects.create(name=f"Member {n}", role="Developer", created_by="test") for n in range(3)]
+        teams = [Team.objects.create(team_type=f"Team {n}", created_by="test") for n in range(3)]
+        for n in range(2):
+            project = Project.objects.create(
+                name=f"Project {n}", client=acme, type="client", status="active",
+                start_date=datetime.date(2024, 1, n + 1), created_by="test",
+            )
+            # Link rows are written in the reverse of pk order
+            project.teams_assigned.add(*reversed(teams))
+            ProjectCredential.objects.create(project=project, key="db", value="secret", created_by="test")
+            ProjectActivity.objects.create(
+                project=project, status="started", activity_from=datetime.date(2024, 2, 1), created_by="test",
+            )
+            MemberAssigned.objects.create(project=project, member=members[n], created_by="test")
+        for team in teams:
+            team.members.add(*reversed(members))
+
+    def test_every_viewset_matches_the_serializer_output(self):
+        from .fastpath import FastListPlan
+        from .urls import router
+
+        for prefix, viewset, basename in router.registry:
+            with self.subTest(prefix):
+                url = reverse(f"{basename}-list")
+                caches[settings.API_CACHE_ALIAS].clear()
+                fast = self.client.get(url).json()
+                caches[settings.API_CACHE_ALIAS].clear()
+                with mock.patch.object(viewset, "fast_list", False):
+                    slow = self.client.get(url).json()
+                self.assertTrue(fast["results"])
+                self.assertEqual(fast, slow)
+                for row in fast["results"]:
+                    for ids in (value for value in row.values() if isinstance(value, list)):
+                        self.assertEqual(ids, sorted(ids))
+                self.assertIsNotNone(FastListPlan.for_serializer(viewset.serializer_class()))
+
+
+class StatelessAuthCheckTests(TestCase):
+    def test_revocations_need_a_shared_cache(self):
+        from .checks import check_revocation_cache, check_stateless_auth_cache
+
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        shared = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://x"}}
+        with override_settings(JWT_STATELESS_AUTH=False, CACHES=locmem):
+            self.assertEqual(check_stateless_auth_cache(None), [])
+            # Revocation still needs the shared cache; --deploy reports it
+            self.assertEqual([error.id for error in check_revocation_cache(None)], ["core.E001"])
+        with override_settings(JWT_STATELESS_AUTH=True, CACHES=locmem):
+            self.assertEqual([error.id for error in check_stateless_auth_cache(None)], ["core.E001"])
+            self.assertEqual(check_revocation_cache(None), [])
+        with override_settings(JWT_STATELESS_AUTH=True, CACHES=shared):
+            self.assertEqual(check_stateless_auth_cache(None), [])
+        with override_settings(JWT_STATELESS_AUTH=False, CACHES=shared):
+            self.assertEqual(check_revocation_cache(None), [])
@@ -9,6 +9,7 @@ from .views import (
     ClientViewSet, ProjectViewSet, ProjectCredentialViewSet, TeamViewSet,
     MemberViewSet, MemberAssignedViewSet, ProjectActivityViewSet,
     CustomTokenObtainPairView,  # ✅ Add this
+    SearchView, CacheStatsView, ChangesView, LogoutView,
 )
 
 router = DefaultRouter()
@@ -21,7 +22,13 @@ router.register(r'assigned-members', MemberAssignedViewSet)
 router.register(r'activities', ProjectActivityViewSet)
 
 urlpatterns = router.urls + [
+    path('search/', SearchView.as_view(), name='search'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache_stats'),
+    path('changes/', ChangesView.as_view(
+        resources={prefix: viewset for prefix, viewset, _ in router.registry},
+    ), name='changes'),
     path('login/', CustomTokenObtainPairView.as_view(), name='custom_token_obtain'),
+    path('logout/', LogoutView.as_view(), name='logout'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'), 
     # path('token/verify/', TokenVerifyView.as_view(), name='token_verify'),            # optional
 ]
@@ -1,18 +1,51 @@
+import copy
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.views.decorators.http import condition
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import user_passes_test
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from .serializers import CustomTokenSerializer
 from .models import (
     Client, Project, ProjectCredential, Team,
-    Member, MemberAssigned, ProjectActivity
+    Member, MemberAssigned, ProjectActivity, DashboardStat
 )
 from .serializers import (
-    ClientSerializer, ProjectSerializer, ProjectCredentialSerializer, TeamSerializer,
-    MemberSerializer, MemberAssignedSerializer, ProjectActivitySerializer
+    ClientSerializer, ClientSummarySerializer, ProjectSerializer, ProjectCredentialSerializer,
+    TeamSerializer, MemberSerializer, MemberAssignedSerializer, ProjectActivitySerializer,
+    ProjectDossierSerializer,
 )
-from .permissions import ReadOnlyOrAuthenticated
+from .authentication import revoke_token
+from .availability import member_availability, overlapping_assignments
+from .caching import CachedResponseMixin, cache_stats
+from .changes import feed_page
+from .conditional import ConditionalGetMixin, validators, version_etag, user_part
+from .exports import EXPORT_FORMATS, PassthroughRenderer, export_lines, iter_project_rows
+from .fastpath import FastListMixin
+from .filters import ProjectFilter
+from .history import empty_history, project_histories
+from .mixins import BulkWriteMixin, SparseFieldsMixin
+from .overlaps import AssignmentOverlap, check_assignment, check_assignments, lock_members
+from .pagination import keyset_paginate, clamp_page_size
+from .permissions import IsManagerOrReadOnly, ReadOnlyOrAuthenticated
+from .search import search, matching_ids, query_terms
+from .stats import get_dashboard_stats, refresh_engagement, bump, client_key, project_key
 
 
 # ======================================================
@@ -25,12 +58,48 @@ def admin_required(view_func):
 # ======================================================
 # 🚀 API ViewSets
 # ======================================================
+def query_date(request, name, default):
+    """?name=YYYY-MM-DD as a date, ``default`` when absent; 400 when malformed."""
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: ["Use YYYY-MM-DD."]})
+    return parsed
+
+
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenSerializer
 
 
-class BaseAutoUserViewSet(viewsets.ModelViewSet):
-    permission_classes = [ReadOnlyOrAuthenticated]
+class LogoutView(APIView):
+    """Revoke the access token of this request and, when posted, its refresh token."""
+
+    def post(self, request):
+        revoke_token(request.auth)
+        if request.data.get("refresh"):
+            try:
+                revoke_token(RefreshToken(request.data["refresh"]))
+            except TokenError:
+                raise ValidationError({"refresh": ["Invalid or expired token."]})
+        return Response(status=204)
+
+
+class BaseAutoUserViewSet(
+    CachedResponseMixin, ConditionalGetMixin, SparseFieldsMixin, FastListMixin, viewsets.ModelViewSet
+):
+    permission_classes = [IsManagerOrReadOnly]
+
+    def get_conditional_dependencies(self):
+        # The ETag covers the same models as the cached response.
+        return self.get_cache_dependencies()
+
+    def get_cache_dependencies(self):
+        return (*super().get_cache_dependencies(), *self.get_expanded_models())
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user.username)
@@ -38,15 +107,110 @@ class BaseAutoUserViewSet(viewsets.ModelViewSet):
     def perform_update(self, serializer):
         serializer.save(updated_by=self.request.user.username)
 
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        """Rows created, updated or deleted since ?after= (the previous response's "next") or ?since=."""
+        results, cursor, has_more = feed_page(request, {"feed": (self.queryset.model, self.serializer_class)})
+        return Response({**results["feed"], "next": cursor, "has_more": has_more})
+
 
 class ClientViewSet(BaseAutoUserViewSet):
     queryset = Client.objects.all()
     serializer_class = ClientSerializer
 
+    def _with_projects(self):
+        return self.request.query_params.get("with_projects") in ("1", "true")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve") and self._with_projects():
+            queryset = queryset.with_project_summary()
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action in ("list", "retrieve") and self._with_projects():
+            return ClientSummarySerializer
+        return super().get_serializer_class()
+
+    def get_cache_dependencies(self):
+        return (*super().get_cache_dependencies(), *((Project,) if self._with_projects() else ()))
+
 
 class ProjectViewSet(BaseAutoUserViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = ProjectFilter
+    # ?client= and ?q= match on client names
+    cache_dependencies = (Client,)
+    DOSSIER_DEPENDENCIES = (Client, ProjectCredential, MemberAssigned, Member, Team, ProjectActivity)
+    HISTORY_ACTIONS = ("history", "histories")
+
+    def get_queryset(self):
+        if self.action == "dossier":
+            return Project.objects.for_dossier()
+        if self.action in self.HISTORY_ACTIONS:
+            return Project.objects.all()
+        return super().get_queryset()
+
+    def get_serializer_class(self):
+        if self.action == "dossier":
+            return ProjectDossierSerializer
+        return super().get_serializer_class()
+
+    def get_cache_dependencies(self):
+        if self.action == "dossier":
+            return self.DOSSIER_DEPENDENCIES
+        if self.action in self.HISTORY_ACTIONS:
+            return (ProjectActivity,)
+        return super().get_cache_dependencies()
+
+    @action(detail=True, methods=["get"])
+    def dossier(self, request, pk=None):
+        """The project with its client, credentials, assignments, teams and activity logs."""
+        def build(request):
+            return Response(self.get_serializer(self.get_object()).data)
+        return self._cached(build, request)
+
+    def _history_options(self, request):
+        as_of = query_date(request, "as_of", timezone.localdate())
+        return as_of, request.query_params.get("timeline") not in ("0", "false")
+
+    @action(detail=True, methods=["get"])
+    def history(self, request, pk=None):
+        """Status timeline and days spent in each status, from the activity log (?as_of=, ?timeline=false)."""
+        def build(request):
+            project = self.get_object()
+            as_of, timeline = self._history_options(request)
+            history = project_histories([project.pk], as_of, timeline).get(project.pk) or empty_history(timeline)
+            return Response({"project": project.pk, "name": project.name, "as_of": as_of, **history})
+        return self._cached(build, request)
+
+    @action(detail=False, methods=["get"], url_path="history")
+    def histories(self, request):
+        """Status history for a page of (filtered) projects, from one query for the whole page."""
+        def build(request):
+            as_of, timeline = self._history_options(request)
+            queryset = self.filter_queryset(self.get_queryset()).values("id", "name", "updated_at")
+            page = self.paginate_queryset(queryset)
+            histories = project_histories([row["id"] for row in page], as_of, timeline)
+            return self.get_paginated_response([
+                {
+                    "project": row["id"], "name": row["name"], "as_of": as_of,
+                    **(histories.get(row["id"]) or empty_history(timeline)),
+                }
+                for row in page
+            ])
+        return self._cached(build, request)
+
+    @action(detail=False, methods=["get"], url_path=r"export/(?P<fmt>csv|ndjson)",
+            renderer_classes=[PassthroughRenderer])
+    def export(self, request, fmt):
+        """Stream every (filtered) project with client, teams, active members and latest activity."""
+        rows = iter_project_rows(self.filter_queryset(self.get_queryset()))
+        response = StreamingHttpResponse(export_lines(fmt, rows), content_type=EXPORT_FORMATS[fmt])
+        response["Content-Disposition"] = f'attachment; filename="projects.{fmt}"'
+        return response
 
 
 class ProjectCredentialViewSet(BaseAutoUserViewSet):
@@ -62,118 +226,359 @@ class TeamViewSet(BaseAutoUserViewSet):
 class MemberViewSet(BaseAutoUserViewSet):
     queryset = Member.objects.all()
     serializer_class = MemberSerializer
-
-
-class MemberAssignedViewSet(BaseAutoUserViewSet):
+    AVAILABILITY_ACTIONS = ("availability", "availabilities")
+
+    def get_queryset(self):
+        if self.action in self.AVAILABILITY_ACTIONS:
+            return Member.objects.all()
+        return super().get_queryset()
+
+    def get_cache_dependencies(self):
+        if self.action in self.AVAILABILITY_ACTIONS:
+            return (MemberAssigned, Project)
+        return super().get_cache_dependencies()
+
+    def _availability_window(self, request):
+        start = query_date(request, "from", timezone.localdate())
+        end = query_date(request, "to", start + timedelta(days=settings.AVAILABILITY_DEFAULT_DAYS - 1))
+        if end < start:
+            raise ValidationError({"to": ["Must not be before from."]})
+        if (end - start).days >= settings.AVAILABILITY_MAX_DAYS:
+            raise ValidationError({"to": [f"The window is limited to {settings.AVAILABILITY_MAX_DAYS} days."]})
+        return start, end
+
+    def _availability_item(self, member, availability, start, end):
+        return {"member": member["id"], "name": member["name"], "role": member["role"],
+                "from": start, "to": end, **availability}
+
+    @action(detail=True, methods=["get"])
+    def availability(self, request, pk=None):
+        """Free and busy periods and concurrent assignments in ?from=..&to= (default: the next 30 days)."""
+        def build(request):
+            start, end = self._availability_window(request)
+            member = self.get_object()
+            row = {"id": member.pk, "name": member.name, "role": member.role}
+            availability = member_availability([member.pk], start, end)[member.pk]
+            return Response(self._availability_item(row, availability, start, end))
+        return self._cached(build, request)
+
+    @action(detail=False, methods=["get"], url_path="availability")
+    def availabilities(self, request):
+        """
+        Availability for a page of members (?page_size= up to API_MAX_PAGE_SIZE),
+        narrowed by ?ids=1,2, ?role=, ?q= and ?available=true|false (free on
+        every day of the window, or not).
+        """
+        def build(request):
+            start, end = self._availability_window(request)
+            members = self.get_queryset()
+            params = request.query_params
+            if params.get("ids"):
+                try:
+                    members = members.filter(pk__in=[int(pk) for pk in params["ids"].split(",") if pk.strip()])
+                except ValueError:
+                    raise ValidationError({"ids": ["Ids must be integers."]})
+            if params.get("role"):
+                members = members.filter(role__iexact=params["role"])
+            if query_terms(params.get("q", "")):
+                members = members.filter(id__in=matching_ids("member", params["q"]))
+            if params.get("available") in ("true", "1", "false", "0"):
+                busy = Exists(overlapping_assignments(start, end).filter(member=OuterRef("pk")))
+                members = members.exclude(busy) if params["available"] in ("true", "1") else members.filter(busy)
+
+            page = self.paginate_queryset(members.values("id", "name", "role", "updated_at"))
+            availability = member_availability([row["id"] for row in page], start, end)
+            return self.get_paginated_response([
+                self._availability_item(row, availability[row["id"]], start, end) for row in page
+            ])
+        return self._cached(build, request)
+
+
+class MemberAssignedViewSet(BulkWriteMixin, BaseAutoUserViewSet):
     queryset = MemberAssigned.objects.all()
     serializer_class = MemberAssignedSerializer
 
+    def _save_checked(self, serializer, **extra):
+        # Lock the member, then check and save in the same transaction.
+        instance = copy.copy(serializer.instance) if serializer.instance else MemberAssigned()
+        for field, value in serializer.validated_data.items():
+            setattr(instance, field, value)
+        with transaction.atomic():
+            lock_members([instance.member_id])
+            try:
+                check_assignment(instance)
+            except AssignmentOverlap as exc:
+                raise ValidationError({"non_field_errors": list(exc.errors.values())})
+            serializer.save(**extra)
+
+    def perform_create(self, serializer):
+        self._save_checked(serializer, created_by=self.request.user.username)
+
+    def perform_update(self, serializer):
+        self._save_checked(serializer, updated_by=self.request.user.username)
+
+    def before_bulk_write(self, objs):
+        lock_members(obj.member_id for obj in objs)
+        try:
+            check_assignments(objs)
+        except AssignmentOverlap as exc:
+            return [
+                {"non_field_errors": [exc.errors[index]]} if index in exc.errors else None
+                for index in range(len(objs))
+            ]
+
+    def after_bulk_write(self, objs, previous=()):
+        member_ids = {obj.member_id for obj in objs} | {obj.member_id for obj in previous}
+        if member_ids:
+            refresh_engagement(Member.objects.filter(pk__in=member_ids))
 
-class ProjectActivityViewSet(BaseAutoUserViewSet):
+
+class ProjectActivityViewSet(BulkWriteMixin, BaseAutoUserViewSet):
     queryset = ProjectActivity.objects.all()
     serializer_class = ProjectActivitySerializer
 
+    def after_bulk_write(self, objs, previous=()):
+        if not previous:
+            bump({"activities.total": len(objs)})
+
+
+class SearchView(APIView):
+    """Ranked prefix search over clients, projects and members: ?q=&types=client,project&limit="""
+    permission_classes = [ReadOnlyOrAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get("q", "")
+        kinds = [k for k in request.query_params.get("types", "").split(",") if k] or None
+        limit = clamp_page_size(request.query_params.get("limit"), default=20, maximum=100)
+        return Response({"query": query, "results": search(query, kinds, limit)})
+
+
+CACHED_VIEWSETS = (
+    ClientViewSet, ProjectViewSet, ProjectCredentialViewSet, TeamViewSet,
+    MemberViewSet, MemberAssignedViewSet, ProjectActivityViewSet,
+)
+
+
+class ChangesView(APIView):
+    """
+    Changes feed of every resource in one call (?resources=clients,projects
+    narrows it); ``resources`` maps URL prefixes to their ViewSets.
+    """
+    permission_classes = [ReadOnlyOrAuthenticated]
+    resources = {}
+
+    def get(self, request):
+        names = [name.strip() for name in request.query_params.get("resources", "").split(",") if name.strip()]
+        unknown = [name for name in names if name not in self.resources]
+        if unknown:
+            raise ValidationError({"resources": [f"Unknown resource(s): {', '.join(unknown)}."]})
+        feeds = {
+            name: (viewset.queryset.model, viewset.serializer_class)
+            for name, viewset in self.resources.items() if not names or name in names
+        }
+        results, cursor, has_more = feed_page(request, feeds)
+        return Response({"resources": results, "next": cursor, "has_more": has_more})
+
+
+class CacheStatsView(APIView):
+    """Hit/miss counters of the API response cache, per endpoint (staff only)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(cache_stats([viewset.cache_endpoint() for viewset in CACHED_VIEWSETS]))
+
 
 # ======================================================
 # 🎨 Dashboard + Lists
 # ======================================================
-def dashboard(request):
-    clients = Client.objects.all()
-    projects = Project.objects.all()
-    members = Member.objects.all()
+def _dashboard_validator_querysets():
+    # Every create/delete that shows on the dashboard also moves a snapshot
+    # counter, so the newest updated_at per table is enough (no COUNTs).
+    return [
+        DashboardStat.objects.all(),
+        MemberAssigned.objects.all(),
+        ProjectActivity.objects.all(),
+        Project.objects.all(),
+        Client.objects.all(),
+        Member.objects.all(),
+    ]
+
+
+def _dashboard_etag(request):
+    return validators(user_part(request), latest=_dashboard_validator_querysets())[0]
+
+
+def _hot_assignments_query():
+    # One row past the limit tells the template the list was cut short.
+    return MemberAssigned.objects.filter(
+        is_active=True,
+        project__status="hot"
+    ).order_by("-updated_at", "-id").values(
+        "id", "member__name", "project__name", "project__status", "project__client__Client_name"
+    )[:settings.DASHBOARD_HOT_ASSIGNMENTS_LIMIT + 1]
 
-    clients_status = {label: clients.filter(status=key).count() for key, label in Client.STATUS_CHOICES}
-    projects_status = {label: projects.filter(status=key).count() for key, label in Project.STATUS_CHOICES}
 
-    # ✅ Active/Hot members (currently working)
-    active_hot_members = Member.objects.filter(
-        memberassigned__project__status__in=["active", "hot"],
-        memberassigned__is_active=True
-    ).distinct()
+def _recent_activities_query():
+    return ProjectActivity.objects.select_related(
+        "project", "project__client"
+    ).order_by("-updated_at")[:10]
 
-    current_members = active_hot_members.count()
-    past_members = members.exclude(id__in=active_hot_members).count()
 
-    # ✅ Only show HOT projects in MemberAssigned
-    hot_assignments = MemberAssigned.objects.select_related("member", "project__client").filter(
-        is_active=True,
-        project__status="hot"
-    )
+def _dashboard_context(stats, hot_assignments, recent_activities, user):
+    clients_status = {label: stats.get(client_key(key), 0) for key, label in Client.STATUS_CHOICES}
+    projects_status = {label: stats.get(project_key(key), 0) for key, label in Project.STATUS_CHOICES}
 
+    # ✅ Active/Hot members (currently working)
+    current_members = stats.get("members.current", 0)
+    past_members = stats.get("members.total", 0) - current_members
+
+    # ✅ Only show HOT projects in MemberAssigned (most recent first, capped)
+    limit = settings.DASHBOARD_HOT_ASSIGNMENTS_LIMIT
     member_projects = []
-    for assign in hot_assignments:
-        project_name = assign.project.name if assign.project else "N/A"
-        project_status = assign.project.status.upper() if assign.project and assign.project.status else "N/A"
-        client_name = assign.project.client.Client_name if assign.project and assign.project.client else "N/A"
+    for assign in hot_assignments[:limit]:
+        project_name = assign["project__name"] or "N/A"
+        project_status = assign["project__status"].upper() if assign["project__status"] else "N/A"
+        client_name = assign["project__client__Client_name"] or "N/A"
 
         member_projects.append({
-            "id": assign.id,
-            "member": assign.member.name if assign.member else "N/A",
+            "id": assign["id"],
+            "member": assign["member__name"] or "N/A",
             "projects": [f"{project_name} ({project_status})"],
             "clients": [client_name],
         })
 
-    recent_activities = ProjectActivity.objects.select_related(
-        "project", "project__client"
-    ).order_by("-updated_at")[:10]
-
-    context = {
-        "clients_count": clients.count(),
+    return {
+        "clients_count": stats.get("clients.total", 0),
         "clients_status": clients_status,
-        "projects_count": projects.count(),
+        "projects_count": stats.get("projects.total", 0),
         "projects": projects_status,
         "current_members": current_members,
         "past_members": past_members,
         "member_projects": member_projects,  # Already filtered to only HOT projects
+        "member_projects_truncated": len(hot_assignments) > limit,
         "recent_activities": recent_activities,
-        "is_admin": request.user.is_authenticated and request.user.is_staff
+        "is_admin": user.is_authenticated and user.is_staff
     }
+
+
+@condition(etag_func=_dashboard_etag)
+def dashboard(request):
+    context = _dashboard_context(
+        get_dashboard_stats(),
+        list(_hot_assignments_query()),
+        _recent_activities_query(),
+        request.user,
+    )
     return render(request, "index.html", context)
 
 
-def clients_list(request):
-    status = request.GET.get("status")
+def _paginated_context(request, queryset):
+    """Keyset-paginate a list page and build the next/previous links for the template."""
+    page_size = clamp_page_size(request.GET.get("page_size"))
+    try:
+        page = keyset_paginate(
+            queryset, page_size,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+        )
+    except ValueError:
+        page = keyset_paginate(queryset, page_size)
+
+    def page_url(key, cursor):
+        params = request.GET.copy()
+        params.pop("after", None)
+        params.pop("before", None)
+        params[key] = cursor
+        return f"?{params.urlencode()}"
+
+    return {
+        "page": page,
+        "page_size": page_size,
+        "page_size_choices": settings.LIST_PAGE_SIZE_CHOICES,
+        "next_url": page_url("after", page.next_cursor) if page.next_cursor else None,
+        "previous_url": page_url("before", page.previous_cursor) if page.previous_cursor else None,
+    }
+
+
+def _filtered_clients(request):
     clients = Client.objects.all()
+    status = request.GET.get("status")
+    query = request.GET.get("q", "").strip()
     if status:
         clients = clients.filter(status=status)
+    if query:
+        clients = clients.filter(Client_name__icontains=query)
+    return clients
+
+
+def _filtered_projects(request):
+    projects = Project.objects.all()
+    status = request.GET.get("status")
+    query = request.GET.get("q", "").strip()
+    if status:
+        projects = projects.filter(status=status)
+    if query:
+        projects = projects.filter(
+            Q(name__icontains=query) |
+            Q(client__Client_name__icontains=query) |
+            Q(hosting_provider__icontains=query)
+        )
+    return projects
+
+
+def _filtered_members(request):
+    members = Member.objects.all()
+    status = request.GET.get("status")
+    query = request.GET.get("q", "").strip()
+    if status == "current":
+        members = members.current()
+    elif status == "past":
+        members = members.past()
+    if query:
+        members = members.filter(Q(name__icontains=query) | Q(role__icontains=query))
+    return members
+
+
+def _list_etag(*models):
+    def etag_func(request, *args, **kwargs):
+        return version_etag(request.get_full_path(), user_part(request), models=models)
+    return etag_func
+
+
+@condition(etag_func=_list_etag(Client, Project))
+def clients_list(request):
+    clients = _filtered_clients(request).with_project_summary()
+    context = _paginated_context(request, clients)
     return render(request, "clients_list.html", {
-        "clients": clients,
-        "status": status,
+        **context,
+        "clients": context["page"],
+        "status": request.GET.get("status"),
+        "q": request.GET.get("q", "").strip(),
         "is_admin": request.user.is_authenticated and request.user.is_staff
     })
 
 
+@condition(etag_func=_list_etag(Project, Client, ProjectCredential))
 def projects_list(request):
-    status = request.GET.get("status")
-    projects = Project.objects.all()
-    if status:
-        projects = projects.filter(status=status)
+    projects = _filtered_projects(request).prefetch_related("credentials")
+    context = _paginated_context(request, projects)
     return render(request, "projects_list.html", {
-        "projects": projects,
-        "status": status,
+        **context,
+        "projects": context["page"],
+        "status": request.GET.get("status"),
+        "q": request.GET.get("q", "").strip(),
         "is_admin": request.user.is_authenticated and request.user.is_staff
     })
 
 
+@condition(etag_func=_list_etag(Member))
 def members_list(request):
-    status = request.GET.get("status")
-    members = Member.objects.all()
-
-    if status == "current":
-        members = Member.objects.filter(
-            memberassigned__project__status__in=["active", "hot"],
-            memberassigned__is_active=True
-        ).distinct()
-    elif status == "past":
-        active_hot_members = Member.objects.filter(
-            memberassigned__project__status__in=["active", "hot"],
-            memberassigned__is_active=True
-        ).distinct()
-        members = Member.objects.exclude(id__in=active_hot_members)
-
+    context = _paginated_context(request, _filtered_members(request))
     return render(request, "members_list.html", {
-        "members": members,
-        "status": status,
+        **context,
+        "members": context["page"],
+        "status": request.GET.get("status"),
+        "q": request.GET.get("q", "").strip(),
         "is_admin": request.user.is_authenticated and request.user.is_staff
     })
 
@@ -197,30 +602,24 @@ def add_client(request):
 def add_project(request):
     if request.method == "POST":
         client = get_object_or_404(Client, id=request.POST["client"])
-        project = Project.objects.create(
-            name=request.POST["name"],
-            client=client,
-            type=request.POST["type"],
-            status=request.POST["status"],
-            start_date=request.POST.get("start_date") or None,
-            end_date=request.POST.get("end_date") or None,
-            hosting_provider=request.POST.get("hosting_provider"),
-            github_repo=request.POST.get("github_repo"),
-            live_url=request.POST.get("live_url"),
-            description=request.POST.get("description"),
-            created_by=request.user.username
-        )
-
-        keys = request.POST.getlist("credentials_key[]")
-        values = request.POST.getlist("credentials_value[]")
-        for k, v in zip(keys, values):
-            if k.strip() and v.strip():
-                ProjectCredential.objects.create(
-                    project=project,
-                    key=k.strip(),
-                    value=v.strip(),
-                    created_by=request.user.username
-                )
+        with transaction.atomic():
+            project = Project.objects.create(
+                name=request.POST["name"],
+                client=client,
+                type=request.POST["type"],
+                status=request.POST["status"],
+                start_date=request.POST.get("start_date") or None,
+                end_date=request.POST.get("end_date") or None,
+                hosting_provider=request.POST.get("hosting_provider"),
+                github_repo=request.POST.get("github_repo"),
+                live_url=request.POST.get("live_url"),
+                description=request.POST.get("description"),
+                created_by=request.user.username
+            )
+
+            keys = request.POST.getlist("credentials_key[]")
+            values = request.POST.getlist("credentials_value[]")
+            ProjectCredential.objects.sync(project, zip(keys, values), request.user.username)
 
         return redirect("projects_list")
     return render(request, "projects_add.html", {"clients": Client.objects.all()})
@@ -268,10 +667,14 @@ def add_member(request):
 
 @admin_required
 def add_member_assigned(request):
+    context = {
+        "members": Member.objects.all(),
+        "projects": Project.objects.filter(status="active")
+    }
     if request.method == "POST":
         member = get_object_or_404(Member, id=request.POST["member"])
         project = get_object_or_404(Project, id=request.POST["project"])
-        MemberAssigned.objects.create(
+        assignment = MemberAssigned(
             member=member,
             project=project,
             assigned_from=request.POST.get("assigned_from") or None,
@@ -279,11 +682,15 @@ def add_member_assigned(request):
             is_active="is_active" in request.POST,
             created_by=request.user.username
         )
+        try:
+            with transaction.atomic():
+                lock_members([member.pk])
+                check_assignment(assignment)
+                assignment.save()
+        except AssignmentOverlap as exc:
+            return render(request, "memberassigned_add.html", {**context, "error": str(exc)}, status=400)
         return redirect("members_list")
-    return render(request, "memberassigned_add.html", {
-        "members": Member.objects.all(),
-        "projects": Project.objects.filter(status="active")
-    })
+    return render(request, "memberassigned_add.html", context)
 
 
 @admin_required
@@ -344,19 +751,12 @@ def edit_project(request, pk):
         project.live_url = request.POST.get("live_url", project.live_url)
         project.description = request.POST.get("description", project.description)
         project.updated_by = request.user.username
-        project.save()
 
-        ProjectCredential.objects.filter(project=project).delete()
         keys = request.POST.getlist("credentials_key[]")
         values = request.POST.getlist("credentials_value[]")
-        for k, v in zip(keys, values):
-            if k.strip() and v.strip():
-                ProjectCredential.objects.create(
-                    project=project,
-                    key=k.strip(),
-                    value=v.strip(),
-                    created_by=request.user.username
-                )
+        with transaction.atomic():
+            project.save()
+            ProjectCredential.objects.sync(project, zip(keys, values), request.user.username)
 
         return redirect("projects_list")
 
@@ -401,6 +801,7 @@ def delete_member(request, pk):
 @admin_required
 def edit_member_assigned(request, pk):
     assignment = get_object_or_404(MemberAssigned, pk=pk)
+    error = None
     if request.method == "POST":
         assignment.member = get_object_or_404(Member, id=request.POST["member"])
         assignment.project = get_object_or_404(Project, id=request.POST["project"])
@@ -408,13 +809,21 @@ def edit_member_assigned(request, pk):
         assignment.assigned_to = request.POST.get("assigned_to") or assignment.assigned_to
         assignment.is_active = "is_active" in request.POST
         assignment.updated_by = request.user.username
-        assignment.save()
-        return redirect("dashboard")
+        try:
+            with transaction.atomic():
+                lock_members([assignment.member_id])
+                check_assignment(assignment)
+                assignment.save()
+        except AssignmentOverlap as exc:
+            error = str(exc)
+        else:
+            return redirect("dashboard")
     return render(request, "memberassigned_edit.html", {
         "assignment": assignment,
         "members": Member.objects.all(),
         "projects": Project.objects.all(),
-    })
+        "error": error,
+    }, status=400 if error else 200)
 
 
 @admin_required
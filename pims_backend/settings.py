@@ -45,11 +45,13 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
+    'django_filters',
     'core',
     'rest_framework_simplejwt',
 ]
 
 MIDDLEWARE = [
+    'core.profiling.RequestProfilingMiddleware',  # removes itself unless REQUEST_PROFILING is on
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -140,14 +142,91 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    'TOKEN_REFRESH_SERIALIZER': 'core.serializers.CustomTokenRefreshSerializer',
 }
 
+# Authenticate API requests from the JWT claims (core.authentication) instead
+# of loading the user row on every request. Either way token revocations live
+# in the default cache, so deployments need a shared CACHE_URL (core.E001)
+JWT_STATELESS_AUTH = env.bool('JWT_STATELESS_AUTH', default=False)
+# Seconds the user claims of tokens issued without them stay cached
+AUTH_CLAIMS_CACHE_SECONDS = env.int('AUTH_CLAIMS_CACHE_SECONDS', default=300)
+
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.ClaimsJWTAuthentication' if JWT_STATELESS_AUTH
+        else 'core.authentication.RevocableJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
-}
\ No newline at end of file
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.fastpath.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.KeysetCursorPagination',
+    'PAGE_SIZE': 50,
+}
+
+# Cache for /api/ responses. Local memory per process by default; point
+# API_CACHE_URL at a shared backend (e.g. rediscache://, pymemcache://) when
+# running several workers, or at filecache:///path for a single host.
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://pims-default'),
+    'api': env.cache_url('API_CACHE_URL', default='locmemcache://pims-api'),
+}
+API_CACHE_ALIAS = 'api'
+
+# Seconds a cached API response lives; ViewSets override with cache_timeout
+API_CACHE_TIMEOUT = env.int('API_CACHE_TIMEOUT', default=300)
+
+# Upper bound for ?page_size= on the API endpoints
+API_MAX_PAGE_SIZE = 500
+
+# Upper bound for list payloads sent to the /bulk/ endpoints
+API_BULK_MAX_ITEMS = 1000
+
+# Member availability windows (/api/members/availability/): default and maximum length in days
+AVAILABILITY_DEFAULT_DAYS = 30
+AVAILABILITY_MAX_DAYS = 366
+
+# Changes feeds (/api/<resource>/changes/, /api/changes/): rows written in the
+# last CHANGES_SETTLE_SECONDS are held back until transactions still open
+# around them have committed; delete tombstones are kept this many days.
+CHANGES_SETTLE_SECONDS = env.int('CHANGES_SETTLE_SECONDS', default=5)
+CHANGES_TOMBSTONE_RETENTION_DAYS = env.int('CHANGES_TOMBSTONE_RETENTION_DAYS', default=90)
+
+# Maximum number of HOT assignments rendered on the dashboard
+DASHBOARD_HOT_ASSIGNMENTS_LIMIT = 25
+
+# Server-side keyset pagination for the HTML list pages
+LIST_PAGE_SIZE = 25
+LIST_MAX_PAGE_SIZE = 100
+LIST_PAGE_SIZE_CHOICES = [10, 25, 50, 100]
+
+# Per-request profiling (core.profiling): Server-Timing header on every
+# response and a JSON line on the core.profiling logger for slow requests.
+REQUEST_PROFILING = env.bool('REQUEST_PROFILING', default=False)
+if REQUEST_PROFILING:
+    # Templates report their render time; without profiling they render unwrapped
+    TEMPLATES[0]['BACKEND'] = 'core.profiling.ProfiledDjangoTemplates'
+SLOW_REQUEST_MS = env.int('SLOW_REQUEST_MS', default=500)
+# Slowest statements included in a slow-request log line
+SLOW_REQUEST_LOGGED_QUERIES = 5
+# Same SQL this many times in one request is reported as a likely N+1
+REPEATED_QUERY_THRESHOLD = 5
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'slow_requests': {'class': 'logging.StreamHandler', 'formatter': 'message'},
+    },
+    'loggers': {
+        'core.profiling': {'handlers': ['slow_requests'], 'level': 'WARNING', 'propagate': False},
+    },
+}